@@ -40,32 +40,9 @@ class ConversationSwarm:
         self.summarizer_agent = summarizer_agent
         self.coordination = coordination
         
-    def run(self, task):
-        """
-        Execute a multi-phase conversation between agents to analyze a task.
-        
-        The conversation follows a structured approach:
-        1. Initial parallel analysis by all agents
-        2. Refinement phase where agents respond to each other's insights
-        3. Final synthesis by the summarizer agent
-        
-        Args:
-            task (str): The trading task or question to analyze
-            
-        Returns:
-            tuple: (final_solution, messages_dict) containing the synthesized
-                   decision and all conversation messages
-        """
-        
-        # Initialize message dictionary to track all agent communications
-        messages = {}
-        messages[self.summarizer_agent.name] = []
-        for agent in self.agents:
-            messages[agent.name] = []
-        
-        print(f"Starting {self.coordination} conversation with {len(self.agents)} agents...")
-        # Create a swarm with these agents
-        swarm = Swarm(
+    def _create_swarm(self):
+        """Create the swarm the agents debate in."""
+        return Swarm(
             self.agents,
             max_handoffs=10,
             max_iterations=10,
@@ -75,41 +52,24 @@ class ConversationSwarm:
             repetitive_handoff_min_unique_agents=5
         )
 
-        # Execute the swarm on a task
-        print("Phase 1: Swarm conversation between bull reseacher and bear reseacher...")
-        result = swarm(task)
-
-        # Access the final result
-        print(f"Status: {result.status}")
-        print(f"Node history: {[node.node_id for node in result.node_history]}")
-
-        bull_history, bear_history = None, None
-        for message in self.agents[0].messages[::-1]:
+    @staticmethod
+    def _last_text(agent):
+        """Return the text of an agent's last non-empty assistant message, or None."""
+        history = None
+        for message in agent.messages[::-1]:
             if message["role"] != "assistant" or len(message["content"]) == 0:
                 continue
             else:
                 print(message["content"])
                 for item in message["content"]:
                     if "text" in item:
-                        bull_history = item["text"]
+                        history = item["text"]
                 break
+        return history
 
-        for message in self.agents[1].messages[::-1]:
-            if message["role"] != "assistant" or len(message["content"]) == 0:
-                continue
-            else:
-                print(message["content"])
-                for item in message["content"]:
-                    if "text" in item:
-                        bear_history = item["text"]
-                        # bear_history = message["content"]["text"]
-                break
-        print("Phase 2: Final synthesis and decision...")
-        
-        # Prepare all messages for the summarizer
-        # all_messages = "\n\n".join(messages[self.summarizer_agent.name])
-        
-        summarizer_prompt = f"""
+    def _summarizer_prompt(self, task, bull_history, bear_history):
+        """Build the prompt asking the summarizer to synthesize the debate."""
+        return f"""
 Original Investment Analysis Task:
 <query>
 {task}
@@ -138,9 +98,71 @@ Create a comprehensive final investment plan that incorporates the best insights
 from the team while addressing any concerns or contradictions in their analyses.
 """
 
+    def _report_swarm_result(self, result):
+        """Print the swarm outcome and collect the bull and bear researchers' final positions."""
+        # Access the final result
+        print(f"Status: {result.status}")
+        print(f"Node history: {[node.node_id for node in result.node_history]}")
+
+        bull_history = self._last_text(self.agents[0])
+        bear_history = self._last_text(self.agents[1])
+        print("Phase 2: Final synthesis and decision...")
+        return bull_history, bear_history
+
+    def run(self, task):
+        """
+        Execute a multi-phase conversation between agents to analyze a task.
+        
+        The conversation follows a structured approach:
+        1. Initial parallel analysis by all agents
+        2. Refinement phase where agents respond to each other's insights
+        3. Final synthesis by the summarizer agent
+        
+        Args:
+            task (str): The trading task or question to analyze
+            
+        Returns:
+            tuple: (final_solution, bull_history, bear_history) containing the synthesized
+                   decision and the last message of the bull and bear researchers
+        """
+        print(f"Starting {self.coordination} conversation with {len(self.agents)} agents...")
+        # Create a swarm with these agents
+        swarm = self._create_swarm()
+
+        # Execute the swarm on a task
+        print("Phase 1: Swarm conversation between bull reseacher and bear reseacher...")
+        result = swarm(task)
+        bull_history, bear_history = self._report_swarm_result(result)
+
+        print("Generating final synthesis...")
+        final_solution = self.summarizer_agent(self._summarizer_prompt(task, bull_history, bear_history))
+        
+        print("Conversation completed successfully!")
+        
+        return final_solution, bull_history, bear_history
+
+    async def arun(self, task):
+        """
+        Asynchronous version of ``run``, driving the swarm and the summarizer with their async APIs.
+        
+        Args:
+            task (str): The trading task or question to analyze
+            
+        Returns:
+            tuple: (final_solution, bull_history, bear_history), as returned by ``run``
+        """
+        print(f"Starting {self.coordination} conversation with {len(self.agents)} agents...")
+        swarm = self._create_swarm()
+
+        print("Phase 1: Swarm conversation between bull reseacher and bear reseacher...")
+        result = await swarm.invoke_async(task)
+        bull_history, bear_history = self._report_swarm_result(result)
+
         print("Generating final synthesis...")
-        final_solution = self.summarizer_agent(summarizer_prompt)
+        final_solution = await self.summarizer_agent.invoke_async(
+            self._summarizer_prompt(task, bull_history, bear_history)
+        )
         
         print("Conversation completed successfully!")
         
-        return final_solution, bull_history, bear_history
\ No newline at end of file
+        return final_solution, bull_history, bear_history
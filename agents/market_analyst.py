@@ -13,8 +13,11 @@ from strands import Agent
 from tools import (
     get_yfin_data_online,
     get_stockstats_indicators_report_online,
+    get_stockstats_indicators_batch_report_online,
     get_yfin_data,
     get_stockstats_indicators_report,
+    get_stockstats_indicators_batch_report,
+    get_stockstats_cross_section_report,
 )
 
 
@@ -32,13 +35,16 @@ def create_market_analyst(llm, online=False):
     # Select tools based on online/offline mode
     if online:
         tools = [
-            get_yfin_data_online,                    # Real-time Yahoo Finance data
-            get_stockstats_indicators_report_online, # Real-time technical indicators
+            get_yfin_data_online,                          # Real-time Yahoo Finance data
+            get_stockstats_indicators_batch_report_online, # Real-time indicators, all in one call
+            get_stockstats_indicators_report_online,       # Real-time technical indicators
         ]
     else:
         tools = [
-            get_yfin_data,                    # Cached Yahoo Finance data
-            get_stockstats_indicators_report, # Cached technical indicators
+            get_yfin_data,                          # Cached Yahoo Finance data
+            get_stockstats_indicators_batch_report, # Cached indicators, all in one call
+            get_stockstats_indicators_report,       # Cached technical indicators
+            get_stockstats_cross_section_report,    # Cached indicators across several symbols
         ]
 
     # Define the agent's system prompt with detailed instructions
@@ -80,10 +86,13 @@ def create_market_analyst(llm, online=False):
         **Analysis Guidelines:**
         1. Always call get_yfin_data first to retrieve the necessary price data
         2. Select indicators that provide complementary information (avoid redundancy)
-        3. Explain why each selected indicator is suitable for the current market context
-        4. Provide detailed, nuanced analysis rather than generic "mixed trends" statements
-        5. Focus on actionable insights that help traders make informed decisions
-        6. Include a markdown table at the end summarizing key findings
+        3. Retrieve all selected indicators with a single get_stockstats_indicators_batch_report call
+           instead of one get_stockstats_indicators_report call per indicator; when comparing the
+           company with its peers, use get_stockstats_cross_section_report if it is available
+        4. Explain why each selected indicator is suitable for the current market context
+        5. Provide detailed, nuanced analysis rather than generic "mixed trends" statements
+        6. Focus on actionable insights that help traders make informed decisions
+        7. Include a markdown table at the end summarizing key findings
 
         **Output Format:**
         - Detailed technical analysis with specific observations
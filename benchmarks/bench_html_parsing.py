@@ -0,0 +1,63 @@
+"""
+Benchmark of the Google News result page parsers.
+
+Parses the saved pages under ``tests/fixtures/google_news`` with every
+installed backend and reports the time per page against ``html.parser``::
+
+    python -m benchmarks.bench_html_parsing --repeat 200
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dataflows import html_parsing
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures", "google_news")
+
+
+def installed_backends():
+    """Return the html_parsing backends that can run here."""
+    backends = ["bs4"]
+    if html_parsing.etree is not None:
+        backends.append("lxml")
+    if html_parsing.SelectolaxParser is not None:
+        backends.append("selectolax")
+    return backends
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the Google News page parsers")
+    parser.add_argument("--repeat", type=int, default=100, help="Passes over the fixture pages (default: 100)")
+    args = parser.parse_args()
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.html"))):
+        with open(path, "rb") as f:
+            pages.append(f.read())
+
+    baseline = None
+    for backend in installed_backends():
+        parse = html_parsing.get_page_parser(backend)
+        # the parsers print skipped results, and bs4 warns about the empty page
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                for page in pages:
+                    parse(page)
+            elapsed = time.perf_counter() - started
+        per_page = elapsed / (args.repeat * len(pages)) * 1e6
+        baseline = baseline or per_page
+        print(f"{backend:>10}: {per_page:8.1f} us/page  ({baseline / per_page:5.1f}x html.parser)")
+
+
+if __name__ == "__main__":
+    main()
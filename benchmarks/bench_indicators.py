@@ -0,0 +1,86 @@
+"""
+Benchmark of the native indicator engine against stockstats.
+
+Computes every indicator the market analyst can request on synthetic daily
+bars with both engines and reports the time per call::
+
+    python -m benchmarks.bench_indicators --periods 4000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dataflows import indicators
+
+INDICATORS = [
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+]
+
+
+def synthetic_bars(periods: int, seed: int = 0) -> pd.DataFrame:
+    """Random-walk daily bars with consistent OHLC and volume."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    high = close * (1 + rng.uniform(0, 0.02, periods))
+    low = close * (1 - rng.uniform(0, 0.02, periods))
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2000-01-03", periods=periods).strftime("%Y-%m-%d"),
+            "Open": (high + low) / 2,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, periods),
+        }
+    )
+
+
+def _time(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the native indicators against stockstats")
+    parser.add_argument("--periods", type=int, default=4000, help="Number of daily bars (default: 4000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Calls timed per indicator (default: 5)")
+    args = parser.parse_args()
+
+    frame = synthetic_bars(args.periods)
+    warnings.simplefilter("ignore")
+    for indicator in INDICATORS:
+        reference = _time(lambda: wrap(frame.copy())[indicator], args.repeat)
+        native = _time(lambda: indicators.compute_indicator(indicator, frame), args.repeat)
+        print(
+            f"{indicator:>14}: stockstats {reference * 1e3:7.2f} ms  "
+            f"native {native * 1e3:7.2f} ms  ({reference / native:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
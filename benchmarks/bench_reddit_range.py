@@ -0,0 +1,135 @@
+"""
+Benchmark of the Reddit range query against one full-file scan per day.
+
+Writes synthetic subreddit ``.jsonl`` files, then fetches the top posts of
+every day in a look-back window two ways: with the per-day scan the Reddit
+tools made before (every line of every file parsed once per day of the
+window), and with ``fetch_top_from_category_range``, once with the date
+index still to build and once with it loaded::
+
+    python -m benchmarks.bench_reddit_range --files 5 --posts 20000 --days 365 --window 7
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dataflows import reddit_index
+from dataflows.config import set_config
+from dataflows.reddit_utils import fetch_top_from_category_range, ticker_to_company
+
+TITLES = ["Apple unveils new chips", "Tesla deliveries beat", "Markets rally", "Fed holds rates", "Nvidia earnings"]
+
+
+def write_subreddits(directory: str, files: int, posts: int, days: int, seed: int = 0):
+    """Write files x posts synthetic posts spread over the last ``days`` days of 2024."""
+    rng = random.Random(seed)
+    first_day = datetime(2024, 12, 31, tzinfo=timezone.utc) - timedelta(days=days - 1)
+    os.makedirs(directory, exist_ok=True)
+    for i in range(files):
+        with open(os.path.join(directory, f"sub{i}.jsonl"), "w", encoding="utf-8") as f:
+            for n in range(posts):
+                created = first_day + timedelta(seconds=rng.randrange(days * 86400))
+                post = {
+                    "created_utc": int(created.timestamp()),
+                    "title": f"{rng.choice(TITLES)} #{n}",
+                    "selftext": " ".join(rng.choice(TITLES) for _ in range(rng.randrange(20))),
+                    "url": f"https://reddit.com/r/sub{i}/{n}",
+                    "ups": rng.randrange(5000),
+                }
+                f.write(json.dumps(post) + "\n")
+
+
+def scan_day(category: str, date: str, max_limit: int, query: str, data_path: str):
+    """The per-day full-file scan the range query replaces."""
+    files = os.listdir(os.path.join(data_path, category))
+    limit_per_subreddit = max_limit // len(files)
+    all_content = []
+    for data_file in files:
+        if not data_file.endswith(".jsonl"):
+            continue
+        posts = []
+        with open(os.path.join(data_path, category, data_file), "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                parsed = json.loads(line)
+                posted = datetime.fromtimestamp(parsed["created_utc"], timezone.utc).strftime("%Y-%m-%d")
+                if posted != date:
+                    continue
+                if "company" in category and query:
+                    terms = ticker_to_company[query].split(" OR ") + [query]
+                    if not any(
+                        re.search(term, parsed["title"], re.IGNORECASE)
+                        or re.search(term, parsed["selftext"], re.IGNORECASE)
+                        for term in terms
+                    ):
+                        continue
+                posts.append(
+                    {
+                        "title": parsed["title"],
+                        "content": parsed["selftext"],
+                        "url": parsed["url"],
+                        "upvotes": parsed["ups"],
+                        "posted_date": posted,
+                    }
+                )
+        posts.sort(key=lambda post: post["upvotes"], reverse=True)
+        all_content.extend(posts[:limit_per_subreddit])
+    return all_content
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the Reddit range query")
+    parser.add_argument("--files", type=int, default=5, help="Subreddit files in the category (default: 5)")
+    parser.add_argument("--posts", type=int, default=20000, help="Posts per file (default: 20000)")
+    parser.add_argument("--days", type=int, default=365, help="Days the posts are spread over (default: 365)")
+    parser.add_argument("--window", type=int, default=7, help="Look-back window in days (default: 7)")
+    parser.add_argument("--limit", type=int, default=25, help="Maximum posts per day (default: 25)")
+    parser.add_argument("--query", default="TSLA", help="Ticker filtered for in company_news (default: TSLA)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        set_config({"data_cache_dir": os.path.join(tmp, "cache"), "reddit_index_dir": os.path.join(tmp, "index")})
+        end = datetime(2024, 12, 31)
+        days = [(end - timedelta(days=n)).strftime("%Y-%m-%d") for n in range(args.window, -1, -1)]
+        print(f"{args.files} files x {args.posts} posts over {args.days} days, {len(days)}-day window")
+
+        for category, query in (("global_news", None), ("company_news", args.query)):
+            write_subreddits(os.path.join(tmp, category), args.files, args.posts, args.days)
+
+            started = time.perf_counter()
+            expected = {}
+            for day in days:
+                posts = scan_day(category, day, args.limit, query, tmp)
+                if posts:
+                    expected[day] = posts
+            scan_seconds = time.perf_counter() - started
+
+            timings = []
+            for _ in ("cold", "warm"):
+                started = time.perf_counter()
+                found = fetch_top_from_category_range(category, days[0], days[-1], args.limit, query, data_path=tmp)
+                timings.append(time.perf_counter() - started)
+                assert found == expected
+                reddit_index._INDEX_CACHE.clear()
+
+            cold, warm = timings
+            print(
+                f"{category:<13} per-day scan {scan_seconds * 1e3:8.1f} ms  range cold {cold * 1e3:7.1f} ms  "
+                f"warm {warm * 1e3:6.1f} ms  ({scan_seconds / warm:6.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark of process-pool workers attaching a shared price panel against
+each worker loading its own copy.
+
+Writes synthetic price files for a ticker universe, then starts a pool of
+spawned workers twice: once where every worker loads the panel from the
+columnar store, once where they attach the panel published in shared memory.
+Reports the pool startup time (until every worker has answered one
+cross-section query), the time each worker spent getting its panel, and
+the memory of each worker::
+
+    python -m benchmarks.bench_shared_panel --workers 8 --tickers 500 --periods 4000
+
+Worker memory is the proportional set size (shared pages divided among the
+processes mapping them) on Linux, the peak RSS elsewhere.
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dataflows.config import set_config
+from dataflows.price_panel import load_price_panel
+from dataflows.shared_panel import get_worker_panel, init_panel_worker, publish_price_panel
+
+_LOCAL_PANEL = None
+_INIT_SECONDS = 0.0
+
+
+def write_universe(data_dir: str, tickers: int, periods: int):
+    """Write one synthetic Yahoo Finance CSV file per ticker; return the symbols."""
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    os.makedirs(price_dir, exist_ok=True)
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2010-01-04", periods=periods)
+    symbols = [f"T{i:04d}" for i in range(tickers)]
+    for symbol in symbols:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+        frame = pd.DataFrame(
+            {
+                "Date": dates.strftime("%Y-%m-%d"),
+                "Open": close,
+                "High": close * 1.01,
+                "Low": close * 0.99,
+                "Close": close,
+                "Volume": rng.integers(1_000_000, 50_000_000, periods),
+            }
+        )
+        name = f"{symbol}-YFin-data-{frame['Date'].iloc[0]}-{frame['Date'].iloc[-1]}.csv"
+        frame.to_csv(os.path.join(price_dir, name), index=False)
+    return symbols
+
+
+def _memory_kb() -> int:
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _init_loading_worker(config, symbols):
+    global _LOCAL_PANEL, _INIT_SECONDS
+    started = time.perf_counter()
+    set_config(config)
+    _LOCAL_PANEL = load_price_panel(symbols)
+    _INIT_SECONDS = time.perf_counter() - started
+
+
+def _init_attaching_worker(manifest):
+    global _INIT_SECONDS
+    started = time.perf_counter()
+    init_panel_worker(manifest)
+    _INIT_SECONDS = time.perf_counter() - started
+
+
+def _query(_):
+    panel = _LOCAL_PANEL if _LOCAL_PANEL is not None else get_worker_panel()
+    last = str(panel.dates[-1])
+    # every worker touches the whole Close field, like a full-universe indicator pass
+    panel.cross_section("close_10_ema", last)
+    time.sleep(0.2)  # keep each worker busy so every worker gets one query
+    return os.getpid(), (_INIT_SECONDS, _memory_kb())
+
+
+def run_pool(workers: int, initializer, initargs):
+    """Start a spawned pool, send one query per worker; return (seconds, {pid: (init seconds, memory_kb)})."""
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    ) as pool:
+        answers = dict(pool.map(_query, range(workers)))
+        elapsed = time.perf_counter() - started
+    return elapsed, answers
+
+
+def report(label: str, elapsed: float, answers):
+    init_seconds, memory = np.array(list(answers.values())).T
+    print(f"{label:<17} startup {elapsed:6.2f} s, panel per worker {init_seconds.mean() * 1e3:8.1f} ms, "
+          f"worker memory {memory.mean() / 1024:7.1f} MiB avg")
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark shared-memory price panels in a process pool")
+    parser.add_argument("--workers", type=int, default=8, help="Number of pool workers (default: 8)")
+    parser.add_argument("--tickers", type=int, default=500, help="Number of symbols in the panel (default: 500)")
+    parser.add_argument("--periods", type=int, default=4000, help="Daily bars per symbol (default: 4000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = {
+            "data_dir": os.path.join(tmp, "data"),
+            "data_cache_dir": os.path.join(tmp, "cache"),
+            "price_store_dir": os.path.join(tmp, "cache", "price_store"),
+        }
+        set_config(config)
+        symbols = write_universe(config["data_dir"], args.tickers, args.periods)
+        # convert every file once, so both runs read the warm columnar store
+        panel = load_price_panel(symbols)
+        print(f"panel: {len(panel.dates)} dates x {len(symbols)} symbols, "
+              f"{sum(a.nbytes for a in panel.fields.values()) / 2**20:.1f} MiB of fields")
+
+        report("load per worker:", *run_pool(args.workers, _init_loading_worker, (config, symbols)))
+        with publish_price_panel(panel) as shared:
+            report("attach shared:", *run_pool(args.workers, _init_attaching_worker, (shared.manifest,)))
+
+
+if __name__ == "__main__":
+    main()
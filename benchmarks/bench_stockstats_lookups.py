@@ -0,0 +1,127 @@
+"""
+Benchmark of the date-indexed stockstats lookups against the Date string scan.
+
+Loads one symbol's price frame through ``StockstatsUtils.load_stock_frame``,
+computes an indicator once, then reads its value for random dates two ways:
+with the ``Date.str.startswith`` scan ``get_stock_stats`` used to make on
+every call, and with the binary search on the frame's DatetimeIndex. The
+same comparison is made for look-back windows, where the scan ran once per
+calendar day::
+
+    python -m benchmarks.bench_stockstats_lookups --periods 4000 --lookups 500 --window 30
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_indicators import synthetic_bars
+from dataflows.config import set_config
+from dataflows.stockstats_utils import StockstatsUtils
+
+NOT_TRADING = "N/A: Not a trading day (weekend or holiday)"
+
+
+def scan_lookup(data: pd.DataFrame, values: np.ndarray, curr_date: str):
+    """The lookup get_stock_stats made before the frames were date-indexed."""
+    matching_rows = np.flatnonzero(data["Date"].str.startswith(curr_date).to_numpy())
+    if len(matching_rows):
+        return values[matching_rows[0]]
+    return NOT_TRADING
+
+
+def indexed_lookup(data: pd.DataFrame, values: np.ndarray, curr_date: str):
+    curr_date = pd.Timestamp(curr_date)
+    row = data.index.searchsorted(curr_date, side="left")
+    if row < len(data) and data.index[row] == curr_date:
+        return values[row]
+    return NOT_TRADING
+
+
+def scan_window(data: pd.DataFrame, values: np.ndarray, start_date: str, end_date: str):
+    days = pd.date_range(start_date, end_date).strftime("%Y-%m-%d")
+    found = {day: scan_lookup(data, values, day) for day in days}
+    return {day: value for day, value in found.items() if not isinstance(value, str)}
+
+
+def indexed_window(data: pd.DataFrame, values: np.ndarray, start_date: str, end_date: str):
+    lo, hi = StockstatsUtils.date_bounds(data, start_date, end_date)
+    return dict(zip(data["Date"].values[lo:hi], values[lo:hi]))
+
+
+def _time(function, arguments) -> tuple:
+    started = time.perf_counter()
+    results = [function(*args) for args in arguments]
+    return time.perf_counter() - started, results
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark date-indexed stockstats lookups")
+    parser.add_argument("--periods", type=int, default=4000, help="Daily bars of the symbol (default: 4000)")
+    parser.add_argument("--lookups", type=int, default=500, help="Random dates looked up (default: 500)")
+    parser.add_argument("--window", type=int, default=30, help="Calendar days per window lookup (default: 30)")
+    parser.add_argument("--indicator", default="rsi", help="Indicator to look up (default: rsi)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "data")
+        set_config(
+            {
+                "data_dir": data_dir,
+                "data_cache_dir": os.path.join(tmp, "cache"),
+                "price_store_dir": os.path.join(tmp, "cache", "price_store"),
+                "indicator_engine": "stockstats",
+            }
+        )
+        bars = synthetic_bars(args.periods)
+        price_dir = os.path.join(data_dir, "market_data", "price_data")
+        os.makedirs(price_dir)
+        bars.to_csv(
+            os.path.join(price_dir, f"AAPL-YFin-data-{bars['Date'].iloc[0]}-{bars['Date'].iloc[-1]}.csv"),
+            index=False,
+        )
+
+        data = StockstatsUtils.load_stock_frame("AAPL", data_dir)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            values = StockstatsUtils.compute_indicator(data, args.indicator)
+
+    # calendar days, so about 2 in 7 lookups miss on a weekend
+    rng = random.Random(0)
+    first, last = data.index[0], data.index[-1]
+    days = [
+        (first + pd.Timedelta(days=rng.randrange((last - first).days + 1))).strftime("%Y-%m-%d")
+        for _ in range(args.lookups)
+    ]
+    windows = [
+        ((pd.Timestamp(day) - pd.Timedelta(days=args.window)).strftime("%Y-%m-%d"), day) for day in days
+    ]
+
+    print(f"{args.indicator} over {len(data)} bars, {args.lookups} dates")
+    for label, baseline, indexed, arguments in (
+        ("point lookup:", scan_lookup, indexed_lookup, [(data, values, day) for day in days]),
+        (f"{args.window}-day window:", scan_window, indexed_window, [(data, values, *w) for w in windows]),
+    ):
+        scan_seconds, expected = _time(baseline, arguments)
+        indexed_seconds, found = _time(indexed, arguments)
+        # assert_equal treats the NaN of the first rows as equal
+        np.testing.assert_equal(found, expected)
+        print(
+            f"{label:<16} Date scan {scan_seconds / len(arguments) * 1e6:9.1f} us  "
+            f"indexed {indexed_seconds / len(arguments) * 1e6:7.1f} us  ({scan_seconds / indexed_seconds:6.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
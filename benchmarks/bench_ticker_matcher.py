@@ -0,0 +1,68 @@
+"""
+Benchmark of TickerMatcher.tickers_in against one search per ticker.
+
+Matches synthetic Reddit posts against the company-news ticker mapping::
+
+    python -m benchmarks.bench_ticker_matcher --posts 3000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dataflows.reddit_utils import ticker_to_company
+from dataflows.ticker_matcher import TickerMatcher
+
+VOCABULARY = (
+    "the market stock price rally earnings revenue guidance analyst buy sell hold calls puts "
+    "options growth quarter fiscal shares investors dip moon yolo fed rates inflation"
+).split()
+NAMES = ["Apple", "Tesla", "Nvidia", "Microsoft", "Meta", "Intel", "Visa", "AMD", "Netflix", "Snap Inc."]
+
+
+def synthetic_posts(count: int, seed: int = 0):
+    """(title, selftext) pairs, about a third of them naming a company."""
+    rng = random.Random(seed)
+
+    def text(words: int) -> str:
+        tokens = [rng.choice(VOCABULARY) for _ in range(words)]
+        if rng.random() < 0.3:
+            tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(NAMES))
+        return " ".join(tokens)
+
+    return [(text(rng.randint(5, 15)), text(rng.choice([0, 0, 20, 80, 300]))) for _ in range(count)]
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the ticker mention matcher")
+    parser.add_argument("--posts", type=int, default=3000, help="Number of synthetic posts (default: 3000)")
+    args = parser.parse_args()
+
+    posts = synthetic_posts(args.posts)
+    matcher = TickerMatcher(ticker_to_company)
+    matcher.tickers_in("warm up")
+
+    started = time.perf_counter()
+    expected = [
+        [ticker for ticker in ticker_to_company if matcher.mentions(ticker, title, content)]
+        for title, content in posts
+    ]
+    per_ticker = time.perf_counter() - started
+
+    started = time.perf_counter()
+    found = [matcher.tickers_in(title, content) for title, content in posts]
+    combined = time.perf_counter() - started
+
+    assert found == expected
+    print(f"per-ticker search: {per_ticker * 1e3:8.1f} ms")
+    print(f"tickers_in:        {combined * 1e3:8.1f} ms  ({per_ticker / combined:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,18 @@
 from .finnhub_utils import get_data_in_range
+from .finnhub_store import query_finnhub
+from .fundamentals_store import StatementFile, load_statement_file
 from .googlenews_utils import getNewsData
-from .yfin_utils import YFinanceUtils
-from .reddit_utils import fetch_top_from_category
+from .news_cache import get_news_cache
+from .yfin_utils import YFinanceUtils, fetch_fundamentals_bulk, get_ticker
+from .reddit_utils import fetch_top_from_category, fetch_top_from_category_range
+from .ticker_matcher import TickerMatcher, build_ticker_index
 from .stockstats_utils import StockstatsUtils
+from .price_store import PriceSeries, load_price_series
+from .catalog import DataCatalog, get_catalog
+from .price_panel import PricePanel, load_price_panel
+from .shared_panel import attach_price_panel, get_worker_panel, init_panel_worker, publish_price_panel
+from . import indicators
+from .incremental_indicators import IndicatorStateStore, create_incremental_indicator
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
@@ -17,8 +27,11 @@ from .interface import (
     get_simfin_balance_sheet,
     get_simfin_cashflow,
     get_simfin_income_statements,
+    get_fundamentals_snapshot,
     # Technical analysis functions
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_batch,
+    get_stock_stats_cross_section,
     get_stockstats_indicator,
     # Market data functions
     get_YFin_data_window,
@@ -37,8 +50,11 @@ __all__ = [
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
+    "get_fundamentals_snapshot",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
+    "get_stock_stats_indicators_batch",
+    "get_stock_stats_cross_section",
     "get_stockstats_indicator",
     # Market data functions
     "get_YFin_data_window",
@@ -0,0 +1,342 @@
+"""
+Data Catalog
+
+Scans the offline data directory once and indexes every dataset it finds by
+kind, symbol and covered date range, so the dataflows resolve a request to a
+file with a dictionary lookup instead of hard-coded, dated file names.
+
+Recognized layout under ``data_dir``::
+
+    market_data/price_data/{symbol}-YFin-data-{start}-{end}.csv
+    finnhub_data/{data_type}/{symbol}[_{period}]_data_formatted.json
+    reddit_data/{category}/*.jsonl
+    fundamental_data/simfin_data_all/{statement}/companies/us/us-{name}-{freq}.csv
+
+Refreshed data is picked up without code changes: lookups check the
+modification times of the scanned directories at most once every
+``catalog_check_interval`` seconds and rescan if they changed, ``refresh()``
+checks right away, and a file that no longer exists is never returned.
+"""
+
+import os
+import re
+import time
+from typing import Dict, List, Optional
+
+from .config import get_config
+
+PRICE_DIR = os.path.join("market_data", "price_data")
+FINNHUB_DIR = "finnhub_data"
+REDDIT_DIR = "reddit_data"
+SIMFIN_DIR = os.path.join("fundamental_data", "simfin_data_all")
+
+_PRICE_FILE = re.compile(
+    r"^(?P<symbol>.+)-YFin-data-(?P<start>\d{4}-\d{2}-\d{2})-(?P<end>\d{4}-\d{2}-\d{2})\.csv$"
+)
+_FINNHUB_FILE = re.compile(
+    r"^(?P<symbol>.+?)(?:_(?P<period>annual|quarterly))?_data_formatted\.json$"
+)
+_SIMFIN_FILE = re.compile(r"^us-(?P<name>.+)-(?P<freq>annual|quarterly)\.csv$")
+
+# Process-level catalogs, keyed by absolute data directory
+_CATALOGS: Dict[str, "DataCatalog"] = {}
+
+
+class DatasetEntry:
+    """A single dataset file with the symbol and date range it covers."""
+
+    __slots__ = ("kind", "path", "symbol", "start", "end", "data_type", "period")
+
+    def __init__(
+        self,
+        kind: str,
+        path: str,
+        symbol: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        data_type: Optional[str] = None,
+        period: Optional[str] = None,
+    ):
+        self.kind = kind
+        self.path = path
+        self.symbol = symbol
+        self.start = start
+        self.end = end
+        self.data_type = data_type
+        self.period = period
+
+    def covers(self, date: str) -> bool:
+        """Whether a yyyy-mm-dd date falls inside the range named by the file."""
+        if self.start is not None and date < self.start:
+            return False
+        if self.end is not None and date > self.end:
+            return False
+        return True
+
+    def __repr__(self):
+        return (
+            f"DatasetEntry(kind={self.kind!r}, symbol={self.symbol!r}, "
+            f"start={self.start!r}, end={self.end!r}, path={self.path!r})"
+        )
+
+
+def _list_dir(path: str) -> List[str]:
+    try:
+        return sorted(os.listdir(path))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+class DataCatalog:
+    """
+    Index of the offline datasets under a data directory.
+
+    Args:
+        data_dir (str): Root of the offline data (the ``data_dir`` config value)
+    """
+
+    def __init__(self, data_dir: str):
+        self.data_dir = os.path.abspath(data_dir)
+        self.scan()
+
+    def scan(self):
+        """(Re)build the index from the directory tree."""
+        self._last_check = time.monotonic()
+        self._dir_mtimes: Dict[str, Optional[int]] = {}
+        self._prices: Dict[str, List[DatasetEntry]] = {}
+        self._finnhub: Dict[tuple, DatasetEntry] = {}
+        self._reddit: Dict[str, List[str]] = {}
+        self._simfin: Dict[tuple, DatasetEntry] = {}
+
+        self._scan_prices()
+        self._scan_finnhub()
+        self._scan_reddit()
+        self._scan_simfin()
+
+    def _watch(self, path: str) -> List[str]:
+        """List a directory and remember its mtime for staleness checks."""
+        try:
+            self._dir_mtimes[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self._dir_mtimes[path] = None
+        return _list_dir(path)
+
+    def _scan_prices(self):
+        price_dir = os.path.join(self.data_dir, PRICE_DIR)
+        for file_name in self._watch(price_dir):
+            match = _PRICE_FILE.match(file_name)
+            if not match:
+                continue
+            entry = DatasetEntry(
+                "price",
+                os.path.join(price_dir, file_name),
+                symbol=match.group("symbol"),
+                start=match.group("start"),
+                end=match.group("end"),
+            )
+            self._prices.setdefault(entry.symbol, []).append(entry)
+        # Newest coverage first, longest history first among equal ends
+        for entries in self._prices.values():
+            entries.sort(key=lambda e: e.start)
+            entries.sort(key=lambda e: e.end, reverse=True)
+
+    def _scan_finnhub(self):
+        finnhub_dir = os.path.join(self.data_dir, FINNHUB_DIR)
+        for data_type in self._watch(finnhub_dir):
+            type_dir = os.path.join(finnhub_dir, data_type)
+            if not os.path.isdir(type_dir):
+                continue
+            for file_name in self._watch(type_dir):
+                match = _FINNHUB_FILE.match(file_name)
+                if not match:
+                    continue
+                entry = DatasetEntry(
+                    "finnhub",
+                    os.path.join(type_dir, file_name),
+                    symbol=match.group("symbol"),
+                    data_type=data_type,
+                    period=match.group("period"),
+                )
+                self._finnhub[(data_type, entry.symbol, entry.period)] = entry
+
+    def _scan_reddit(self):
+        reddit_dir = os.path.join(self.data_dir, REDDIT_DIR)
+        for category in self._watch(reddit_dir):
+            category_dir = os.path.join(reddit_dir, category)
+            if not os.path.isdir(category_dir):
+                continue
+            self._reddit[category] = [
+                os.path.join(category_dir, file_name)
+                for file_name in self._watch(category_dir)
+                if file_name.endswith(".jsonl")
+            ]
+
+    def _scan_simfin(self):
+        simfin_dir = os.path.join(self.data_dir, SIMFIN_DIR)
+        for statement in self._watch(simfin_dir):
+            statement_dir = os.path.join(simfin_dir, statement, "companies", "us")
+            if not os.path.isdir(statement_dir):
+                continue
+            for file_name in self._watch(statement_dir):
+                match = _SIMFIN_FILE.match(file_name)
+                if not match:
+                    continue
+                entry = DatasetEntry(
+                    "simfin",
+                    os.path.join(statement_dir, file_name),
+                    data_type=statement,
+                    period=match.group("freq"),
+                )
+                self._simfin[(statement, entry.period)] = entry
+
+    def is_stale(self) -> bool:
+        """Whether any scanned directory changed since the last scan."""
+        for path, mtime in self._dir_mtimes.items():
+            try:
+                current = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                current = None
+            if current != mtime:
+                return True
+        return False
+
+    def refresh(self) -> bool:
+        """
+        Rescan now if any scanned directory changed, regardless of the check interval.
+
+        Returns:
+            bool: Whether the index was rebuilt
+        """
+        self._last_check = time.monotonic()
+        if self.is_stale():
+            self.scan()
+            return True
+        return False
+
+    def _lookup(self, find):
+        # Stat the watched directories at most once per interval, not per lookup
+        interval = get_config().get("catalog_check_interval", 0)
+        if time.monotonic() - self._last_check >= interval:
+            self.refresh()
+        return find()
+
+    @staticmethod
+    def _existing(entry: Optional[DatasetEntry]) -> Optional[DatasetEntry]:
+        # A file removed without changing its directory's mtime (e.g. within
+        # the mtime granularity) is reported as missing rather than handed out
+        if entry is None or not os.path.exists(entry.path):
+            return None
+        return entry
+
+    def price_file(self, symbol: str, end_date: Optional[str] = None) -> Optional[DatasetEntry]:
+        """
+        Resolve the price file for a symbol.
+
+        Args:
+            symbol (str): Ticker symbol of the company
+            end_date (str): Last date the caller needs, yyyy-mm-dd, or None for the newest file
+
+        Returns:
+            DatasetEntry: The file with the newest coverage that reaches end_date (or
+            the newest file if none does), or None if the symbol has no price data
+        """
+
+        def find():
+            entries = self._prices.get(symbol)
+            if not entries:
+                return None
+            if end_date is not None:
+                for entry in entries:
+                    if entry.covers(end_date[:10]):
+                        return entry
+            return entries[0]
+
+        return self._existing(self._lookup(find))
+
+    def price_path(self, symbol: str, end_date: Optional[str] = None) -> str:
+        """Like price_file but returns the path, raising FileNotFoundError if there is none."""
+        entry = self.price_file(symbol, end_date)
+        if entry is None:
+            raise FileNotFoundError(
+                f"No price data for {symbol} in {os.path.join(self.data_dir, PRICE_DIR)}"
+            )
+        return entry.path
+
+    def finnhub_file(
+        self, symbol: str, data_type: str, period: Optional[str] = None
+    ) -> Optional[DatasetEntry]:
+        """Resolve the formatted Finnhub file for a symbol and data type."""
+        return self._existing(self._lookup(lambda: self._finnhub.get((data_type, symbol, period or None))))
+
+    def finnhub_path(self, symbol: str, data_type: str, period: Optional[str] = None) -> str:
+        """Like finnhub_file but returns the path, raising FileNotFoundError if there is none."""
+        entry = self.finnhub_file(symbol, data_type, period)
+        if entry is None:
+            raise FileNotFoundError(
+                f"No {data_type} data for {symbol} in {os.path.join(self.data_dir, FINNHUB_DIR)}"
+            )
+        return entry.path
+
+    def reddit_files(self, category: str) -> List[str]:
+        """Return the sorted .jsonl files of a Reddit category."""
+        paths = self._lookup(lambda: self._reddit.get(category)) or []
+        return [path for path in paths if os.path.exists(path)]
+
+    def simfin_file(self, statement: str, freq: str) -> Optional[DatasetEntry]:
+        """Resolve the SimFin bulk file for a statement (balance_sheet, cash_flow, income_statements) and frequency."""
+        return self._existing(self._lookup(lambda: self._simfin.get((statement, freq))))
+
+    def simfin_path(self, statement: str, freq: str) -> str:
+        """Like simfin_file but returns the path, raising FileNotFoundError if there is none."""
+        entry = self.simfin_file(statement, freq)
+        if entry is None:
+            raise FileNotFoundError(
+                f"No {freq} {statement} data in {os.path.join(self.data_dir, SIMFIN_DIR)}"
+            )
+        return entry.path
+
+    def symbols(self, kind: str = "price") -> List[str]:
+        """Return the symbols that have data of the given kind (price or finnhub)."""
+        if kind == "price":
+            return self._lookup(lambda: sorted(self._prices))
+        if kind == "finnhub":
+            return self._lookup(lambda: sorted({symbol for _, symbol, _ in self._finnhub}))
+        raise ValueError(f"Datasets of kind {kind} are not indexed by symbol")
+
+    def datasets(self, kind: Optional[str] = None, symbol: Optional[str] = None) -> List[DatasetEntry]:
+        """List the indexed dataset files, optionally filtered by kind and symbol."""
+        self._lookup(lambda: None)
+        entries = [entry for group in self._prices.values() for entry in group]
+        entries += list(self._finnhub.values())
+        entries += [
+            DatasetEntry("reddit", path, data_type=category)
+            for category, paths in self._reddit.items()
+            for path in paths
+        ]
+        entries += list(self._simfin.values())
+        return [
+            entry
+            for entry in entries
+            if (kind is None or entry.kind == kind)
+            and (symbol is None or entry.symbol == symbol)
+        ]
+
+
+def get_catalog(data_dir: Optional[str] = None) -> DataCatalog:
+    """
+    Return the catalog of a data directory, scanning it on first use.
+
+    Args:
+        data_dir (str): Root of the offline data, defaults to the configured data_dir
+
+    Returns:
+        DataCatalog: The shared catalog for the directory
+    """
+    if data_dir is None:
+        data_dir = get_config()["data_dir"]
+    key = os.path.abspath(data_dir)
+    catalog = _CATALOGS.get(key)
+    if catalog is None:
+        catalog = DataCatalog(key)
+        _CATALOGS[key] = catalog
+    return catalog
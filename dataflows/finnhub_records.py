@@ -0,0 +1,100 @@
+"""
+Finnhub Insider Records
+
+Normalized records for the insider sentiment and insider transaction entries
+of the formatted Finnhub files, used to deduplicate and render the insider
+reports.
+
+A record's ``key`` is a hashable, canonical form of the whole entry (the SEC
+filing id together with every other field), so two entries share a key exactly
+when they compare equal as dicts. Deduplication is then one set lookup per
+entry instead of a scan of every entry kept so far.
+"""
+
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Type, TypeVar
+
+
+def entry_key(value) -> Hashable:
+    """
+    Hashable form of a decoded JSON value, equal for two values exactly when they compare equal.
+
+    Dicts become tuples of their (key, value) pairs sorted by key, and lists
+    become tuples, recursively.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, entry_key(item)) for key, item in value.items())))
+    if isinstance(value, list):
+        return (list, tuple(entry_key(item) for item in value))
+    return value
+
+
+class InsiderSentiment(NamedTuple):
+    """One month of insider sentiment."""
+
+    key: Hashable
+    year: object
+    month: object
+    change: object
+    mspr: object
+
+    @classmethod
+    def from_entry(cls, entry: Dict, key: Hashable = None) -> "InsiderSentiment":
+        key = entry_key(entry) if key is None else key
+        return cls(key, entry["year"], entry["month"], entry["change"], entry["mspr"])
+
+    def to_markdown(self) -> str:
+        return f"### {self.year}-{self.month}:\nChange: {self.change}\nMonthly Share Purchase Ratio: {self.mspr}\n\n"
+
+
+class InsiderTransaction(NamedTuple):
+    """One insider transaction reported in an SEC filing."""
+
+    key: Hashable
+    filing_date: object
+    name: object
+    change: object
+    share: object
+    transaction_price: object
+    transaction_code: object
+
+    @classmethod
+    def from_entry(cls, entry: Dict, key: Hashable = None) -> "InsiderTransaction":
+        key = entry_key(entry) if key is None else key
+        return cls(
+            key,
+            entry["filingDate"],
+            entry["name"],
+            entry["change"],
+            entry["share"],
+            entry["transactionPrice"],
+            entry["transactionCode"],
+        )
+
+    def to_markdown(self) -> str:
+        return f"### Filing Date: {self.filing_date}, {self.name}:\nChange:{self.change}\nShares: {self.share}\nTransaction Price: {self.transaction_price}\nTransaction Code: {self.transaction_code}\n\n"
+
+
+Record = TypeVar("Record", InsiderSentiment, InsiderTransaction)
+
+
+def unique_records(data: Dict[str, Iterable[Dict]], record_type: Type[Record]) -> List[Record]:
+    """
+    Normalize the entries of a date-keyed Finnhub range, dropping repeats of an earlier entry.
+
+    Args:
+        data (dict): date key -> entries, as returned by ``get_data_in_range``
+        record_type (type): InsiderSentiment or InsiderTransaction
+
+    Returns:
+        list: The first occurrence of every distinct entry, in date-key then entry order
+    """
+    seen = set()
+    records = []
+    for entries in data.values():
+        for entry in entries:
+            key = entry_key(entry)
+            if key in seen:
+                continue
+            seen.add(key)
+            records.append(record_type.from_entry(entry, key))
+    return records
@@ -0,0 +1,251 @@
+"""
+Finnhub Store
+
+Serves date-range queries over the formatted Finnhub JSON files
+(``{ticker}[_{period}]_data_formatted.json``, keyed by yyyy-mm-dd).
+
+Two backends, chosen with the ``finnhub_backend`` setting:
+
+- ``memory`` (default): each file is parsed once per process and kept with
+  its keys pre-sorted, so a range query is two binary searches. Entries are
+  reloaded when the file's mtime or size changes.
+- ``sqlite``: files are imported once into a SQLite database indexed on
+  (ticker, data_type, period, date), for archives too large to keep in memory.
+  A file is re-imported when it changes.
+
+Both return exactly what filtering the file's keys linearly returns: the
+non-empty entries whose key lies in the range, in file order.
+"""
+
+import bisect
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from .config import get_config
+from .json_decoding import get_loads
+
+# Process-level cache of loaded files, keyed by absolute path
+_FILE_CACHE: Dict[str, "FinnhubFile"] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _signature(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FinnhubFile:
+    """
+    The non-empty entries of one formatted Finnhub file, indexed by date key.
+
+    Args:
+        data (dict): The decoded file, date key -> entries
+        signature (tuple): (mtime_ns, size) of the file the data was read from
+    """
+
+    def __init__(self, data: Dict, signature: Tuple[int, int]):
+        self.signature = signature
+        items = [(key, value) for key, value in data.items() if len(value) > 0]
+        # positions in file order, sorted by key for bisect
+        order = sorted(range(len(items)), key=lambda i: items[i][0])
+        self.keys = [items[i][0] for i in order]
+        self.positions = order
+        self.items = items
+        self._file_order_sorted = order == list(range(len(order)))
+
+    def range(self, start_date: str, end_date: str) -> Dict:
+        """
+        Return the entries whose key is between start_date and end_date (inclusive), in file order.
+
+        The entries are shared with the cache and must not be modified.
+        """
+        lo = bisect.bisect_left(self.keys, start_date)
+        hi = bisect.bisect_right(self.keys, end_date)
+        positions = self.positions[lo:hi]
+        if not self._file_order_sorted:
+            positions = sorted(positions)
+        return {self.items[i][0]: self.items[i][1] for i in positions}
+
+
+def load_finnhub_file(path: str) -> FinnhubFile:
+    """
+    Return the parsed contents of a formatted Finnhub file, reading it only if it changed.
+
+    Args:
+        path (str): Path of the ``*_data_formatted.json`` file
+
+    Returns:
+        FinnhubFile: Date-indexed entries of the file
+    """
+    path = os.path.abspath(path)
+    signature = _signature(path)
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    with open(path, "rb") as f:
+        data = get_loads()(f.read())
+    loaded = FinnhubFile(data, signature)
+    with _CACHE_LOCK:
+        _FILE_CACHE[path] = loaded
+    return loaded
+
+
+class SQLiteFinnhubStore:
+    """
+    Finnhub entries in a SQLite database, imported from the JSON files on demand.
+
+    Args:
+        db_path (str): Path of the database file, created if missing
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._import_lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS sources (
+                    ticker TEXT NOT NULL,
+                    data_type TEXT NOT NULL,
+                    period TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    PRIMARY KEY (ticker, data_type, period)
+                );
+                CREATE TABLE IF NOT EXISTS entries (
+                    ticker TEXT NOT NULL,
+                    data_type TEXT NOT NULL,
+                    period TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    payload TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS entries_lookup
+                    ON entries (ticker, data_type, period, date);
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call keeps the store usable from any thread
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def ensure_imported(self, path: str, ticker: str, data_type: str, period: Optional[str] = None):
+        """Import a file unless the database already holds its current contents."""
+        path = os.path.abspath(path)
+        mtime_ns, size = _signature(path)
+        period = period or ""
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT path, mtime_ns, size FROM sources WHERE ticker = ? AND data_type = ? AND period = ?",
+                (ticker, data_type, period),
+            ).fetchone()
+        if row == (path, mtime_ns, size):
+            return
+
+        with self._import_lock:
+            with open(path, "rb") as f:
+                data = get_loads()(f.read())
+            rows = [
+                (ticker, data_type, period, key, position, json.dumps(value))
+                for position, (key, value) in enumerate(data.items())
+                if len(value) > 0
+            ]
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM entries WHERE ticker = ? AND data_type = ? AND period = ?",
+                    (ticker, data_type, period),
+                )
+                conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?)",
+                    (ticker, data_type, period, path, mtime_ns, size),
+                )
+
+    def range(
+        self,
+        ticker: str,
+        data_type: str,
+        start_date: str,
+        end_date: str,
+        period: Optional[str] = None,
+    ) -> Dict:
+        """Return the entries between start_date and end_date (inclusive), in file order."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT date, payload FROM entries
+                WHERE ticker = ? AND data_type = ? AND period = ? AND date BETWEEN ? AND ?
+                ORDER BY position
+                """,
+                (ticker, data_type, period or "", start_date, end_date),
+            ).fetchall()
+        loads = get_loads()
+        return {date: loads(payload) for date, payload in rows}
+
+
+_SQLITE_STORES: Dict[str, SQLiteFinnhubStore] = {}
+
+
+def get_sqlite_store(db_path: Optional[str] = None) -> SQLiteFinnhubStore:
+    """Return the shared SQLite store for a database path (default: the ``finnhub_db_path`` setting)."""
+    if db_path is None:
+        config = get_config()
+        db_path = config.get(
+            "finnhub_db_path", os.path.join(config["data_cache_dir"], "finnhub.sqlite")
+        )
+    db_path = os.path.abspath(db_path)
+    with _CACHE_LOCK:
+        store = _SQLITE_STORES.get(db_path)
+        if store is None:
+            store = SQLiteFinnhubStore(db_path)
+            _SQLITE_STORES[db_path] = store
+    return store
+
+
+def query_finnhub(
+    path: str,
+    ticker: str,
+    data_type: str,
+    start_date: str,
+    end_date: str,
+    period: Optional[str] = None,
+) -> Dict:
+    """
+    Return the non-empty entries of a Finnhub file between two dates with the configured backend.
+
+    Args:
+        path (str): Path of the formatted Finnhub file
+        ticker (str): Ticker the file belongs to
+        data_type (str): insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        period (str): annual or quarterly for period-specific files, else None
+
+    Returns:
+        dict: date key -> entries, in file order
+
+    Raises:
+        ValueError: If the finnhub_backend setting is unknown
+    """
+    backend = get_config().get("finnhub_backend", "memory")
+    if backend == "memory":
+        return load_finnhub_file(path).range(start_date, end_date)
+    if backend == "sqlite":
+        store = get_sqlite_store()
+        store.ensure_imported(path, ticker, data_type, period)
+        return store.range(ticker, data_type, start_date, end_date, period)
+    raise ValueError(f"Unknown finnhub_backend {backend}. Please choose from: ['memory', 'sqlite']")
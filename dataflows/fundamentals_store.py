@@ -0,0 +1,240 @@
+"""
+Fundamentals Store
+
+Point-in-time access to the SimFin bulk statement files
+(``us-{statement}-{freq}.csv``, one row per company and reporting period).
+
+Each file is parsed once: its rows are partitioned by ticker and, within a
+ticker, sorted by publish date (file order among equal dates). The result is
+persisted under the configured ``simfin_store_dir`` in the layout of the price
+store (one ``.npy`` file per column, loaded with ``allow_pickle=False``, plus a
+``meta.json``) and reused until the source file changes, so later processes
+skip the CSV parse entirely. Finding
+"the latest statement published on or before a date" is then a dictionary
+lookup and one binary search on that ticker's publish dates.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+STORE_VERSION = 2
+INDEX_FILE = "_index.npy"
+META_FILE = "meta.json"
+
+# Process-level cache of loaded statement files, keyed by absolute source path
+_STATEMENT_CACHE: Dict[str, "StatementFile"] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _signature(path: str) -> Dict:
+    stat = os.stat(path)
+    return {"source_mtime": stat.st_mtime_ns, "source_size": stat.st_size}
+
+
+class StatementFile:
+    """
+    One SimFin statement file partitioned by ticker.
+
+    Args:
+        frame (pd.DataFrame): Rows with a ticker and a publish date, grouped by ticker and
+            sorted by publish date; the index holds the row numbers of the source file
+        spans (dict): ticker -> (start, stop) row positions of the ticker's rows in frame
+        signature (dict): mtime and size of the file the rows were read from
+    """
+
+    def __init__(self, frame: pd.DataFrame, spans: Dict[str, Tuple[int, int]], signature: Dict):
+        self.frame = frame
+        self.spans = spans
+        self.signature = signature
+        # tz-naive UTC datetimes, searchable with np.searchsorted
+        self.publish_dates = frame["Publish Date"].dt.tz_convert(None).to_numpy()
+
+    def latest(self, ticker: str, curr_date: str) -> Optional[pd.Series]:
+        """
+        Return the ticker's most recent statement published on or before curr_date.
+
+        Among statements published on the same day the first one in the file is
+        returned, as ``idxmax`` over the file's rows would.
+
+        Args:
+            ticker (str): Ticker symbol of the company
+            curr_date (str): Current date in yyyy-mm-dd format
+
+        Returns:
+            pd.Series: The statement row, named after its row number in the file, or None
+        """
+        span = self.spans.get(ticker)
+        if span is None:
+            return None
+        start, stop = span
+        curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize().tz_convert(None)
+        dates = self.publish_dates[start:stop]
+        end = int(np.searchsorted(dates, np.datetime64(curr_date_dt), side="right"))
+        if end == 0:
+            return None
+        first = int(np.searchsorted(dates, dates[end - 1], side="left"))
+        return self.frame.iloc[start + first]
+
+
+def partition_statements(data: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Tuple[int, int]]]:
+    """
+    Parse the date columns of a raw statement frame and partition its rows by ticker.
+
+    Args:
+        data (pd.DataFrame): The statement file as read with ``pd.read_csv(path, sep=";")``
+
+    Returns:
+        tuple: The partitioned frame and its ticker -> (start, stop) spans, as StatementFile takes them
+    """
+    # Convert date strings to datetime objects and remove any time components
+    data["Report Date"] = pd.to_datetime(data["Report Date"], utc=True).dt.normalize()
+    data["Publish Date"] = pd.to_datetime(data["Publish Date"], utc=True).dt.normalize()
+
+    # Rows without a ticker or a publish date never match a point-in-time query
+    data = data[data["Ticker"].notna() & data["Publish Date"].notna()]
+    data = data.sort_values(["Ticker", "Publish Date"], kind="stable")
+
+    tickers = data["Ticker"].to_numpy()
+    bounds = np.flatnonzero(tickers[1:] != tickers[:-1]) + 1
+    starts = np.concatenate(([0], bounds)) if len(tickers) else np.array([], dtype=np.int64)
+    stops = np.concatenate((bounds, [len(tickers)])) if len(tickers) else np.array([], dtype=np.int64)
+    spans = {tickers[start]: (int(start), int(stop)) for start, stop in zip(starts, stops)}
+    return data, spans
+
+
+def get_store_dir() -> str:
+    """Return the directory the partitioned statement files are persisted in."""
+    config = get_config()
+    return config.get(
+        "simfin_store_dir", os.path.join(config["data_cache_dir"], "simfin_store")
+    )
+
+
+def _store_path(path: str) -> str:
+    statement = os.path.basename(os.path.dirname(os.path.dirname(os.path.dirname(path))))
+    return os.path.join(get_store_dir(), statement, os.path.splitext(os.path.basename(path))[0])
+
+
+def _atomic_save(path: str, array: np.ndarray):
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(tmp_path, "wb") as f:
+        np.save(f, array, allow_pickle=False)
+    os.replace(tmp_path, path)
+
+
+def _atomic_write_json(path: str, payload: Dict):
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, path)
+
+
+def _write_store(store_path: str, frame: pd.DataFrame, spans: Dict[str, Tuple[int, int]], meta: Dict):
+    """
+    Write a partitioned frame as one ``.npy`` file per column.
+
+    Numeric columns are saved as they are, UTC datetimes as naive datetimes
+    and text columns as fixed-width unicode with a separate missing-value mask,
+    so every file loads without pickle.
+    """
+    os.makedirs(store_path, exist_ok=True)
+    _atomic_save(os.path.join(store_path, INDEX_FILE), frame.index.to_numpy(dtype=np.int64))
+
+    columns = []
+    for i, name in enumerate(frame.columns):
+        values = frame[name]
+        column = {"name": name, "file": f"col_{i}.npy"}
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            column["kind"] = "datetime"
+            array = values.dt.tz_convert(None).to_numpy()
+        elif pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+            column["kind"] = "number"
+            array = values.to_numpy()
+        else:
+            column["kind"] = "text"
+            column["missing_file"] = f"col_{i}_missing.npy"
+            missing = values.isna().to_numpy()
+            _atomic_save(os.path.join(store_path, column["missing_file"]), missing)
+            array = values.astype(object).where(~missing, "").to_numpy().astype(str)
+        _atomic_save(os.path.join(store_path, column["file"]), array)
+        columns.append(column)
+
+    meta = {**meta, "rows": len(frame), "columns": columns, "spans": spans}
+    # The metadata file is written last and marks the conversion as complete
+    _atomic_write_json(os.path.join(store_path, META_FILE), meta)
+
+
+def _read_store(store_path: str, source: str, signature: Dict) -> Optional[Tuple[Dict, pd.DataFrame]]:
+    """Return (meta, frame) of a complete store of the source file as it is now, or None."""
+    # A missing, truncated or foreign file surfaces as one of these; all of them mean "rebuild"
+    try:
+        with open(os.path.join(store_path, META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if (
+            not isinstance(meta, dict)
+            or meta.get("version") != STORE_VERSION
+            or meta.get("source") != source
+            or meta.get("signature") != signature
+        ):
+            return None
+
+        def load(file_name):
+            array = np.load(os.path.join(store_path, file_name), allow_pickle=False)
+            if array.shape != (meta["rows"],):
+                raise ValueError(f"{file_name} does not hold {meta['rows']} rows")
+            return array
+
+        index = load(INDEX_FILE)
+        columns = {}
+        for column in meta["columns"]:
+            array = load(column["file"])
+            if column["kind"] == "datetime":
+                columns[column["name"]] = pd.Series(array, index=index).dt.tz_localize("UTC")
+            elif column["kind"] == "text":
+                values = array.astype(object)
+                values[load(column["missing_file"])] = np.nan
+                columns[column["name"]] = pd.Series(values, index=index)
+            else:
+                columns[column["name"]] = pd.Series(array, index=index)
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        return None
+    return meta, pd.DataFrame(columns, index=index)
+
+
+def load_statement_file(path: str) -> StatementFile:
+    """
+    Return a SimFin statement file partitioned by ticker, parsing it only if it changed.
+
+    Args:
+        path (str): Path of the ``us-{statement}-{freq}.csv`` file
+
+    Returns:
+        StatementFile: Point-in-time index of the file's current contents
+    """
+    path = os.path.abspath(path)
+    signature = _signature(path)
+
+    cached = _STATEMENT_CACHE.get(path)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    store_path = _store_path(path)
+    stored = _read_store(store_path, path, signature)
+    if stored is not None:
+        meta, frame = stored
+        spans = {ticker: tuple(span) for ticker, span in meta["spans"].items()}
+    else:
+        frame, spans = partition_statements(pd.read_csv(path, sep=";"))
+        _write_store(store_path, frame, spans, {"version": STORE_VERSION, "source": path, "signature": signature})
+
+    loaded = StatementFile(frame, spans, signature)
+    with _CACHE_LOCK:
+        _STATEMENT_CACHE[path] = loaded
+    return loaded
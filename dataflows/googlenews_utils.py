@@ -1,9 +1,11 @@
 import json
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import threading
 import time
-import random
+from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -12,23 +14,186 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+from .html_parsing import get_page_parser
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
     return response.status_code == 429
 
 
-@retry(
-    retry=(retry_if_result(is_rate_limited)),
-    wait=wait_exponential(multiplier=1, min=4, max=60),
-    stop=stop_after_attempt(5),
-)
-def make_request(url, headers):
-    """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
-    return response
+class TokenBucket:
+    """
+    Thread-safe token bucket: ``rate`` requests per second on average, at most ``capacity`` at once.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def parse_results_page(content: bytes) -> Tuple[List[Dict], bool]:
+    """
+    Extract the news results of a Google News search results page with the configured html_parser backend.
+
+    Args:
+        content (bytes): HTML of the page
+
+    Returns:
+        tuple: (results, whether the page links to a next page); a page without results has no next page
+    """
+    return get_page_parser()(content)
+
+
+class GoogleNewsClient:
+    """
+    Google News scraper sharing one pooled HTTP session and one rate limiter across threads.
+
+    Args:
+        base_url (str): Search endpoint, e.g. https://www.google.com/search or a local fake server
+        rate (float): Average number of requests per second
+        burst (int): Number of requests that may be sent at once
+        max_workers (int): Number of result pages fetched concurrently
+        max_pages (int): Maximum number of result pages per search
+        timeout (float): Timeout of a request, in seconds
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://www.google.com/search",
+        rate: float = 0.25,
+        burst: int = 3,
+        max_workers: int = 3,
+        max_pages: int = 10,
+        timeout: float = 30,
+    ):
+        self.base_url = base_url
+        self.max_workers = max(1, max_workers)
+        self.max_pages = max(1, max_pages)
+        self.timeout = timeout
+        self.limiter = TokenBucket(rate, burst)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(HEADERS)
+
+    @retry(
+        retry=(retry_if_result(is_rate_limited)),
+        wait=wait_exponential(multiplier=1, min=4, max=60),
+        stop=stop_after_attempt(5),
+    )
+    def request(self, url: str) -> requests.Response:
+        """Make a request with retry logic for rate limiting"""
+        self.limiter.acquire()
+        return self.session.get(url, timeout=self.timeout)
+
+    def page_url(self, query: str, start_date: str, end_date: str, page: int) -> str:
+        offset = page * 10
+        return (
+            f"{self.base_url}?q={query}"
+            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+            f"&tbm=nws&start={offset}"
+        )
+
+    def fetch_page(self, query: str, start_date: str, end_date: str, page: int) -> Tuple[List[Dict], bool]:
+        response = self.request(self.page_url(query, start_date, end_date, page))
+        return parse_results_page(response.content)
+
+    def search(self, query: str, start_date: str, end_date: str, limit: int = 10) -> List[Dict]:
+        """
+        Scrape the results of a search, page after page until a page has no next link or limit is reached.
+
+        The first page is fetched on its own, since it usually holds enough
+        results; later pages are fetched up to max_workers at a time and
+        consumed in page order, so the results are those of a sequential scrape.
+
+        Args:
+            query (str): Search query
+            start_date (str): Start date in mm/dd/yyyy format
+            end_date (str): End date in mm/dd/yyyy format
+            limit (int): Stop after the page on which this many results are reached
+
+        Returns:
+            list: Results as dicts with link, title, snippet, date and source
+        """
+        news_results = []
+        page = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while page < self.max_pages:
+                batch = 1 if page == 0 else min(self.max_workers, self.max_pages - page)
+                futures = [
+                    executor.submit(self.fetch_page, query, start_date, end_date, p)
+                    for p in range(page, page + batch)
+                ]
+                for future in futures:
+                    try:
+                        results_on_page, has_next = future.result()
+                    except Exception as e:
+                        print(f"Failed after multiple retries: {e}")
+                        return self._finish(futures, news_results)
+
+                    news_results.extend(results_on_page)
+                    # fetch top 10 news
+                    if not has_next or len(news_results) >= limit:
+                        return self._finish(futures, news_results)
+                page += batch
+        return news_results
+
+    @staticmethod
+    def _finish(futures, news_results: List[Dict]) -> List[Dict]:
+        # pages requested past the last one needed are dropped
+        for future in futures:
+            future.cancel()
+        return news_results
+
+
+_CLIENTS: Dict[tuple, GoogleNewsClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_news_client() -> GoogleNewsClient:
+    """Return the shared client for the current google_news_* settings."""
+    config = get_config()
+    settings = (
+        config.get("google_news_base_url", "https://www.google.com/search"),
+        config.get("google_news_rate", 0.25),
+        config.get("google_news_burst", 3),
+        config.get("google_news_max_workers", 3),
+        config.get("google_news_max_pages", 10),
+        config.get("google_news_timeout", 30),
+    )
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(settings)
+        if client is None:
+            client = GoogleNewsClient(*settings)
+            _CLIENTS[settings] = client
+    return client
 
 
 def getNewsData(query, start_date, end_date):
@@ -45,68 +210,4 @@ def getNewsData(query, start_date, end_date):
         end_date = datetime.strptime(end_date, "%Y-%m-%d")
         end_date = end_date.strftime("%m/%d/%Y")
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
-
-    news_results = []
-    page = 0
-    while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
-
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
-                break
-
-            #fetch top 10 news
-            if len(news_results) >= 10:
-                break
-
-            page += 1
-
-        except Exception as e:
-            print(f"Failed after multiple retries: {e}")
-            break
-
-    return news_results
+    return get_news_client().search(query, start_date, end_date)
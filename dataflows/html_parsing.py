@@ -0,0 +1,201 @@
+"""
+HTML Parsing Backends
+
+Pluggable parsing of Google News search result pages. The fastest installed
+backend is used: selectolax (Lexbor engine), then lxml (with the CSS
+selectors precompiled to XPath), then BeautifulSoup's ``html.parser``. The
+``html_parser`` setting pins a backend. Every backend is checked against
+``html.parser`` on the saved pages under ``tests/fixtures/google_news``.
+
+All backends extract the same fields with the same rules: a result is a
+``div.SoaBEf``; its link is the href of its first ``a``; title, snippet, date
+and source are the text of the first ``div.MBeuO``, ``.GI74Re``, ``.LfVVr``
+and ``.NUnG9d span`` inside it; a result missing any of them is skipped.
+Neither selectolax nor lxml is required.
+"""
+
+import re
+from typing import Callable, Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+from bs4.dammit import UnicodeDammit
+
+from .config import get_config
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    etree = None
+
+BACKENDS = ("selectolax", "lxml", "bs4")
+
+RESULT_SELECTOR = "div.SoaBEf"
+# (field, CSS selector) of the text fields of a result, in extraction order
+TEXT_FIELDS = [
+    ("title", "div.MBeuO"),
+    ("snippet", ".GI74Re"),
+    ("date", ".LfVVr"),
+    ("source", ".NUnG9d span"),
+]
+
+PageParser = Callable[[bytes], Tuple[List[Dict], bool]]
+
+# lxml refuses str input that starts with an XML declaration naming an encoding
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+def _result(link: str, texts: List[str]) -> Dict:
+    result = {"link": link}
+    for (field, _), text in zip(TEXT_FIELDS, texts):
+        result[field] = text
+    return result
+
+
+def _decode(content: bytes) -> str:
+    # Same encoding detection as BeautifulSoup, which the other backends must match
+    if isinstance(content, str):
+        return content
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return UnicodeDammit(content, is_html=True).unicode_markup
+
+
+def parse_page_bs4(content: bytes) -> Tuple[List[Dict], bool]:
+    """Parse a results page with BeautifulSoup's html.parser (always available)."""
+    soup = BeautifulSoup(content, "html.parser")
+    results_on_page = soup.select(RESULT_SELECTOR)
+
+    if not results_on_page:
+        return [], False  # No more results found
+
+    news_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            texts = [el.select_one(selector).get_text() for _, selector in TEXT_FIELDS]
+            news_results.append(_result(link, texts))
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    # Check for the "Next" link (pagination)
+    return news_results, soup.find("a", id="pnnext") is not None
+
+
+if etree is not None:
+
+    def _class_test(name: str) -> str:
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+    # The selectors above, compiled once
+    _LXML_RESULTS = etree.XPath(f"//div[{_class_test('SoaBEf')}]")
+    _LXML_LINK = etree.XPath("(.//a)[1]")
+    _LXML_FIELDS = [
+        etree.XPath(f"(.//div[{_class_test('MBeuO')}])[1]"),
+        etree.XPath(f"(.//*[{_class_test('GI74Re')}])[1]"),
+        etree.XPath(f"(.//*[{_class_test('LfVVr')}])[1]"),
+        etree.XPath(f"(.//*[{_class_test('NUnG9d')}]//span)[1]"),
+    ]
+    _LXML_NEXT = etree.XPath("//a[@id='pnnext']")
+
+    def _lxml_first(xpath, el, selector: str):
+        found = xpath(el)
+        if not found:
+            raise LookupError(f"no element matching {selector!r}")
+        return found[0]
+
+    def parse_page_lxml(content: bytes) -> Tuple[List[Dict], bool]:
+        """Parse a results page with lxml and precompiled XPath selectors."""
+        text = _XML_DECLARATION.sub("", _decode(content), count=1)
+        if not text.strip():
+            return [], False
+        root = lxml.html.fromstring(text)
+        results_on_page = _LXML_RESULTS(root)
+
+        if not results_on_page:
+            return [], False  # No more results found
+
+        news_results = []
+        for el in results_on_page:
+            try:
+                link = _lxml_first(_LXML_LINK, el, "a").attrib["href"]
+                texts = [
+                    "".join(_lxml_first(xpath, el, selector).itertext())
+                    for xpath, (_, selector) in zip(_LXML_FIELDS, TEXT_FIELDS)
+                ]
+                news_results.append(_result(link, texts))
+            except Exception as e:
+                print(f"Error processing result: {e}")
+                continue
+
+        return news_results, bool(_LXML_NEXT(root))
+
+
+if SelectolaxParser is not None:
+
+    def parse_page_selectolax(content: bytes) -> Tuple[List[Dict], bool]:
+        """Parse a results page with selectolax."""
+        tree = SelectolaxParser(_decode(content))
+        results_on_page = tree.css(RESULT_SELECTOR)
+
+        if not results_on_page:
+            return [], False  # No more results found
+
+        news_results = []
+        for el in results_on_page:
+            try:
+                anchor = el.css_first("a")
+                if anchor is None:
+                    raise LookupError("no element matching 'a'")
+                link = anchor.attributes["href"]
+                texts = []
+                for _, selector in TEXT_FIELDS:
+                    node = el.css_first(selector)
+                    if node is None:
+                        raise LookupError(f"no element matching {selector!r}")
+                    texts.append(node.text(deep=True))
+                news_results.append(_result(link, texts))
+            except Exception as e:
+                print(f"Error processing result: {e}")
+                continue
+
+        return news_results, tree.css_first("a#pnnext") is not None
+
+
+def get_backend() -> str:
+    """
+    Return the backend in use: the ``html_parser`` setting, or the fastest installed one for "auto".
+
+    Raises:
+        ValueError: If the configured backend is unknown or not installed
+    """
+    name = get_config().get("html_parser", "auto")
+    if name == "auto":
+        if SelectolaxParser is not None:
+            return "selectolax"
+        if etree is not None:
+            return "lxml"
+        return "bs4"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown html_parser {name}. Please choose from: {['auto', *BACKENDS]}")
+    if (name == "selectolax" and SelectolaxParser is None) or (name == "lxml" and etree is None):
+        raise ValueError(f"html_parser {name} is configured but not installed")
+    return name
+
+
+def get_page_parser(backend: str = None) -> PageParser:
+    """Return the results page parser of a backend (default: the one in use)."""
+    backend = backend or get_backend()
+    if backend == "selectolax":
+        return parse_page_selectolax
+    if backend == "lxml":
+        return parse_page_lxml
+    return parse_page_bs4
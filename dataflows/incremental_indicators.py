@@ -0,0 +1,551 @@
+"""
+Incremental Technical Indicators
+
+Streaming versions of the indicators in ``dataflows.indicators``: each object
+keeps the rolling state of one (symbol, indicator) pair (EMA accumulators,
+Wilder-smoothed gains/losses, fixed-size ring buffers) and folds in each new
+daily bar in constant time instead of recomputing the whole history.
+
+A bar with a missing (NaN) value is skipped the way the vectorized
+functions skip it: it takes its slot in a rolling window and decays the
+exponential averages without adding to them, so a gap in the data does not
+poison the state for the bars after it.
+
+States are plain JSON, so a restarted process can reload them with
+``IndicatorStateStore`` and continue from the last consumed bar.
+"""
+
+import json
+import math
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+
+from .config import get_config
+from .indicators import (
+    BOLL_STD_TIMES,
+    DEFAULT_WINDOWS,
+    MACD_WINDOWS,
+    MOVING_AVERAGE_PATTERN,
+    WINDOWED_PATTERN,
+)
+
+
+def _bar_value(bar: Mapping, name: str) -> float:
+    for key in (name, name.capitalize()):
+        if key in bar:
+            return float(bar[key])
+    raise KeyError(f"Bar has no '{name}' field")
+
+
+def _to_json(x: float) -> Optional[float]:
+    return None if math.isnan(x) else x
+
+
+def _from_json(x: Optional[float]) -> float:
+    return math.nan if x is None else x
+
+
+def _bar_date(bar: Mapping) -> Optional[str]:
+    for key in ("date", "Date"):
+        if key in bar and bar[key] is not None:
+            return str(bar[key])[:10]
+    return None
+
+
+class _EWM:
+    """
+    Adjusted exponentially weighted mean: numerator/denominator accumulators.
+
+    A NaN decays both accumulators without adding to them, like pandas'
+    ``ewm(adjust=True, ignore_na=False)``.
+    """
+
+    def __init__(self, alpha: float, numerator: float = 0.0, denominator: float = 0.0):
+        self.alpha = alpha
+        self.numerator = numerator
+        self.denominator = denominator
+
+    def update(self, x: float) -> float:
+        decay = 1.0 - self.alpha
+        self.numerator *= decay
+        self.denominator *= decay
+        if not math.isnan(x):
+            self.numerator += x
+            self.denominator += 1.0
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return self.numerator / self.denominator if self.denominator > 0 else math.nan
+
+    @property
+    def started(self) -> bool:
+        """Whether a non-NaN value has been consumed."""
+        return self.denominator > 0
+
+    def to_dict(self) -> Dict:
+        return {"alpha": self.alpha, "numerator": self.numerator, "denominator": self.denominator}
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> "_EWM":
+        return cls(state["alpha"], state["numerator"], state["denominator"])
+
+
+class _RingBuffer:
+    """
+    Fixed-size window with running sum and sum of squares of its non-NaN values.
+
+    Sums are kept relative to a reference value and rebuilt from the buffer
+    once per full rotation, so floating point drift stays bounded while each
+    update remains O(1) amortized. NaN values occupy their slot but are not
+    counted, like pandas' rolling windows with min_periods=1.
+    """
+
+    def __init__(self, window: int, values=None, position: int = 0, count: int = 0):
+        self.window = window
+        self.values = [_from_json(v) for v in values] if values is not None else [0.0] * window
+        self.position = position
+        self.count = count
+        self._rebuild()
+
+    def _rebuild(self):
+        valid = [v for v in self.filled() if not math.isnan(v)]
+        self.valid = len(valid)
+        self.reference = valid[-1] if valid else 0.0
+        self.sum = sum(v - self.reference for v in valid)
+        self.sum_sq = sum((v - self.reference) ** 2 for v in valid)
+        self.updates_since_rebuild = 0
+
+    def filled(self):
+        if self.count < self.window:
+            return self.values[:self.count]
+        return self.values[self.position:] + self.values[:self.position]
+
+    def push(self, x: float):
+        if self.count == self.window:
+            old = self.values[self.position]
+            if not math.isnan(old):
+                old -= self.reference
+                self.sum -= old
+                self.sum_sq -= old * old
+                self.valid -= 1
+        else:
+            self.count += 1
+        self.values[self.position] = x
+        self.position = (self.position + 1) % self.window
+        if not math.isnan(x):
+            delta = x - self.reference
+            self.sum += delta
+            self.sum_sq += delta * delta
+            self.valid += 1
+
+        self.updates_since_rebuild += 1
+        if self.updates_since_rebuild >= self.window:
+            self._rebuild()
+
+    @property
+    def total(self) -> float:
+        return self.sum + self.valid * self.reference if self.valid else math.nan
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.valid if self.valid else math.nan
+
+    @property
+    def std(self) -> float:
+        if self.valid < 2:
+            return math.nan
+        variance = (self.sum_sq - self.sum * self.sum / self.valid) / (self.valid - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def to_dict(self) -> Dict:
+        return {
+            "window": self.window,
+            "values": [_to_json(v) for v in self.values],
+            "position": self.position,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> "_RingBuffer":
+        return cls(state["window"], state["values"], state["position"], state["count"])
+
+
+class IncrementalIndicator(ABC):
+    """
+    Base class for streaming indicators.
+
+    Subclasses implement ``_consume(bar)`` and the ``_state``/``_load_state``
+    pair used for serialization. ``update`` skips bars that are not newer than
+    the last consumed date, so replaying overlapping history is harmless.
+    """
+
+    def __init__(self, indicator: str):
+        self.indicator = indicator
+        self.last_date: Optional[str] = None
+        self.value = math.nan
+
+    def update(self, bar: Mapping) -> float:
+        """
+        Consume one bar and return the indicator value after it.
+
+        Args:
+            bar: Mapping with close (and high, low, volume where needed) and an optional date
+
+        Returns:
+            float: Current indicator value
+        """
+        date = _bar_date(bar)
+        if date is not None and self.last_date is not None and date <= self.last_date:
+            return self.value
+        self.value = float(self._consume(bar))
+        if date is not None:
+            self.last_date = date
+        return self.value
+
+    def update_from_series(self, data) -> float:
+        """Consume every row of a PriceSeries or DataFrame newer than the last consumed bar."""
+        if hasattr(data, "dates"):
+            dates = np.datetime_as_string(data.dates, unit="D")
+        else:
+            dates = data["Date"].astype(str).str[:10].values
+        start = 0
+        if self.last_date is not None:
+            start = int(np.searchsorted(dates, self.last_date, side="right"))
+
+        fields = {}
+        for name in ("close", "high", "low", "volume"):
+            for key in (name, name.capitalize()):
+                try:
+                    fields[name] = np.asarray(data[key], dtype=np.float64)
+                    break
+                except KeyError:
+                    continue
+
+        for i in range(start, len(dates)):
+            bar = {name: values[i] for name, values in fields.items()}
+            bar["date"] = dates[i]
+            self.update(bar)
+        return self.value
+
+    @abstractmethod
+    def _consume(self, bar: Mapping) -> float:
+        """Fold one bar into the state and return the indicator value after it."""
+
+    @abstractmethod
+    def _state(self) -> Dict:
+        """JSON-serializable rolling state."""
+
+    @abstractmethod
+    def _load_state(self, state: Dict):
+        """Restore the rolling state written by ``_state``."""
+
+    def to_dict(self) -> Dict:
+        return {
+            "indicator": self.indicator,
+            "last_date": self.last_date,
+            "value": _to_json(self.value),
+            "state": self._state(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict) -> "IncrementalIndicator":
+        indicator = create_incremental_indicator(payload["indicator"])
+        indicator.last_date = payload.get("last_date")
+        indicator.value = _from_json(payload.get("value"))
+        indicator._load_state(payload["state"])
+        return indicator
+
+
+class SMAIndicator(IncrementalIndicator):
+    def __init__(self, indicator: str, window: int):
+        super().__init__(indicator)
+        self.buffer = _RingBuffer(window)
+
+    def _consume(self, bar):
+        self.buffer.push(_bar_value(bar, "close"))
+        return self.buffer.mean
+
+    def _state(self):
+        return {"buffer": self.buffer.to_dict()}
+
+    def _load_state(self, state):
+        self.buffer = _RingBuffer.from_dict(state["buffer"])
+
+
+class EMAIndicator(IncrementalIndicator):
+    def __init__(self, indicator: str, window: int):
+        super().__init__(indicator)
+        self.ema = _EWM(2.0 / (window + 1.0))
+
+    def _consume(self, bar):
+        return self.ema.update(_bar_value(bar, "close"))
+
+    def _state(self):
+        return {"ema": self.ema.to_dict()}
+
+    def _load_state(self, state):
+        self.ema = _EWM.from_dict(state["ema"])
+
+
+class MACDIndicator(IncrementalIndicator):
+    def __init__(self, indicator: str):
+        super().__init__(indicator)
+        fast, slow, signal = MACD_WINDOWS
+        self.fast = _EWM(2.0 / (fast + 1.0))
+        self.slow = _EWM(2.0 / (slow + 1.0))
+        self.signal = _EWM(2.0 / (signal + 1.0))
+
+    def _consume(self, bar):
+        close = _bar_value(bar, "close")
+        line = self.fast.update(close) - self.slow.update(close)
+        signal_line = self.signal.update(line)
+        return {"macd": line, "macds": signal_line, "macdh": line - signal_line}[self.indicator]
+
+    def _state(self):
+        return {"fast": self.fast.to_dict(), "slow": self.slow.to_dict(), "signal": self.signal.to_dict()}
+
+    def _load_state(self, state):
+        self.fast = _EWM.from_dict(state["fast"])
+        self.slow = _EWM.from_dict(state["slow"])
+        self.signal = _EWM.from_dict(state["signal"])
+
+
+class RSIIndicator(IncrementalIndicator):
+    def __init__(self, indicator: str, window: int):
+        super().__init__(indicator)
+        self.up = _EWM(1.0 / window)
+        self.down = _EWM(1.0 / window)
+        self.prev_close = math.nan
+
+    def _consume(self, bar):
+        close = _bar_value(bar, "close")
+        first = not self.up.started and not math.isnan(close)
+        diff = 0.0 if first else close - self.prev_close
+        self.prev_close = close
+        if math.isnan(diff):
+            up = self.up.update(math.nan)
+            down = self.down.update(math.nan)
+        else:
+            up = self.up.update(diff if diff > 0 else 0.0)
+            down = self.down.update(-diff if diff < 0 else 0.0)
+        total = up + down
+        if first or total == 0:
+            return 50.0
+        return 100 * (up / total)
+
+    def _state(self):
+        return {"up": self.up.to_dict(), "down": self.down.to_dict(), "prev_close": _to_json(self.prev_close)}
+
+    def _load_state(self, state):
+        self.up = _EWM.from_dict(state["up"])
+        self.down = _EWM.from_dict(state["down"])
+        self.prev_close = _from_json(state["prev_close"])
+
+
+class BollingerIndicator(IncrementalIndicator):
+    def __init__(self, indicator: str, window: int = DEFAULT_WINDOWS["boll"]):
+        super().__init__(indicator)
+        self.buffer = _RingBuffer(window)
+
+    def _consume(self, bar):
+        self.buffer.push(_bar_value(bar, "close"))
+        middle = self.buffer.mean
+        if self.indicator == "boll":
+            return middle
+        width = BOLL_STD_TIMES * self.buffer.std
+        return middle + width if self.indicator == "boll_ub" else middle - width
+
+    def _state(self):
+        return {"buffer": self.buffer.to_dict()}
+
+    def _load_state(self, state):
+        self.buffer = _RingBuffer.from_dict(state["buffer"])
+
+
+class ATRIndicator(IncrementalIndicator):
+    def __init__(self, indicator: str, window: int):
+        super().__init__(indicator)
+        self.tr = _EWM(1.0 / window)
+        self.prev_close = math.nan
+
+    def _consume(self, bar):
+        high, low, close = _bar_value(bar, "high"), _bar_value(bar, "low"), _bar_value(bar, "close")
+        prev_close = self.prev_close if self.tr.started else close
+        self.prev_close = close
+        if math.isnan(close):
+            return self.tr.update(math.nan)
+        ranges = (high - low, abs(high - prev_close), abs(low - prev_close))
+        # a missing high, low or previous close counts as no range, like indicators.true_range
+        tr = 0.0 if any(math.isnan(r) for r in ranges) else max(ranges)
+        return self.tr.update(tr)
+
+    def _state(self):
+        return {"tr": self.tr.to_dict(), "prev_close": _to_json(self.prev_close)}
+
+    def _load_state(self, state):
+        self.tr = _EWM.from_dict(state["tr"])
+        self.prev_close = _from_json(state["prev_close"])
+
+
+class VWMAIndicator(IncrementalIndicator):
+    def __init__(self, indicator: str, window: int):
+        super().__init__(indicator)
+        self.price_volume = _RingBuffer(window)
+        self.volume = _RingBuffer(window)
+
+    def _consume(self, bar):
+        high, low, close = _bar_value(bar, "high"), _bar_value(bar, "low"), _bar_value(bar, "close")
+        volume = _bar_value(bar, "volume")
+        self.price_volume.push(volume * (close + high + low) / 3.0)
+        self.volume.push(volume)
+        total_volume = self.volume.total
+        return self.price_volume.total / total_volume if total_volume != 0 else 0.0
+
+    def _state(self):
+        return {"price_volume": self.price_volume.to_dict(), "volume": self.volume.to_dict()}
+
+    def _load_state(self, state):
+        self.price_volume = _RingBuffer.from_dict(state["price_volume"])
+        self.volume = _RingBuffer.from_dict(state["volume"])
+
+
+class MFIIndicator(IncrementalIndicator):
+    def __init__(self, indicator: str, window: int):
+        super().__init__(indicator)
+        self.window = window
+        self.positive = _RingBuffer(window)
+        self.negative = _RingBuffer(window)
+        self.prev_tp = math.nan
+        # bars consumed since the first valid typical price
+        self.bars = 0
+
+    def _consume(self, bar):
+        high, low, close = _bar_value(bar, "high"), _bar_value(bar, "low"), _bar_value(bar, "close")
+        tp = (close + high + low) / 3.0
+        money_flow = tp * _bar_value(bar, "volume")
+        if self.bars == 0 and math.isnan(tp):
+            self.positive.push(math.nan)
+            self.negative.push(math.nan)
+            return math.nan
+
+        diff = 0.0 if self.bars == 0 else tp - self.prev_tp
+        self.prev_tp = tp
+        if math.isnan(diff):
+            self.positive.push(math.nan)
+            self.negative.push(math.nan)
+        else:
+            self.positive.push(money_flow if diff > 0 else 0.0)
+            self.negative.push(money_flow if diff < 0 else 0.0)
+        self.bars += 1
+
+        if self.bars <= self.window:
+            return 0.5
+        if math.isnan(diff):
+            return math.nan
+        positive = self.positive.total
+        total = positive + self.negative.total
+        return positive / total if total > 0 else 0.5
+
+    def _state(self):
+        return {
+            "positive": self.positive.to_dict(),
+            "negative": self.negative.to_dict(),
+            "prev_tp": _to_json(self.prev_tp),
+            "bars": self.bars,
+        }
+
+    def _load_state(self, state):
+        self.positive = _RingBuffer.from_dict(state["positive"])
+        self.negative = _RingBuffer.from_dict(state["negative"])
+        self.prev_tp = _from_json(state["prev_tp"])
+        self.bars = state["bars"]
+
+
+def create_incremental_indicator(indicator: str) -> IncrementalIndicator:
+    """
+    Create an empty streaming indicator from a stockstats-style name.
+
+    Raises:
+        ValueError: If the indicator has no incremental implementation
+    """
+    match = MOVING_AVERAGE_PATTERN.match(indicator)
+    if match:
+        window = int(match.group(1))
+        if match.group(2) == "sma":
+            return SMAIndicator(indicator, window)
+        return EMAIndicator(indicator, window)
+
+    if indicator in ("macd", "macds", "macdh"):
+        return MACDIndicator(indicator)
+    if indicator in ("boll", "boll_ub", "boll_lb"):
+        return BollingerIndicator(indicator)
+
+    match = WINDOWED_PATTERN.match(indicator)
+    if match:
+        name = match.group(1)
+        window = int(match.group(2)) if match.group(2) else DEFAULT_WINDOWS[name]
+        return {
+            "rsi": RSIIndicator,
+            "atr": ATRIndicator,
+            "vwma": VWMAIndicator,
+            "mfi": MFIIndicator,
+        }[name](indicator, window)
+
+    raise ValueError(f"Indicator {indicator} has no incremental implementation")
+
+
+class IndicatorStateStore:
+    """
+    On-disk registry of incremental indicator states, one JSON file per (symbol, indicator).
+
+    Example:
+        store = IndicatorStateStore()
+        rsi = store.get("AAPL", "rsi")
+        rsi.update({"date": "2025-08-22", "close": 227.8})
+        store.save("AAPL", rsi)
+    """
+
+    def __init__(self, state_dir: Optional[str] = None):
+        if state_dir is None:
+            config = get_config()
+            state_dir = config.get(
+                "indicator_state_dir",
+                os.path.join(config["data_cache_dir"], "indicator_state"),
+            )
+        self.state_dir = state_dir
+        self._indicators: Dict[tuple, IncrementalIndicator] = {}
+
+    def _path(self, symbol: str, indicator: str) -> str:
+        return os.path.join(self.state_dir, symbol, f"{indicator}.json")
+
+    def get(self, symbol: str, indicator: str) -> IncrementalIndicator:
+        """Return the live state for (symbol, indicator), loading it from disk or creating it."""
+        key = (symbol, indicator)
+        if key not in self._indicators:
+            path = self._path(symbol, indicator)
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    self._indicators[key] = IncrementalIndicator.from_dict(json.load(f))
+            else:
+                self._indicators[key] = create_incremental_indicator(indicator)
+        return self._indicators[key]
+
+    def update(self, symbol: str, indicator: str, bar: Mapping) -> float:
+        """Feed one bar to the (symbol, indicator) state and persist it."""
+        state = self.get(symbol, indicator)
+        value = state.update(bar)
+        self.save(symbol, state)
+        return value
+
+    def save(self, symbol: str, state: IncrementalIndicator):
+        """Atomically write a state to disk."""
+        path = self._path(symbol, state.indicator)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state.to_dict(), f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,352 @@
+"""
+Vectorized Technical Indicators
+
+Native NumPy implementations of the indicator set advertised to the market
+analyst (moving averages, MACD, RSI, Bollinger bands, ATR, VWMA and MFI).
+
+Every function works along axis 0 on contiguous float64 arrays, so the same
+code handles a single price series (1-D) or a dates x symbols panel (2-D).
+Missing values (NaN) are skipped the way pandas' rolling/ewm functions skip
+them, which keeps a symbol that starts trading late in a panel identical to
+the same symbol computed on its own.
+
+The formulas follow stockstats (min_periods=1 rolling windows, adjusted EMAs,
+Wilder smoothing for RSI/ATR), so ``compute_indicator`` can stand in for
+``stockstats.wrap(df)[indicator]``.
+"""
+
+import re
+from typing import Mapping, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Keep decay ** -chunk_length below this bound in the chunked EMA recurrence
+_MAX_SCALE_EXPONENT = 100 * np.log(10)
+# Upper bound on the number of elements materialized per rolling-std block
+_BLOCK_ELEMENTS = 1 << 22
+
+DEFAULT_WINDOWS = {
+    "rsi": 14,
+    "atr": 14,
+    "vwma": 14,
+    "mfi": 14,
+    "boll": 20,
+}
+BOLL_STD_TIMES = 2
+MACD_WINDOWS = (12, 26, 9)
+
+MOVING_AVERAGE_PATTERN = re.compile(r"^close_(\d+)_(sma|ema)$")
+WINDOWED_PATTERN = re.compile(r"^(rsi|atr|vwma|mfi)(?:_(\d+))?$")
+
+
+def _as_2d(values) -> Tuple[np.ndarray, bool]:
+    array = np.ascontiguousarray(values, dtype=np.float64)
+    if array.ndim == 1:
+        return array[:, None], True
+    return array, False
+
+
+def _restore(array: np.ndarray, squeeze: bool) -> np.ndarray:
+    return array[:, 0] if squeeze else array
+
+
+def _first_valid_rows(x: np.ndarray) -> np.ndarray:
+    """Row index of the first non-NaN value in every column (len(x) if none)."""
+    valid = ~np.isnan(x)
+    first = valid.argmax(axis=0)
+    first[~valid.any(axis=0)] = x.shape[0]
+    return first
+
+
+def _linear_recurrence(x: np.ndarray, decay: float) -> np.ndarray:
+    """
+    Solve y[t] = decay * y[t-1] + x[t] (with y[-1] = 0) along axis 0.
+
+    Inside a chunk the recurrence is a scaled cumulative sum; chunks are kept
+    short enough that decay ** -length cannot overflow, and the last value of
+    each chunk is carried into the next one.
+    """
+    n = x.shape[0]
+    y = np.empty_like(x)
+    if n == 0:
+        return y
+    if decay == 0.0:
+        y[:] = x
+        return y
+
+    chunk = n if decay == 1.0 else max(1, min(n, int(_MAX_SCALE_EXPONENT / -np.log(decay))))
+    steps = np.arange(chunk, dtype=np.float64)[:, None]
+    inv_powers = decay ** -steps
+    powers = decay ** steps
+
+    carry = np.zeros(x.shape[1:])
+    for lo in range(0, n, chunk):
+        block = x[lo:lo + chunk]
+        length = block.shape[0]
+        scaled = np.cumsum(block * inv_powers[:length], axis=0)
+        y[lo:lo + length] = powers[:length] * (scaled + decay * carry)
+        carry = y[lo + length - 1]
+    return y
+
+
+def _ewm_mean(values, alpha: float) -> np.ndarray:
+    """pandas ``ewm(alpha=alpha, adjust=True, ignore_na=False, min_periods=1).mean()``."""
+    x, squeeze = _as_2d(values)
+    valid = ~np.isnan(x)
+    decay = 1.0 - alpha
+    numerator = _linear_recurrence(np.where(valid, x, 0.0), decay)
+    denominator = _linear_recurrence(valid.astype(np.float64), decay)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(denominator > 0, numerator / denominator, np.nan)
+    return _restore(out, squeeze)
+
+
+def ema(values, window: int) -> np.ndarray:
+    """Exponential moving average with span ``window``."""
+    return _ewm_mean(values, 2.0 / (window + 1.0))
+
+
+def smma(values, window: int) -> np.ndarray:
+    """Smoothed (Wilder) moving average, an EMA with alpha = 1 / window."""
+    return _ewm_mean(values, 1.0 / window)
+
+
+def _rolling_sum_count(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    valid = ~np.isnan(x)
+    # Offsetting each column by its first value keeps the running sums small
+    first = _first_valid_rows(x)
+    offset = np.where(first < x.shape[0], x[np.minimum(first, x.shape[0] - 1), np.arange(x.shape[1])], 0.0)
+    centered = np.where(valid, x - offset, 0.0)
+
+    sums = np.cumsum(centered, axis=0)
+    counts = np.cumsum(valid, axis=0, dtype=np.int64)
+    sums[window:] = sums[window:] - sums[:-window]
+    counts[window:] = counts[window:] - counts[:-window]
+    return sums + counts * offset, counts
+
+
+def moving_sum(values, window: int) -> np.ndarray:
+    """Rolling sum over ``window`` rows with min_periods=1."""
+    x, squeeze = _as_2d(values)
+    if x.shape[0] == 0:
+        return _restore(x.copy(), squeeze)
+    sums, counts = _rolling_sum_count(x, window)
+    return _restore(np.where(counts > 0, sums, np.nan), squeeze)
+
+
+def sma(values, window: int) -> np.ndarray:
+    """Simple moving average over ``window`` rows with min_periods=1."""
+    x, squeeze = _as_2d(values)
+    if x.shape[0] == 0:
+        return _restore(x.copy(), squeeze)
+    sums, counts = _rolling_sum_count(x, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(counts > 0, sums / counts, np.nan)
+    return _restore(out, squeeze)
+
+
+def moving_std(values, window: int) -> np.ndarray:
+    """Rolling sample standard deviation (ddof=1) over ``window`` rows with min_periods=1."""
+    x, squeeze = _as_2d(values)
+    n, m = x.shape
+    out = np.full_like(x, np.nan)
+    if n == 0:
+        return _restore(out, squeeze)
+
+    mean = sma(x, window)
+    padded = np.concatenate([np.full((window - 1, m), np.nan), x])
+    windows = sliding_window_view(padded, window, axis=0)  # (n, m, window)
+
+    # Deviations are taken from each window's own mean (two-pass), in row
+    # blocks so a wide panel never materializes n * m * window values at once.
+    step = max(1, _BLOCK_ELEMENTS // max(1, m * window))
+    for lo in range(0, n, step):
+        deviations = windows[lo:lo + step] - mean[lo:lo + step, :, None]
+        valid = ~np.isnan(deviations)
+        squares = np.where(valid, deviations * deviations, 0.0).sum(axis=2)
+        counts = valid.sum(axis=2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[lo:lo + step] = np.where(counts > 1, np.sqrt(squares / (counts - 1)), np.nan)
+    return _restore(out, squeeze)
+
+
+def _diff_from_previous(x: np.ndarray) -> np.ndarray:
+    """x[t] - x[t-1], with 0 on each column's first valid row and NaN where x is NaN."""
+    diff = np.full_like(x, np.nan)
+    if x.shape[0] == 0:
+        return diff
+    diff[1:] = x[1:] - x[:-1]
+    first = _first_valid_rows(x)
+    has_value = first < x.shape[0]
+    diff[first[has_value], np.flatnonzero(has_value)] = 0.0
+    return diff
+
+
+def macd(close, fast: int = MACD_WINDOWS[0], slow: int = MACD_WINDOWS[1], signal: int = MACD_WINDOWS[2]):
+    """
+    Moving Average Convergence Divergence.
+
+    Returns:
+        tuple: (macd line, signal line, histogram)
+    """
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def rsi(close, window: int = DEFAULT_WINDOWS["rsi"]) -> np.ndarray:
+    """Relative Strength Index using Wilder smoothing of gains and losses."""
+    x, squeeze = _as_2d(close)
+    diff = _diff_from_previous(x)
+    missing = np.isnan(diff)
+    up = np.where(missing, np.nan, np.where(diff > 0, diff, 0.0))
+    down = np.where(missing, np.nan, np.where(diff < 0, -diff, 0.0))
+    up_avg = smma(up, window)
+    down_avg = smma(down, window)
+
+    total = up_avg + down_avg
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * (up_avg / total), 50.0)
+    out[np.isnan(total)] = np.nan
+
+    first = _first_valid_rows(x)
+    has_value = first < x.shape[0]
+    out[first[has_value], np.flatnonzero(has_value)] = 50.0
+    return _restore(out, squeeze)
+
+
+def bollinger(close, window: int = DEFAULT_WINDOWS["boll"], std_times: float = BOLL_STD_TIMES):
+    """
+    Bollinger bands.
+
+    Returns:
+        tuple: (middle band, upper band, lower band)
+    """
+    middle = sma(close, window)
+    width = std_times * moving_std(close, window)
+    return middle, middle + width, middle - width
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """True range; the first row of each column uses its own close as the previous close."""
+    h, squeeze = _as_2d(high)
+    l, _ = _as_2d(low)
+    c, _ = _as_2d(close)
+
+    prev_close = np.full_like(c, np.nan)
+    prev_close[1:] = c[:-1]
+    first = _first_valid_rows(c)
+    has_value = first < c.shape[0]
+    columns = np.flatnonzero(has_value)
+    prev_close[first[has_value], columns] = c[first[has_value], columns]
+
+    tr = np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)))
+    tr = np.where(np.isnan(c), np.nan, np.nan_to_num(tr))
+    return _restore(tr, squeeze)
+
+
+def atr(high, low, close, window: int = DEFAULT_WINDOWS["atr"]) -> np.ndarray:
+    """Average true range (Wilder smoothing of the true range)."""
+    return smma(true_range(high, low, close), window)
+
+
+def typical_price(high, low, close) -> np.ndarray:
+    return (np.asarray(close, dtype=np.float64) + np.asarray(high, dtype=np.float64) + np.asarray(low, dtype=np.float64)) / 3.0
+
+
+def vwma(high, low, close, volume, window: int = DEFAULT_WINDOWS["vwma"]) -> np.ndarray:
+    """Volume weighted moving average of the typical price."""
+    volume = np.asarray(volume, dtype=np.float64)
+    rolling_tpv = moving_sum(volume * typical_price(high, low, close), window)
+    rolling_volume = moving_sum(volume, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rolling_volume != 0, rolling_tpv / rolling_volume, 0.0)
+
+
+def mfi(high, low, close, volume, window: int = DEFAULT_WINDOWS["mfi"]) -> np.ndarray:
+    """Money flow index, 0.5 for the first ``window`` rows like stockstats."""
+    tp, squeeze = _as_2d(typical_price(high, low, close))
+    vol, _ = _as_2d(volume)
+    raw_money_flow = tp * vol
+
+    tp_diff = _diff_from_previous(tp)
+    missing = np.isnan(tp_diff)
+    pos_flow = np.where(missing, np.nan, np.where(tp_diff > 0, raw_money_flow, 0.0))
+    neg_flow = np.where(missing, np.nan, np.where(tp_diff < 0, raw_money_flow, 0.0))
+
+    pos_sum, _ = _as_2d(moving_sum(pos_flow, window))
+    neg_sum, _ = _as_2d(moving_sum(neg_flow, window))
+    total_flow = pos_sum + neg_sum
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total_flow > 0, pos_sum / total_flow, 0.5)
+    out[missing] = np.nan
+
+    rows = np.arange(tp.shape[0])[:, None]
+    first = _first_valid_rows(tp)[None, :]
+    out[(rows >= first) & (rows < first + window)] = 0.5
+    return _restore(out, squeeze)
+
+
+def is_supported(indicator: str) -> bool:
+    """Whether ``compute_indicator`` has a native implementation for ``indicator``."""
+    return bool(
+        MOVING_AVERAGE_PATTERN.match(indicator)
+        or WINDOWED_PATTERN.match(indicator)
+        or indicator in ("macd", "macds", "macdh", "boll", "boll_ub", "boll_lb")
+    )
+
+
+def _column(data: Mapping, name: str) -> np.ndarray:
+    for key in (name, name.capitalize()):
+        try:
+            return np.asarray(data[key], dtype=np.float64)
+        except KeyError:
+            continue
+    raise KeyError(f"Price data has no '{name}' column")
+
+
+def compute_indicator(indicator: str, data: Mapping) -> np.ndarray:
+    """
+    Compute a stockstats-named indicator from price columns.
+
+    Args:
+        indicator (str): Indicator name as understood by stockstats, e.g. close_50_sma, macdh, rsi, atr
+        data: Mapping (DataFrame, PriceSeries, dict) with close/high/low/volume columns,
+              lowercase or capitalized, as 1-D series or dates x symbols arrays
+
+    Returns:
+        np.ndarray: Indicator values aligned with the input rows
+
+    Raises:
+        ValueError: If the indicator has no native implementation
+    """
+    match = MOVING_AVERAGE_PATTERN.match(indicator)
+    if match:
+        window, kind = int(match.group(1)), match.group(2)
+        close = _column(data, "close")
+        return sma(close, window) if kind == "sma" else ema(close, window)
+
+    if indicator in ("macd", "macds", "macdh"):
+        line, signal_line, histogram = macd(_column(data, "close"))
+        return {"macd": line, "macds": signal_line, "macdh": histogram}[indicator]
+
+    if indicator in ("boll", "boll_ub", "boll_lb"):
+        middle, upper, lower = bollinger(_column(data, "close"))
+        return {"boll": middle, "boll_ub": upper, "boll_lb": lower}[indicator]
+
+    match = WINDOWED_PATTERN.match(indicator)
+    if match:
+        name = match.group(1)
+        window = int(match.group(2)) if match.group(2) else DEFAULT_WINDOWS[name]
+        if name == "rsi":
+            return rsi(_column(data, "close"), window)
+        high, low, close = _column(data, "high"), _column(data, "low"), _column(data, "close")
+        if name == "atr":
+            return atr(high, low, close, window)
+        volume = _column(data, "volume")
+        if name == "vwma":
+            return vwma(high, low, close, volume, window)
+        return mfi(high, low, close, volume, window)
+
+    raise ValueError(f"Indicator {indicator} has no native implementation")
@@ -1,16 +1,23 @@
-from typing import Annotated, Dict
-from .reddit_utils import fetch_top_from_category
+from typing import Annotated, Dict, List
+from .reddit_utils import fetch_top_from_category_range
 from .yfin_utils import *
 from .stockstats_utils import *
 from .googlenews_utils import *
+from .news_cache import get_cached_news_data
 from .finnhub_utils import get_data_in_range
+from .finnhub_records import InsiderSentiment, InsiderTransaction, unique_records
+from .fundamentals_store import load_statement_file
+from .price_store import load_price_series
+from .catalog import get_catalog
+from .price_panel import load_price_panel
+from .price_service import get_price_service
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import os
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
 import yfinance as yf
 from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
@@ -96,13 +103,9 @@ def get_finnhub_company_insider_sentiment(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    result_str = "".join(
+        record.to_markdown() for record in unique_records(data, InsiderSentiment)
+    )
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -137,14 +140,9 @@ def get_finnhub_company_insider_transactions(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    result_str = "".join(
+        record.to_markdown() for record in unique_records(data, InsiderTransaction)
+    )
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -161,35 +159,15 @@ def get_simfin_balance_sheet(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    data_path = get_catalog(DATA_DIR).simfin_path("balance_sheet", freq)
+    # Most recent statement published on or before the current date
+    latest_balance_sheet = load_statement_file(data_path).latest(ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -208,35 +186,15 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    data_path = get_catalog(DATA_DIR).simfin_path("cash_flow", freq)
+    # Most recent statement published on or before the current date
+    latest_cash_flow = load_statement_file(data_path).latest(ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -255,35 +213,15 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    data_path = get_catalog(DATA_DIR).simfin_path("income_statements", freq)
+    # Most recent statement published on or before the current date
+    latest_income = load_statement_file(data_path).latest(ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -294,6 +232,122 @@ def get_simfin_income_statements(
     )
 
 
+# Statements of the fundamentals snapshot: (SimFin statement, title, yfinance annual / quarterly attribute)
+FUNDAMENTAL_STATEMENTS = [
+    ("income_statements", "Income statement", "financials", "quarterly_financials"),
+    ("balance_sheet", "Balance sheet", "balance_sheet", "quarterly_balance_sheet"),
+    ("cash_flow", "Cash flow statement", "cashflow", "quarterly_cashflow"),
+]
+
+# SimFin columns shown once in a statement's heading instead of as line items
+SIMFIN_META_COLUMNS = [
+    "Ticker",
+    "SimFinId",
+    "Currency",
+    "Fiscal Year",
+    "Fiscal Period",
+    "Publish Date",
+    "Report Date",
+    "Restated Date",
+]
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _format_line_items(items: pd.Series) -> str:
+    return "\n".join(f"{name}: {_format_value(value)}" for name, value in items.dropna().items())
+
+
+def _simfin_snapshot_section(title: str, statement: pd.Series) -> str:
+    period = " ".join(
+        _format_value(statement[column])
+        for column in ("Fiscal Year", "Fiscal Period")
+        if column in statement.index and pd.notna(statement[column])
+    )
+    details = [
+        f"report date {str(statement['Report Date'])[0:10]}",
+        f"published {str(statement['Publish Date'])[0:10]}",
+    ]
+    if "Currency" in statement.index and pd.notna(statement["Currency"]):
+        details.append(str(statement["Currency"]))
+    heading = f"### {title}" + (f" for {period}" if period else "") + f" ({', '.join(details)})"
+    items = statement.drop([column for column in SIMFIN_META_COLUMNS if column in statement.index])
+    return heading + "\n" + _format_line_items(items)
+
+
+def _yfin_snapshot_section(title: str, statement: pd.DataFrame, curr_date: str) -> str:
+    if statement is None or statement.empty:
+        return ""
+    periods = pd.to_datetime(statement.columns)
+    available = [
+        column
+        for column, period in zip(statement.columns, periods)
+        if period <= pd.Timestamp(curr_date)
+    ]
+    if not available:
+        return ""
+    # yfinance only has period end dates, so the latest period ended by curr_date is used
+    column = max(available, key=lambda c: pd.Timestamp(c))
+    heading = f"### {title} for the period ended {str(column)[0:10]}"
+    return heading + "\n" + _format_line_items(statement[column])
+
+
+def get_fundamentals_snapshot(
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ] = "quarterly",
+    online: Annotated[bool, "fetch the statements from Yahoo Finance instead of the SimFin data"] = False,
+) -> str:
+    """
+    Retrieve the latest income statement, balance sheet and cash flow statement of a company in one report
+    Args:
+        ticker (str): ticker symbol of the company
+        curr_date (str): current date you are trading at, yyyy-mm-dd
+        freq (str): reporting frequency, annual or quarterly
+        online (bool): whether to fetch the statements from Yahoo Finance (in parallel) rather than the local SimFin data
+    Returns:
+        str: one section per available statement listing its non-empty line items, or "" if none is available
+    """
+    sections = []
+    if online:
+        yf_ticker = get_ticker(ticker)
+        attributes = [annual if freq == "annual" else quarterly for _, _, annual, quarterly in FUNDAMENTAL_STATEMENTS]
+        # The three statements are separate Yahoo Finance requests
+        with ThreadPoolExecutor(max_workers=len(attributes)) as executor:
+            statements = list(executor.map(lambda attribute: getattr(yf_ticker, attribute), attributes))
+        for (_, title, _, _), statement in zip(FUNDAMENTAL_STATEMENTS, statements):
+            section = _yfin_snapshot_section(title, statement, curr_date)
+            if section:
+                sections.append(section)
+        source = "Yahoo Finance"
+    else:
+        catalog = get_catalog(DATA_DIR)
+        for statement_name, title, _, _ in FUNDAMENTAL_STATEMENTS:
+            entry = catalog.simfin_file(statement_name, freq)
+            if entry is None:
+                continue
+            statement = load_statement_file(entry.path).latest(ticker, curr_date)
+            if statement is not None:
+                sections.append(_simfin_snapshot_section(title, statement))
+        source = "SimFin"
+
+    if not sections:
+        print("No fundamentals available before the given current date.")
+        return ""
+
+    return (
+        f"## {freq} fundamentals snapshot for {ticker} as of {curr_date} ({source}):\n\n"
+        + "\n\n".join(sections)
+    )
+
+
 def get_google_news(
     query: Annotated[str, "Query to search with"],
     curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
@@ -305,7 +359,7 @@ def get_google_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    news_results = getNewsData(query, before, curr_date)
+    news_results = get_cached_news_data(query, before, curr_date)
 
     news_str = ""
 
@@ -338,26 +392,17 @@ def get_reddit_global_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
-
-    pbar.close()
+    # one pass over the window, top posts bucketed per day
+    posts_by_day = fetch_top_from_category_range(
+        "global_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+    )
+    posts = [post for day_posts in posts_by_day.values() for post in day_posts]
+    # the day after the window, as reported in the header
+    curr_date = max(datetime.strptime(before, "%Y-%m-%d"), start_date + relativedelta(days=1))
 
     if len(posts) == 0:
         return ""
@@ -392,31 +437,18 @@ def get_reddit_company_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
+    # one pass over the window, top posts bucketed per day
+    posts_by_day = fetch_top_from_category_range(
+        "company_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        ticker,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
     )
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
+    posts = [post for day_posts in posts_by_day.values() for post in day_posts]
+    # the day after the window, as reported in the header
+    curr_date = max(datetime.strptime(before, "%Y-%m-%d"), start_date + relativedelta(days=1))
 
     if len(posts) == 0:
         return ""
@@ -431,6 +463,80 @@ def get_reddit_company_news(
     return f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n{news_str}"
 
 
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -441,107 +547,36 @@ def get_stock_stats_indicators_window(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in BEST_IND_PARAMS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
         )
 
     end_date = curr_date
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
+    # compute the indicator once for the whole window instead of once per day
+    indicator_values = get_stockstats_indicator_window(
+        symbol, indicator, before.strftime("%Y-%m-%d"), end_date, online
+    )
+
     if not online:
-        print("zz","get_stock_stats_indicators_window")
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2010-08-21-2025-08-21.csv",
-                #f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
+        # read from the columnar price store
+        # same file as the indicator values were computed from
+        series = load_price_series(symbol, get_catalog(DATA_DIR).price_path(symbol))
+        window_dates = set(
+            np.datetime_as_string(
+                series.slice(before.strftime("%Y-%m-%d"), end_date).dates, unit="D"
             )
         )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
 
         ind_string = ""
         while curr_date >= before:
             # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
+            if curr_date.strftime("%Y-%m-%d") in window_dates:
+                indicator_value = indicator_values.get(
+                    curr_date.strftime("%Y-%m-%d"), ""
                 )
 
                 ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
@@ -551,9 +586,13 @@ def get_stock_stats_indicators_window(
         # online gathering
         ind_string = ""
         while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-            )
+            if indicator_values:
+                indicator_value = indicator_values.get(
+                    curr_date.strftime("%Y-%m-%d"),
+                    "N/A: Not a trading day (weekend or holiday)",
+                )
+            else:
+                indicator_value = ""
 
             ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
 
@@ -563,12 +602,152 @@ def get_stock_stats_indicators_window(
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + BEST_IND_PARAMS.get(indicator, "No description available.")
     )
 
     return result_str
 
 
+def get_stock_stats_indicators_batch(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> str:
+    """
+    Retrieve several indicators at once as a single date x indicator table.
+
+    The price data is loaded once and every indicator is computed from it, so
+    one call replaces a get_stock_stats_indicators_window call per indicator.
+    Unsupported indicators, missing price data and windows without trading
+    days are reported in the returned text rather than raised.
+    """
+
+    unsupported = [indicator for indicator in indicators if indicator not in BEST_IND_PARAMS]
+    if unsupported or not indicators:
+        return (
+            f"Indicators {unsupported} are not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+        )
+
+    # keep the requested order but drop duplicates
+    indicators = list(dict.fromkeys(indicators))
+
+    end_date = curr_date
+    curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date - relativedelta(days=look_back_days)
+    header = f"## {', '.join(indicators)} values from {before.strftime('%Y-%m-%d')} to {end_date}"
+
+    try:
+        table = StockstatsUtils.get_stock_stats_table(
+            symbol,
+            indicators,
+            before.strftime("%Y-%m-%d"),
+            end_date,
+            DATA_DIR,
+            online=online,
+        )
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicators {indicators} from {before.strftime('%Y-%m-%d')} to {end_date}: {e}"
+        )
+        return f"{header}: N/A: Error getting the price data for {symbol}: {e}"
+
+    if table.empty:
+        return f"{header}: N/A: No trading days in this window"
+
+    # most recent trading day first, like the single-indicator report
+    table = table.iloc[::-1]
+
+    with pd.option_context(
+        "display.max_rows", None, "display.max_columns", None, "display.width", None
+    ):
+        table_string = table.to_string()
+
+    descriptions = "\n".join(
+        f"- {indicator}: {BEST_IND_PARAMS[indicator]}" for indicator in indicators
+    )
+
+    return (
+        f"{header} (trading days only):\n\n"
+        + table_string
+        + "\n\n"
+        + descriptions
+    )
+
+
+def get_stock_stats_cross_section(
+    symbols: Annotated[List[str], "ticker symbols of the companies to compare"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+) -> str:
+    """
+    Retrieve several indicators for a universe of symbols on one trading date.
+
+    All symbols are loaded into one price panel from the offline data and each
+    indicator is computed for every symbol in a single vectorized pass.
+    Unsupported indicators, missing price data and non-trading days are
+    reported in the returned text rather than raised, as in the batch report.
+    """
+
+    unsupported = [indicator for indicator in indicators if indicator not in BEST_IND_PARAMS]
+    if unsupported or not indicators:
+        return (
+            f"Indicators {unsupported} are not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+        )
+    if not symbols:
+        return f"## {curr_date}: N/A: No symbols to compare"
+
+    # keep the requested order but drop duplicates
+    indicators = list(dict.fromkeys(indicators))
+    header = f"## {', '.join(indicators)} values on {curr_date}"
+
+    try:
+        panel = load_price_panel(symbols, DATA_DIR, end_date=curr_date)
+    except Exception as e:
+        print(
+            f"Error getting the price panel for {symbols} up to {curr_date}: {e}"
+        )
+        return f"{header}: N/A: Error getting the price data: {e}"
+
+    row = panel.row(curr_date)
+    if row is None:
+        return f"{header}: N/A: Not a trading day (weekend or holiday)"
+
+    table = pd.DataFrame(
+        {
+            indicator: panel.compute_indicator(indicator)[row]
+            for indicator in indicators
+        },
+        index=pd.Index(panel.symbols, name="Symbol"),
+    )
+    table = table[panel.present[row]]
+
+    with pd.option_context(
+        "display.max_rows", None, "display.max_columns", None, "display.width", None
+    ):
+        table_string = table.to_string()
+
+    descriptions = "\n".join(
+        f"- {indicator}: {BEST_IND_PARAMS[indicator]}" for indicator in indicators
+    )
+
+    return (
+        f"{header} for {len(table)} symbols:\n\n"
+        + table_string
+        + "\n\n"
+        + descriptions
+    )
+
+
 def get_stockstats_indicator(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -586,7 +765,7 @@ def get_stockstats_indicator(
             symbol,
             indicator,
             curr_date,
-            os.path.join(DATA_DIR, "market_data", "price_data"),
+            DATA_DIR,
             online=online,
         )
     except Exception as e:
@@ -598,6 +777,38 @@ def get_stockstats_indicator(
     return str(indicator_value)
 
 
+def get_stockstats_indicator_window(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> Dict[str, str]:
+    """
+    Retrieve the values of one indicator for every trading day in a date window.
+
+    The price data is loaded and the indicator computed a single time for the
+    whole window. Returns an empty dict if the data could not be loaded.
+    """
+
+    try:
+        indicator_values = StockstatsUtils.get_stock_stats_window(
+            symbol,
+            indicator,
+            start_date,
+            end_date,
+            DATA_DIR,
+            online=online,
+        )
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicator {indicator} from {start_date} to {end_date}: {e}"
+        )
+        return {}
+
+    return {date: str(value) for date, value in indicator_values.items()}
+
+
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -609,23 +820,12 @@ def get_YFin_data_window(
     start_date = before.strftime("%Y-%m-%d")
 
     # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
+    series = load_price_series(
+        symbol, get_catalog(DATA_DIR).price_path(symbol, curr_date)
     )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = series.slice(start_date, curr_date).to_frame()
 
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
@@ -648,11 +848,8 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    # Fetch historical data for the specified date range, batched with concurrent calls
+    data = get_price_service().history(symbol.upper(), start_date, end_date)
 
     # Check if data is empty
     if data.empty:
@@ -688,29 +885,18 @@ def get_YFin_data(
 ) -> str:
     # read in data
     print(symbol,start_date,end_date,DATA_DIR) #./FR1-data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2010-08-21-2025-08-21.csv",
-            #f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-    
-    if end_date > "2025-08-21":
+    entry = get_catalog(DATA_DIR).price_file(symbol, end_date)
+    if entry is None:
+        raise FileNotFoundError(f"Get_YFin_Data: no price data found for {symbol}")
+    series = load_price_series(symbol, entry.path)
+
+    if end_date > entry.end:
         raise Exception(
-            f"Get_YFin_Data: {end_date} is outside of the data range of 2010-08-21 to 2025-08-21"
+            f"Get_YFin_Data: {end_date} is outside of the data range of {entry.start} to {entry.end}"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = series.slice(start_date, end_date).to_frame()
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -0,0 +1,127 @@
+"""
+JSON Decoding Backends
+
+Pluggable decoding for the offline Reddit and Finnhub archives. The fastest
+installed backend is used: msgspec (decodes Reddit lines straight into a
+typed struct, skipping the fields we never read), then orjson, then the
+standard library. The ``json_decoder`` setting pins a backend.
+
+Neither msgspec nor orjson is required; without them everything goes
+through ``json``. Both reject input the standard library accepts, such as the
+``NaN`` and ``Infinity`` literals ``json.dumps`` writes for non-finite floats,
+so a document a fast backend cannot decode is decoded again with ``json``:
+every backend returns what ``json.loads`` would.
+"""
+
+import json
+from typing import Callable, NamedTuple, Union
+
+from .config import get_config
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKENDS = ("msgspec", "orjson", "json")
+
+
+if msgspec is not None:
+
+    class RedditPost(msgspec.Struct):
+        """The fields of a Reddit post the dataflows read."""
+
+        created_utc: Union[int, float]
+        title: str
+        selftext: str
+        url: str
+        ups: Union[int, float]
+
+    class _PostTimestamp(msgspec.Struct):
+        created_utc: Union[int, float]
+
+else:
+
+    class RedditPost(NamedTuple):
+        """The fields of a Reddit post the dataflows read."""
+
+        created_utc: Union[int, float]
+        title: str
+        selftext: str
+        url: str
+        ups: Union[int, float]
+
+
+def get_backend() -> str:
+    """
+    Return the backend in use: the ``json_decoder`` setting, or the fastest installed one for "auto".
+
+    Raises:
+        ValueError: If the configured backend is unknown or not installed
+    """
+    name = get_config().get("json_decoder", "auto")
+    if name == "auto":
+        if msgspec is not None:
+            return "msgspec"
+        if orjson is not None:
+            return "orjson"
+        return "json"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown json_decoder {name}. Please choose from: {['auto', *BACKENDS]}")
+    if (name == "msgspec" and msgspec is None) or (name == "orjson" and orjson is None):
+        raise ValueError(f"json_decoder {name} is configured but not installed")
+    return name
+
+
+def _with_fallback(decode, fallback):
+    # msgspec.DecodeError and orjson.JSONDecodeError are both ValueErrors
+    def decode_or_fallback(data):
+        try:
+            return decode(data)
+        except ValueError:
+            return fallback(data)
+
+    return decode_or_fallback
+
+
+def get_loads(backend: str = None) -> Callable[[Union[bytes, str]], object]:
+    """Return a ``json.loads``-compatible function for a backend (default: the one in use)."""
+    backend = backend or get_backend()
+    if backend == "msgspec":
+        return _with_fallback(msgspec.json.Decoder().decode, json.loads)
+    if backend == "orjson":
+        return _with_fallback(orjson.loads, json.loads)
+    return json.loads
+
+
+def _post_from_dict(loads):
+    def decode(line):
+        data = loads(line)
+        return RedditPost(
+            data["created_utc"], data["title"], data["selftext"], data["url"], data["ups"]
+        )
+
+    return decode
+
+
+def get_post_decoder(backend: str = None) -> Callable[[bytes], RedditPost]:
+    """Return a function decoding one Reddit .jsonl line into a RedditPost."""
+    backend = backend or get_backend()
+    if backend == "msgspec":
+        return _with_fallback(msgspec.json.Decoder(RedditPost).decode, _post_from_dict(json.loads))
+    return _post_from_dict(get_loads(backend))
+
+
+def get_timestamp_decoder(backend: str = None) -> Callable[[bytes], Union[int, float]]:
+    """Return a function decoding only the created_utc field of a Reddit .jsonl line."""
+    backend = backend or get_backend()
+    if backend == "msgspec":
+        decode = msgspec.json.Decoder(_PostTimestamp).decode
+        return _with_fallback(lambda line: decode(line).created_utc, lambda line: json.loads(line)["created_utc"])
+    loads = get_loads(backend)
+    return lambda line: loads(line)["created_utc"]
@@ -0,0 +1,207 @@
+"""
+Google News Result Cache
+
+Persists the results of ``getNewsData`` in SQLite, keyed by (query, start
+date, end date), so the same search made by another agent or another ticker
+run is answered locally instead of being scraped again.
+
+A window that had already ended when it was scraped is closed: its results
+never change and never expire. A window scraped while it was still open may
+have missed later news, so it is re-scraped once its results are older than
+``google_news_cache_ttl`` seconds, even after the window has ended. Empty
+results are not stored, since the scraper also returns nothing when a
+request fails. Hits and misses are counted in the database file, across
+processes.
+
+The cache can be prewarmed for a ticker universe from the command line::
+
+    python -m dataflows.prewarm_news prewarm AAPL MSFT --start 2024-01-02 --end 2024-03-28
+    python -m dataflows.prewarm_news stats
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from .config import get_config
+from .googlenews_utils import getNewsData
+
+
+def _iso_date(value: str) -> str:
+    """yyyy-mm-dd form of a yyyy-mm-dd or mm/dd/yyyy date, as getNewsData accepts both."""
+    if "-" in value:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    return datetime.strptime(value, "%m/%d/%Y").strftime("%Y-%m-%d")
+
+
+def _query_key(query: str) -> str:
+    """The form of a query get_google_news searches for ("AAPL stock" -> "AAPL+stock")."""
+    return query.strip().replace(" ", "+")
+
+
+class NewsCache:
+    """
+    SQLite cache of Google News search results.
+
+    Queries are normalized with ``_query_key``, so "AAPL stock" and the
+    "AAPL+stock" get_google_news sends are the same search.
+
+    Args:
+        db_path (str): Path of the database file, created if missing
+        recent_ttl (float): Seconds the results of a window reaching today stay valid
+    """
+
+    def __init__(self, db_path: str, recent_ttl: float = 3600):
+        self.db_path = db_path
+        self.recent_ttl = recent_ttl
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS news (
+                    query TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    results TEXT NOT NULL,
+                    PRIMARY KEY (query, start_date, end_date)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO counters VALUES (?, 0)", [("hits",), ("misses",)]
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call keeps the cache usable from any thread
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, query: str, start_date: str, end_date: str) -> Optional[List[Dict]]:
+        """Return the cached results of a search if they are still valid, else None."""
+        start_date, end_date = _iso_date(start_date), _iso_date(end_date)
+        results = None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT fetched_at, results FROM news WHERE query = ? AND start_date = ? AND end_date = ?",
+                (_query_key(query), start_date, end_date),
+            ).fetchone()
+            if row is not None:
+                fetched_at, cached = row
+                # closed only if the window had ended when it was scraped
+                closed = end_date < date.fromtimestamp(fetched_at).isoformat()
+                if closed or time.time() - fetched_at < self.recent_ttl:
+                    results = cached
+            conn.execute(
+                "UPDATE counters SET value = value + 1 WHERE name = ?",
+                ("hits" if results is not None else "misses",),
+            )
+        return json.loads(results) if results is not None else None
+
+    def put(self, query: str, start_date: str, end_date: str, results: List[Dict]):
+        """Store the results of a search; empty results are not stored."""
+        if not results:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO news VALUES (?, ?, ?, ?, ?)",
+                (_query_key(query), _iso_date(start_date), _iso_date(end_date), time.time(), json.dumps(results)),
+            )
+
+    def fetch(
+        self,
+        query: str,
+        start_date: str,
+        end_date: str,
+        scrape: Optional[Callable[[str, str, str], List[Dict]]] = None,
+    ) -> List[Dict]:
+        """Return the results of a search from the cache, scraping (default: getNewsData) and storing them on a miss."""
+        query = _query_key(query)
+        results = self.get(query, start_date, end_date)
+        if results is None:
+            results = (scrape or getNewsData)(query, start_date, end_date)
+            self.put(query, start_date, end_date, results)
+        return results
+
+    def stats(self) -> Dict:
+        """Hit and miss counts of all processes using the database, and the number of stored searches."""
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+            entries = conn.execute("SELECT COUNT(*) FROM news").fetchone()[0]
+        return {"hits": counters["hits"], "misses": counters["misses"], "entries": entries}
+
+
+_CACHES: Dict[str, NewsCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_news_cache(db_path: Optional[str] = None) -> NewsCache:
+    """Return the shared news cache for a database path (default: the ``google_news_cache_path`` setting)."""
+    config = get_config()
+    if db_path is None:
+        db_path = config.get(
+            "google_news_cache_path", os.path.join(config["data_cache_dir"], "google_news.sqlite")
+        )
+    db_path = os.path.abspath(db_path)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(db_path)
+        if cache is None:
+            cache = NewsCache(db_path, config.get("google_news_cache_ttl", 3600))
+            _CACHES[db_path] = cache
+    return cache
+
+
+def get_cached_news_data(query: str, start_date: str, end_date: str) -> List[Dict]:
+    """``getNewsData`` through the cache, unless the google_news_cache setting is off."""
+    if not get_config().get("google_news_cache", True):
+        return getNewsData(query, start_date, end_date)
+    return get_news_cache().fetch(query, start_date, end_date)
+
+
+def prewarm(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    look_back_days: int = 7,
+    query_templates: Optional[List[str]] = None,
+) -> Dict:
+    """
+    Fill the cache with the searches get_google_news makes for each ticker and trading day.
+
+    Args:
+        tickers (list): Ticker symbols
+        start_date (str): First trading date, yyyy-mm-dd
+        end_date (str): Last trading date, yyyy-mm-dd
+        look_back_days (int): Look-back window of each search, as passed to get_google_news
+        query_templates (list): Queries to search, with {ticker} replaced by the symbol
+
+    Returns:
+        dict: The cache stats after prewarming
+    """
+    cache = get_news_cache()
+    query_templates = query_templates or ["{ticker}"]
+    for curr_date in pd.bdate_range(start_date, end_date):
+        before = (curr_date - relativedelta(days=look_back_days)).strftime("%Y-%m-%d")
+        curr_date = curr_date.strftime("%Y-%m-%d")
+        for ticker in tickers:
+            for template in query_templates:
+                query = template.format(ticker=ticker)
+                results = cache.fetch(query, before, curr_date)
+                print(f"{query} {before} to {curr_date}: {len(results)} results")
+    return cache.stats()
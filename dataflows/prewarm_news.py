@@ -0,0 +1,54 @@
+"""
+Command line interface of the Google News result cache.
+
+Usage::
+
+    python -m dataflows.prewarm_news prewarm AAPL MSFT --start 2024-01-02 --end 2024-03-28
+    python -m dataflows.prewarm_news prewarm AAPL --start 2024-01-02 --query "{ticker}" --query "{ticker} stock"
+    python -m dataflows.prewarm_news stats
+"""
+
+import argparse
+import json
+from datetime import datetime
+
+from .news_cache import get_news_cache, prewarm
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Manage the Google News result cache")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prewarm_parser = subparsers.add_parser(
+        "prewarm", help="Scrape and cache the Google News searches for a ticker universe"
+    )
+    prewarm_parser.add_argument("tickers", nargs="+", help="Ticker symbols (e.g., AAPL MSFT)")
+    prewarm_parser.add_argument("--start", required=True, help="First trading date in YYYY-MM-DD format")
+    prewarm_parser.add_argument(
+        "--end",
+        default=datetime.now().strftime("%Y-%m-%d"),
+        help="Last trading date in YYYY-MM-DD format (default: today)",
+    )
+    prewarm_parser.add_argument(
+        "--look-back-days", type=int, default=7, help="Look-back window of each search (default: 7)"
+    )
+    prewarm_parser.add_argument(
+        "--query",
+        action="append",
+        dest="queries",
+        help='Query template, {ticker} is replaced by the symbol; repeatable (default: "{ticker}")',
+    )
+
+    subparsers.add_parser("stats", help="Show the number of cached searches")
+
+    args = parser.parse_args()
+    if args.command == "prewarm":
+        stats = prewarm(args.tickers, args.start, args.end, args.look_back_days, args.queries)
+    else:
+        stats = get_news_cache().stats()
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Online Price Cache
+
+Per-symbol, append-only cache of daily Yahoo Finance bars for the online
+tools. Each symbol has one CSV file plus a small JSON sidecar recording the
+covered date range and the day it was last refreshed, so a warm run fetches
+only the bars after the cached range (or nothing at all if the cache was
+already refreshed today) instead of re-downloading 15 years every day.
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+
+HISTORY_YEARS = 15
+# Bars re-fetched before the cached end to detect adjusted-price revisions
+# (dividends and splits rewrite the auto-adjusted history).
+OVERLAP_DAYS = 7
+REVISION_TOLERANCE = 1e-6
+
+_LEGACY_CACHE_FILE = re.compile(r"^(?P<symbol>.+)-YFin-data-\d{4}-\d{2}-\d{2}-\d{4}-\d{2}-\d{2}\.csv$")
+
+
+def _cache_paths(cache_dir: str, symbol: str):
+    base = os.path.join(cache_dir, f"{symbol}-YFin-data")
+    return f"{base}.csv", f"{base}.json"
+
+
+def _read_meta(meta_path: str) -> Optional[Dict]:
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _atomic_write(path: str, write):
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _download(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    data = yf.download(
+        symbol,
+        start=start_date,
+        end=end_date,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    data = data.reset_index()
+    if "Date" in data.columns:
+        data["Date"] = pd.to_datetime(data["Date"]).dt.tz_localize(None)
+    return data
+
+
+def _is_revised(cached: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+    """Whether overlapping bars disagree, i.e. the adjusted history was rewritten."""
+    if fresh.empty or "Date" not in fresh.columns:
+        return False
+    overlap = cached.merge(fresh, on="Date", suffixes=("_cached", "_fresh"))
+    if overlap.empty or "Close_cached" not in overlap.columns:
+        return False
+    cached_close = overlap["Close_cached"].to_numpy(dtype=float)
+    fresh_close = overlap["Close_fresh"].to_numpy(dtype=float)
+    return not np.allclose(cached_close, fresh_close, rtol=REVISION_TOLERANCE, equal_nan=True)
+
+
+def compact_cache(cache_dir: str, symbol: str):
+    """Remove the date-stamped full-history files written by the previous cache layout."""
+    for file_name in os.listdir(cache_dir):
+        match = _LEGACY_CACHE_FILE.match(file_name)
+        if match and match.group("symbol") == symbol:
+            try:
+                os.remove(os.path.join(cache_dir, file_name))
+            except FileNotFoundError:
+                pass
+
+
+def _store(
+    data: pd.DataFrame,
+    symbol: str,
+    csv_path: str,
+    meta_path: str,
+    requested_start: str,
+    today_str: str,
+) -> pd.DataFrame:
+    if data.empty:
+        return data
+    _atomic_write(csv_path, lambda path: data.to_csv(path, index=False))
+    meta = {
+        "symbol": symbol,
+        "requested_start": requested_start,
+        "start": data["Date"].iloc[0].strftime("%Y-%m-%d"),
+        "end": data["Date"].iloc[-1].strftime("%Y-%m-%d"),
+        "refreshed_on": today_str,
+    }
+
+    def write_meta(path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    # The sidecar is written after the data so a crash never claims bars that are not on disk
+    _atomic_write(meta_path, write_meta)
+    # Only a write can follow a legacy full-history file; cache hits skip the directory scan
+    compact_cache(os.path.dirname(csv_path), symbol)
+    return data
+
+
+def get_online_price_history(
+    symbol: str,
+    cache_dir: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Return the last 15 years of daily bars for a symbol, refreshing the cache incrementally.
+
+    Args:
+        symbol (str): Ticker symbol of the company
+        cache_dir (str): Cache directory, defaults to the configured data_cache_dir
+
+    Returns:
+        DataFrame: Bars with a datetime ``Date`` column, oldest first, up to yesterday
+    """
+    if cache_dir is None:
+        cache_dir = get_config()["data_cache_dir"]
+    os.makedirs(cache_dir, exist_ok=True)
+    csv_path, meta_path = _cache_paths(cache_dir, symbol)
+
+    today = pd.Timestamp.today().normalize()
+    today_str = today.strftime("%Y-%m-%d")
+    history_start = (today - pd.DateOffset(years=HISTORY_YEARS)).strftime("%Y-%m-%d")
+
+    meta = _read_meta(meta_path)
+    cached = None
+    if meta is not None and os.path.exists(csv_path):
+        cached = pd.read_csv(csv_path)
+        cached["Date"] = pd.to_datetime(cached["Date"])
+
+    if cached is not None and meta.get("requested_start", meta.get("start", history_start)) <= history_start:
+        if meta.get("refreshed_on") == today_str:
+            data = cached
+        else:
+            tail_start = (pd.Timestamp(meta["end"]) - pd.Timedelta(days=OVERLAP_DAYS)).strftime("%Y-%m-%d")
+            fresh = _download(symbol, tail_start, today_str)
+            if fresh.empty:
+                # The refetched range overlaps the cache, so nothing came back only
+                # if the download failed; serve the cache and retry on the next call
+                data = cached
+            else:
+                if _is_revised(cached, fresh):
+                    requested_start = history_start
+                    data = _download(symbol, history_start, today_str)
+                else:
+                    requested_start = meta.get("requested_start", meta["start"])
+                    data = (
+                        pd.concat([cached, fresh], ignore_index=True)
+                        .drop_duplicates(subset="Date", keep="last")
+                        .sort_values("Date")
+                        .reset_index(drop=True)
+                    )
+                data = _store(data, symbol, csv_path, meta_path, requested_start, today_str)
+    else:
+        data = _download(symbol, history_start, today_str)
+        data = _store(data, symbol, csv_path, meta_path, history_start, today_str)
+
+    data = data[data["Date"] >= pd.Timestamp(history_start)]
+    return data.reset_index(drop=True)
@@ -0,0 +1,217 @@
+"""
+Multi-Symbol Price Panel
+
+Loads the price series of a universe of symbols into one aligned 2-D array per
+field (dates x symbols), so indicators are computed for every symbol in a
+single vectorized pass instead of one tool call per ticker.
+
+The panel is built from the memory-mapped columnar store, on the union of the
+symbols' trading dates; rows where a symbol has no bar are NaN. Because the
+native indicator engine skips NaN the way pandas does, a symbol that starts
+or stops trading inside the panel gets exactly the values it would get on its
+own. Dates a symbol skips in the middle of the panel count as rows of its
+rolling windows, so such symbols can differ from their standalone values.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from . import indicators
+from .catalog import get_catalog
+from .price_store import PriceSeries, load_price_series
+
+
+class PricePanel:
+    """
+    Aligned price fields for several symbols.
+
+    Args:
+        symbols (list): Symbols, in column order
+        dates (np.ndarray): Sorted datetime64[D] row dates
+        fields (dict): Field name -> float64 array of shape (len(dates), len(symbols))
+        present (np.ndarray): Boolean array of the same shape, True where a symbol has a bar
+        offsets (np.ndarray): Row position, in each symbol's full series, of its first bar in the panel
+        buffer_owner: Object owning the memory the arrays are views of (e.g. an attached
+                      shared-memory block), kept alive as long as the panel, or None
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        dates: np.ndarray,
+        fields: Dict[str, np.ndarray],
+        present: np.ndarray,
+        offsets: np.ndarray,
+        buffer_owner: Optional[object] = None,
+    ):
+        self.symbols = list(symbols)
+        self.dates = dates
+        self.fields = fields
+        self.present = present
+        self.offsets = offsets
+        self.buffer_owner = buffer_owner
+        self._columns = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._indicators: Dict[str, np.ndarray] = {}
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    @property
+    def shape(self):
+        return (len(self.dates), len(self.symbols))
+
+    @property
+    def field_names(self) -> List[str]:
+        return list(self.fields.keys())
+
+    def column(self, symbol: str) -> int:
+        """Return the column index of a symbol."""
+        try:
+            return self._columns[symbol]
+        except KeyError:
+            raise KeyError(f"Symbol {symbol} is not in the panel")
+
+    def row(self, date: str) -> Optional[int]:
+        """Return the row of a yyyy-mm-dd date, or None if no symbol traded that day."""
+        target = np.datetime64(date[:10], "D")
+        row = int(np.searchsorted(self.dates, target, side="left"))
+        if row < len(self.dates) and self.dates[row] == target:
+            return row
+        return None
+
+    def slice(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> "PricePanel":
+        """Return the rows between start_date and end_date (both inclusive) as views, sharing the panel's buffer owner."""
+        lo = 0
+        hi = len(self.dates)
+        if start_date is not None:
+            lo = int(np.searchsorted(self.dates, np.datetime64(start_date[:10], "D"), side="left"))
+        if end_date is not None:
+            hi = int(np.searchsorted(self.dates, np.datetime64(end_date[:10], "D"), side="right"))
+        hi = max(lo, hi)
+        offsets = self.offsets + self.present[:lo].sum(axis=0)
+        return PricePanel(
+            self.symbols,
+            self.dates[lo:hi],
+            {name: values[lo:hi] for name, values in self.fields.items()},
+            self.present[lo:hi],
+            offsets,
+            buffer_owner=self.buffer_owner,
+        )
+
+    def compute_indicator(self, indicator: str) -> np.ndarray:
+        """
+        Compute an indicator for every symbol at once.
+
+        Results are cached on the panel, so asking for the same indicator
+        for another symbol or date is free.
+
+        Returns:
+            np.ndarray: dates x symbols array of indicator values, NaN where a symbol has no bar
+
+        Raises:
+            ValueError: If the indicator has no native implementation
+        """
+        values = self._indicators.get(indicator)
+        if values is None:
+            values = indicators.compute_indicator(indicator, self.fields)
+            values = np.where(self.present, values, np.nan)
+            self._indicators[indicator] = values
+        return values
+
+    def cross_section(self, indicator: str, date: str) -> Dict[str, float]:
+        """Return the value of an indicator for every symbol that traded on a date."""
+        row = self.row(date)
+        if row is None:
+            return {}
+        values = self.compute_indicator(indicator)[row]
+        return {
+            symbol: float(values[i])
+            for i, symbol in enumerate(self.symbols)
+            if self.present[row, i]
+        }
+
+    def series(self, symbol: str) -> PriceSeries:
+        """
+        Return one symbol's bars as a PriceSeries, usable wherever a loaded series is.
+
+        When the symbol's bars are contiguous in the panel (the usual case for
+        symbols sharing an exchange calendar) the arrays are views of the panel.
+        """
+        i = self.column(symbol)
+        rows = np.flatnonzero(self.present[:, i])
+        if len(rows) > 0 and rows[-1] + 1 - rows[0] == len(rows):
+            index = slice(int(rows[0]), int(rows[-1]) + 1)
+        else:
+            index = rows
+        return PriceSeries(
+            symbol,
+            self.dates[index],
+            {name: values[index, i] for name, values in self.fields.items()},
+            int(self.offsets[i]),
+        )
+
+    def indicator_series(self, symbol: str, indicator: str) -> np.ndarray:
+        """Return one symbol's indicator values, aligned with ``series(symbol)``."""
+        i = self.column(symbol)
+        return self.compute_indicator(indicator)[self.present[:, i], i]
+
+
+def load_price_panel(
+    symbols: List[str],
+    data_dir: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> PricePanel:
+    """
+    Load several symbols into one aligned PricePanel.
+
+    Args:
+        symbols (list): Ticker symbols to load; duplicates are dropped
+        data_dir (str): Root of the offline data, defaults to the configured data_dir
+        start_date (str): First date to keep, yyyy-mm-dd, or None for the full history
+        end_date (str): Last date to keep, yyyy-mm-dd, or None for the full history
+        fields (list): Price columns to load, defaults to the columns every symbol has
+
+    Returns:
+        PricePanel: dates x symbols panel on the union of the symbols' trading dates
+
+    Raises:
+        FileNotFoundError: If a symbol has no price data
+    """
+    symbols = list(dict.fromkeys(symbols))
+    catalog = get_catalog(data_dir)
+    series_list = [
+        load_price_series(symbol, catalog.price_path(symbol)).slice(start_date, end_date)
+        for symbol in symbols
+    ]
+
+    if fields is None:
+        fields = [
+            name
+            for name in series_list[0].column_names
+            if all(name in series.columns for series in series_list[1:])
+        ] if series_list else []
+
+    # Symbols on the same calendar share the date index as is
+    first_dates = series_list[0].dates if series_list else np.array([], dtype="datetime64[D]")
+    if all(np.array_equal(series.dates, first_dates) for series in series_list[1:]):
+        dates = np.asarray(first_dates)
+    else:
+        dates = np.unique(np.concatenate([series.dates for series in series_list]))
+
+    shape = (len(dates), len(symbols))
+    present = np.zeros(shape, dtype=bool)
+    panel_fields = {name: np.full(shape, np.nan) for name in fields}
+    for i, series in enumerate(series_list):
+        rows = np.searchsorted(dates, series.dates)
+        present[rows, i] = True
+        for name in fields:
+            panel_fields[name][rows, i] = series[name]
+
+    offsets = np.array([series.offset for series in series_list], dtype=np.int64)
+    return PricePanel(symbols, dates, panel_fields, present, offsets)
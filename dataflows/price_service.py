@@ -0,0 +1,277 @@
+"""
+Online Price Service
+
+Serves the daily bars behind ``get_YFin_data_online`` for many concurrent
+tool calls with as few Yahoo Finance requests as possible:
+
+- Requests arriving within a short window (``price_batch_window`` seconds)
+  are coalesced into a single multi-ticker ``yf.download`` covering the union
+  of their date ranges.
+- Identical requests already in flight share one result (singleflight).
+- Downloaded bars are kept in an in-memory bar cache, so a later call whose
+  range lies inside what was already fetched makes no request. Ranges
+  reaching today are only reused for ``price_live_ttl`` seconds, since the
+  latest bar is still changing.
+
+The download itself goes through a backend chosen with the
+``price_service_backend`` setting: ``yfinance`` (default) or ``stub``, which
+answers from the offline price data instead of the network.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import yfinance as yf
+
+from .catalog import get_catalog
+from .config import DATA_DIR, get_config
+from .price_store import load_price_series
+
+# Column order of yf.Ticker.history, which the service's frames follow
+HISTORY_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume", "Dividends", "Stock Splits"]
+
+
+def _history_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    columns = [c for c in HISTORY_COLUMNS if c in frame.columns]
+    columns += [c for c in frame.columns if c not in columns]
+    frame = frame[columns].rename_axis("Date").rename_axis(None, axis=1)
+    # aligning several tickers in one download turns Volume into floats
+    if "Volume" in frame.columns and frame["Volume"].notna().all():
+        frame = frame.astype({"Volume": "int64"})
+    return frame
+
+
+def _day_index(frame: pd.DataFrame) -> pd.DatetimeIndex:
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def _slice(frame: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
+    """Rows dated from start_date (inclusive) to end_date (exclusive), like history(start, end)."""
+    days = _day_index(frame)
+    mask = (days >= pd.Timestamp(start_date)) & (days < pd.Timestamp(end_date))
+    return frame[mask]
+
+
+class YFinanceBackend:
+    """Downloads bars with one ``yf.download`` call for all symbols."""
+
+    # yf.download collects its results in module-level state, so concurrent
+    # calls are not safe; batches are downloaded one at a time.
+    _download_lock = threading.Lock()
+
+    def download(self, symbols: List[str], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
+        with self._download_lock:
+            data = yf.download(
+                symbols,
+                start=start_date,
+                end=end_date,
+                group_by="ticker",
+                auto_adjust=True,
+                actions=True,
+                progress=False,
+            )
+        bars = {}
+        for symbol in symbols:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                frame = data[symbol]
+            else:
+                frame = data
+            # the download is aligned on the union of all symbols' trading days
+            bars[symbol] = _history_frame(frame.dropna(how="all"))
+        return bars
+
+
+class StubBackend:
+    """
+    Serves bars from the offline price data (``get_catalog().price_path``) instead of the network.
+
+    Every call is recorded in ``calls`` as (symbols, start_date, end_date).
+    """
+
+    def __init__(self, data_dir: Optional[str] = None):
+        self.data_dir = data_dir or DATA_DIR
+        self.calls: List[Tuple[List[str], str, str]] = []
+
+    def download(self, symbols: List[str], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
+        self.calls.append((list(symbols), start_date, end_date))
+        catalog = get_catalog(self.data_dir)
+        bars = {}
+        for symbol in symbols:
+            try:
+                series = load_price_series(symbol, catalog.price_path(symbol))
+            except FileNotFoundError:
+                continue
+            frame = series.to_frame().drop(columns="Date")
+            frame.index = pd.DatetimeIndex(series.dates)
+            bars[symbol] = _history_frame(_slice(frame, start_date, end_date))
+        return bars
+
+
+class BarCache:
+    """
+    Downloaded bars per symbol, with the date range they cover.
+
+    Each symbol keeps one contiguous covered range; a download overlapping or
+    touching it extends it, any other download replaces it.
+    """
+
+    def __init__(self, live_ttl: float):
+        self.live_ttl = live_ttl
+        # symbol -> (start, end, bars, fetched at)
+        self._entries: Dict[str, Tuple[str, str, pd.DataFrame, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """Return the bars of [start_date, end_date) if they are covered and still valid, else None."""
+        with self._lock:
+            entry = self._entries.get(symbol)
+        if entry is None:
+            return None
+        start, end, bars, fetched_at = entry
+        if not (start <= start_date and end_date <= end):
+            return None
+        if end_date > date.today().isoformat() and time.monotonic() - fetched_at > self.live_ttl:
+            return None
+        return _slice(bars, start_date, end_date)
+
+    def put(self, symbol: str, start_date: str, end_date: str, bars: pd.DataFrame):
+        """Record the bars downloaded for [start_date, end_date)."""
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None and entry[0] <= end_date and start_date <= entry[1]:
+                start, end, cached, _ = entry
+                merged = pd.concat([cached, bars])
+                merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+                start_date, end_date, bars = min(start, start_date), max(end, end_date), merged
+            self._entries[symbol] = (start_date, end_date, bars, time.monotonic())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class PriceService:
+    """
+    Coalescing, deduplicating front end to a price backend.
+
+    Args:
+        backend: Object with a ``download(symbols, start_date, end_date)`` method returning symbol -> bars
+        window (float): Seconds to wait for more requests before downloading a batch
+        live_ttl (float): Seconds bars of ranges reaching today are reused
+    """
+
+    def __init__(self, backend, window: float = 0.05, live_ttl: float = 60):
+        self.backend = backend
+        self.window = window
+        self.cache = BarCache(live_ttl)
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, str, str], Future] = {}
+        self._pending: List[Tuple[str, str, str]] = []
+        self._collecting = False
+
+    def history(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        Daily bars of a symbol from start_date (inclusive) to end_date (exclusive).
+
+        Args:
+            symbol (str): Ticker symbol
+            start_date (str): First date, yyyy-mm-dd
+            end_date (str): Day after the last date, yyyy-mm-dd
+
+        Returns:
+            pd.DataFrame: Bars indexed by date, in ``yf.Ticker.history`` column order; empty if there are none
+        """
+        bars = self.cache.get(symbol, start_date, end_date)
+        if bars is not None:
+            return bars.copy()
+
+        key = (symbol, start_date, end_date)
+        with self._lock:
+            future = self._inflight.get(key)
+            lead = False
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                self._pending.append(key)
+                # the first request of a window downloads the whole batch
+                lead = not self._collecting
+                self._collecting = True
+
+        if lead:
+            time.sleep(self.window)
+            self._flush()
+        return future.result().copy()
+
+    def _flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._collecting = False
+            futures = {key: self._inflight[key] for key in batch}
+
+        symbols = sorted({symbol for symbol, _, _ in batch})
+        start_date = min(start for _, start, _ in batch)
+        end_date = max(end for _, _, end in batch)
+        bars, error = None, None
+        try:
+            bars = self.backend.download(symbols, start_date, end_date)
+            for symbol, symbol_bars in bars.items():
+                try:
+                    self.cache.put(symbol, start_date, end_date, symbol_bars)
+                except Exception as e:
+                    # the cache only saves later downloads; the waiters still get their bars
+                    print(f"Error caching {symbol} bars from {start_date} to {end_date}: {e}")
+        except Exception as e:
+            bars, error = None, e
+        finally:
+            # every waiter is answered, whatever failed, so none blocks on a dead future
+            with self._lock:
+                for key in batch:
+                    del self._inflight[key]
+            for (symbol, start, end), future in futures.items():
+                try:
+                    if bars is None:
+                        raise error or RuntimeError(f"Download of {symbols} was interrupted")
+                    if symbol in bars:
+                        future.set_result(_slice(bars[symbol], start, end))
+                    else:
+                        future.set_result(pd.DataFrame())
+                except Exception as e:
+                    future.set_exception(e)
+
+
+_SERVICES: Dict[str, PriceService] = {}
+_SERVICES_LOCK = threading.Lock()
+
+BACKENDS = {"yfinance": YFinanceBackend, "stub": StubBackend}
+
+
+def get_price_service() -> PriceService:
+    """
+    Return the shared price service for the configured backend.
+
+    Raises:
+        ValueError: If the price_service_backend setting is unknown
+    """
+    config = get_config()
+    name = config.get("price_service_backend", "yfinance")
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown price_service_backend {name}. Please choose from: {list(BACKENDS)}")
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(name)
+        if service is None:
+            service = PriceService(
+                BACKENDS[name](),
+                window=config.get("price_batch_window", 0.05),
+                live_ttl=config.get("price_live_ttl", 60),
+            )
+            _SERVICES[name] = service
+    return service
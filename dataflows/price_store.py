@@ -0,0 +1,269 @@
+"""
+Columnar Price Store
+
+Converts the Yahoo Finance CSV dumps under ``market_data/price_data`` into a
+columnar on-disk layout (one NumPy ``.npy`` file per column plus a sorted
+``datetime64[D]`` date index) and serves them back memory-mapped. The Date
+strings of the CSV file are kept alongside the index, so frames built from
+the store show the dates exactly as the file wrote them.
+
+A conversion happens once per source file; afterwards every read is an
+``np.load(mmap_mode="r")`` and a date-range slice is a binary search on the
+date index plus zero-copy views of the column arrays.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+STORE_VERSION = 2
+DATE_FILE = "_dates.npy"
+DATE_LABEL_FILE = "_date_labels.npy"
+META_FILE = "meta.json"
+
+# Process-level cache of opened series, keyed by symbol and source file
+_SERIES_CACHE: Dict[tuple, "_CacheEntry"] = {}
+
+
+class PriceSeries:
+    """
+    A date-indexed set of price columns backed by (memory-mapped) NumPy arrays.
+
+    Slicing never copies: the returned series holds views of the parent arrays
+    and remembers its row offset in the full series. ``date_labels`` holds the
+    Date strings of the source file (e.g. ``2024-01-02 00:00:00-05:00``), row
+    for row with ``dates``, or None if the series was not read from a file.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        dates: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        offset: int = 0,
+        date_labels: Optional[np.ndarray] = None,
+    ):
+        self.symbol = symbol
+        self.dates = dates
+        self.columns = columns
+        self.offset = offset
+        self.date_labels = date_labels
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns.keys())
+
+    @property
+    def start_date(self) -> Optional[str]:
+        return str(self.dates[0]) if len(self.dates) else None
+
+    @property
+    def end_date(self) -> Optional[str]:
+        return str(self.dates[-1]) if len(self.dates) else None
+
+    def slice(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> "PriceSeries":
+        """
+        Return the rows between start_date and end_date (both inclusive, yyyy-mm-dd).
+
+        Args:
+            start_date (str): First date to keep, or None for the beginning of the series
+            end_date (str): Last date to keep, or None for the end of the series
+
+        Returns:
+            PriceSeries: A series whose arrays are views of this one
+        """
+        lo = 0
+        hi = len(self.dates)
+        if start_date is not None:
+            lo = int(np.searchsorted(self.dates, np.datetime64(start_date[:10], "D"), side="left"))
+        if end_date is not None:
+            hi = int(np.searchsorted(self.dates, np.datetime64(end_date[:10], "D"), side="right"))
+        hi = max(lo, hi)
+        return PriceSeries(
+            self.symbol,
+            self.dates[lo:hi],
+            {name: values[lo:hi] for name, values in self.columns.items()},
+            self.offset + lo,
+            None if self.date_labels is None else self.date_labels[lo:hi],
+        )
+
+    def to_frame(self, iso_dates: bool = False) -> pd.DataFrame:
+        """
+        Materialize the series as a DataFrame with a ``Date`` column.
+
+        The index holds the row positions in the full series and the dates are
+        the source file's Date strings, matching what filtering the original
+        CSV frame would produce.
+
+        Args:
+            iso_dates (bool): Whether to write the dates as yyyy-mm-dd instead, as
+                they are when the series has no source strings
+        """
+        if iso_dates or self.date_labels is None:
+            dates = np.datetime_as_string(self.dates, unit="D")
+        else:
+            dates = np.asarray(self.date_labels).astype(object)
+        data = {"Date": dates}
+        for name, values in self.columns.items():
+            data[name] = np.asarray(values)
+        index = pd.RangeIndex(self.offset, self.offset + len(self.dates))
+        return pd.DataFrame(data, index=index)
+
+
+class _CacheEntry:
+    __slots__ = ("series", "signature")
+
+    def __init__(self, series: PriceSeries, signature: Dict):
+        self.series = series
+        self.signature = signature
+
+
+def get_store_dir() -> str:
+    """Return the root directory of the columnar price store."""
+    config = get_config()
+    return config.get(
+        "price_store_dir", os.path.join(config["data_cache_dir"], "price_store")
+    )
+
+
+def _source_signature(source_path: str) -> Dict:
+    stat = os.stat(source_path)
+    return {"source_mtime": stat.st_mtime_ns, "source_size": stat.st_size}
+
+
+def _atomic_save(path: str, array: np.ndarray):
+    # Write to a sibling file and swap it in, so readers that already hold a
+    # memory map of the previous version keep a valid (unlinked) inode.
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(tmp_path, "wb") as f:
+        np.save(f, array, allow_pickle=False)
+    os.replace(tmp_path, path)
+
+
+def _atomic_write_json(path: str, payload: Dict):
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, path)
+
+
+def convert_csv_to_store(symbol: str, source_path: str, store_path: str) -> Dict:
+    """
+    Convert a Yahoo Finance CSV file into the columnar layout.
+
+    Args:
+        symbol (str): Ticker symbol the file belongs to
+        source_path (str): Path of the CSV file to convert
+        store_path (str): Directory to write the column files into
+
+    Returns:
+        dict: The metadata written alongside the columns
+    """
+    data = pd.read_csv(source_path)
+    labels = data["Date"].astype(str).to_numpy()
+    dates = pd.to_datetime(data["Date"].astype(str).str[:10]).values.astype("datetime64[D]")
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+
+    os.makedirs(store_path, exist_ok=True)
+    _atomic_save(os.path.join(store_path, DATE_FILE), dates)
+    _atomic_save(os.path.join(store_path, DATE_LABEL_FILE), labels[order].astype(str))
+
+    columns = []
+    for i, name in enumerate(c for c in data.columns if c != "Date"):
+        values = data[name].values[order]
+        if not np.issubdtype(values.dtype, np.number):
+            continue
+        if np.issubdtype(values.dtype, np.floating):
+            values = values.astype(np.float64)
+        file_name = f"col_{i}.npy"
+        _atomic_save(os.path.join(store_path, file_name), np.ascontiguousarray(values))
+        columns.append({"name": name, "file": file_name, "dtype": str(values.dtype)})
+
+    meta = {
+        "version": STORE_VERSION,
+        "symbol": symbol,
+        "source": os.path.abspath(source_path),
+        "rows": int(len(dates)),
+        "start": str(dates[0]) if len(dates) else None,
+        "end": str(dates[-1]) if len(dates) else None,
+        "columns": columns,
+        **_source_signature(source_path),
+    }
+    # The metadata file is written last and marks the conversion as complete
+    _atomic_write_json(os.path.join(store_path, META_FILE), meta)
+    return meta
+
+
+def _read_meta(store_path: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(store_path, META_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def open_store(symbol: str, store_path: str, meta: Dict) -> PriceSeries:
+    """Open a converted store memory-mapped and read-only."""
+    dates = np.load(os.path.join(store_path, DATE_FILE), mmap_mode="r")
+    date_labels = np.load(os.path.join(store_path, DATE_LABEL_FILE), mmap_mode="r")
+    columns = {
+        column["name"]: np.load(os.path.join(store_path, column["file"]), mmap_mode="r")
+        for column in meta["columns"]
+    }
+    return PriceSeries(symbol, dates, columns, date_labels=date_labels)
+
+
+def load_price_series(symbol: str, source_path: str) -> PriceSeries:
+    """
+    Load the price series for a symbol, converting its CSV file on first use.
+
+    The conversion is redone when the source file changes (size or mtime), so
+    refreshed CSV dumps are picked up without clearing the store by hand.
+
+    Args:
+        symbol (str): Ticker symbol of the company
+        source_path (str): Path of the Yahoo Finance CSV file for the symbol
+
+    Returns:
+        PriceSeries: Memory-mapped, date-sorted price series
+
+    Raises:
+        FileNotFoundError: If the source CSV file does not exist
+    """
+    signature = _source_signature(source_path)
+    cache_key = (symbol, os.path.abspath(source_path))
+
+    cached = _SERIES_CACHE.get(cache_key)
+    if cached is not None and cached.signature == signature:
+        return cached.series
+
+    store_path = os.path.join(
+        get_store_dir(),
+        symbol,
+        os.path.splitext(os.path.basename(source_path))[0],
+    )
+    meta = _read_meta(store_path)
+    if (
+        meta is None
+        or meta.get("version") != STORE_VERSION
+        or meta.get("source_mtime") != signature["source_mtime"]
+        or meta.get("source_size") != signature["source_size"]
+    ):
+        meta = convert_csv_to_store(symbol, source_path, store_path)
+
+    series = open_store(symbol, store_path, meta)
+    _SERIES_CACHE[cache_key] = _CacheEntry(series, signature)
+    return series
@@ -0,0 +1,187 @@
+"""
+Reddit Archive Index
+
+Builds, for every subreddit ``.jsonl`` file, an index from posting date
+(yyyy-mm-dd, UTC) to the byte ranges of the lines posted that day. A query for
+one date or a date range then seeks to and reads only those ranges instead of
+parsing every line of the file.
+
+Indexes are built on first use, persisted as JSON under the configured
+``reddit_index_dir`` and rebuilt when the source file changes (size or mtime).
+"""
+
+import json
+import mmap
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .config import get_config
+from .json_decoding import get_timestamp_decoder
+
+INDEX_VERSION = 1
+
+# Process-level cache of loaded indexes, keyed by absolute source path
+_INDEX_CACHE: Dict[str, "FileIndex"] = {}
+
+
+def post_date(created_utc) -> str:
+    """Posting date (yyyy-mm-dd, UTC) of a post's created_utc timestamp."""
+    return datetime.utcfromtimestamp(created_utc).strftime("%Y-%m-%d")
+
+
+class FileIndex:
+    """
+    Date -> byte ranges index of one ``.jsonl`` file.
+
+    Ranges of a date are in file order; adjacent lines of the same date share
+    one range.
+    """
+
+    def __init__(self, path: str, dates: Dict[str, List[Tuple[int, int]]], signature: Dict):
+        self.path = path
+        self.dates = dates
+        self.signature = signature
+        self._sorted_dates = sorted(dates)
+
+    def ranges(self, start_date: str, end_date: Optional[str] = None) -> List[Tuple[int, int]]:
+        """Byte ranges of the lines posted between start_date and end_date (inclusive), in file order."""
+        if end_date is None:
+            return list(self.dates.get(start_date, []))
+        ranges = [
+            byte_range
+            for date in self._sorted_dates
+            if start_date <= date <= end_date
+            for byte_range in self.dates[date]
+        ]
+        ranges.sort()
+        return _coalesce(ranges)
+
+    def read_lines(self, start_date: str, end_date: Optional[str] = None) -> Iterator[bytes]:
+        """Yield the raw lines posted between start_date and end_date, in file order."""
+        ranges = self.ranges(start_date, end_date)
+        if not ranges:
+            return
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            # one slice of the memory map per range, split into lines in C
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for start, end in ranges:
+                    for line in mm[start:end].splitlines():
+                        if line and not line.isspace():
+                            yield line
+
+
+def _coalesce(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged: List[Tuple[int, int]] = []
+    for start, end in ranges:
+        if merged and merged[-1][1] == start:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _signature(path: str) -> Dict:
+    stat = os.stat(path)
+    return {"source_mtime": stat.st_mtime_ns, "source_size": stat.st_size}
+
+
+def build_file_index(path: str) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Scan a ``.jsonl`` file once and map each posting date to its byte ranges.
+
+    Args:
+        path (str): Path of the subreddit file
+
+    Returns:
+        dict: yyyy-mm-dd -> list of (start, end) byte offsets, in file order
+    """
+    decode_timestamp = get_timestamp_decoder()
+    dates: Dict[str, List[Tuple[int, int]]] = {}
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            start, offset = offset, offset + len(line)
+            if line.isspace():
+                continue
+            date = post_date(decode_timestamp(line))
+            ranges = dates.setdefault(date, [])
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], offset)
+            else:
+                ranges.append((start, offset))
+    return dates
+
+
+def get_index_dir() -> str:
+    """Return the directory the Reddit indexes are persisted in."""
+    config = get_config()
+    return config.get(
+        "reddit_index_dir", os.path.join(config["data_cache_dir"], "reddit_index")
+    )
+
+
+def _index_path(path: str) -> str:
+    category = os.path.basename(os.path.dirname(path))
+    return os.path.join(get_index_dir(), category, os.path.basename(path) + ".json")
+
+
+def _read_index(index_path: str) -> Optional[Dict]:
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_index(index_path: str, payload: Dict):
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    tmp_path = f"{index_path}.tmp-{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, index_path)
+
+
+def load_file_index(path: str) -> FileIndex:
+    """
+    Return the date index of a ``.jsonl`` file, building and persisting it if needed.
+
+    Args:
+        path (str): Path of the subreddit file
+
+    Returns:
+        FileIndex: Index of the file's current contents
+    """
+    path = os.path.abspath(path)
+    signature = _signature(path)
+
+    cached = _INDEX_CACHE.get(path)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    index_path = _index_path(path)
+    payload = _read_index(index_path)
+    if (
+        payload is None
+        or payload.get("version") != INDEX_VERSION
+        or payload.get("source") != path
+        or payload.get("source_mtime") != signature["source_mtime"]
+        or payload.get("source_size") != signature["source_size"]
+    ):
+        payload = {
+            "version": INDEX_VERSION,
+            "source": path,
+            **signature,
+            "dates": build_file_index(path),
+        }
+        _write_index(index_path, payload)
+
+    index = FileIndex(
+        path,
+        {date: [tuple(r) for r in ranges] for date, ranges in payload["dates"].items()},
+        signature,
+    )
+    _INDEX_CACHE[path] = index
+    return index
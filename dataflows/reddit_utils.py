@@ -3,9 +3,13 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from typing import Annotated, Dict, List
 import os
 import re
+import heapq
+from .reddit_index import load_file_index, post_date
+from .ticker_matcher import TickerMatcher
+from .json_decoding import get_post_decoder
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -51,87 +55,108 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
+# Compiled once per ticker on first use
+company_matcher = TickerMatcher(ticker_to_company)
+
+
+def fetch_top_from_category_range(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
     ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
     query: Annotated[str, "Optional query to search for in the subreddit."] = None,
     data_path: Annotated[
         str,
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
-):
+) -> Dict[str, List[dict]]:
+    """
+    Fetch the top posts of every day in a date range with one pass per subreddit file.
+
+    Each file is read once (only the byte ranges of the window) and its posts
+    are bucketed by day into bounded heaps that keep the per-day top
+    ``max_limit // number of files``, so the result equals calling
+    fetch_top_from_category for each day.
+
+    Returns:
+        dict: yyyy-mm-dd -> posts of that day, ordered by subreddit file and then
+        by upvotes descending (ties in file order), for the days that have posts
+    """
     base_path = data_path
 
-    all_content = []
+    data_files = os.listdir(os.path.join(base_path, category))
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    if max_limit < len(data_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(data_files)
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
+    all_content: Dict[str, List[dict]] = {}
+    if limit_per_subreddit <= 0:
+        return all_content
+
+    decode_post = get_post_decoder()
+
+    for data_file in data_files:
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
-
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
-
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
+        # per-day min-heaps of (upvotes, -position, date, post): the root is the
+        # post to evict, the lowest upvotes and, among equal upvotes, the latest in the file
+        heaps: Dict[str, list] = {}
+
+        index = load_file_index(os.path.join(base_path, category, data_file))
+        for position, line in enumerate(index.read_lines(start_date, end_date)):
+            post = decode_post(line)
+
+            # if is company_news, check that the title or the content has the company's name (query) mentioned
+            if "company" in category and query and not company_matcher.mentions(
+                query, post.title, post.selftext
+            ):
+                continue
+
+            date = post_date(post.created_utc)
+            entry = (post.ups, -position, date, post)
+            heap = heaps.setdefault(date, [])
+            if len(heap) < limit_per_subreddit:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+        for date, heap in heaps.items():
+            # positions are unique, so the sort never compares the posts themselves
+            heap.sort(key=lambda entry: entry[:2], reverse=True)
+            all_content.setdefault(date, []).extend(
+                {
+                    "title": post.title,
+                    "content": post.selftext,
+                    "url": post.url,
+                    "upvotes": post.ups,
+                    "posted_date": date,
                 }
+                for _, _, date, post in heap
+            )
 
-                all_content_curr_subreddit.append(post)
-
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    return dict(sorted(all_content.items()))
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
 
-    return all_content
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query, data_path
+    ).get(date, [])
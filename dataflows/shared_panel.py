@@ -0,0 +1,182 @@
+"""
+Shared-Memory Price Panel
+
+Publishes a PricePanel into a single ``multiprocessing.shared_memory`` block
+once, so process-pool workers attach read-only NumPy views of it instead of
+each reloading and holding their own copy of every price series.
+
+Typical use::
+
+    panel = load_price_panel(symbols)
+    with publish_price_panel(panel) as shared:
+        with ProcessPoolExecutor(
+            initializer=init_panel_worker, initargs=(shared.manifest,)
+        ) as pool:
+            ...  # workers call get_worker_panel()
+
+The manifest is a small picklable dict (block name, array layout, symbols);
+the price data itself never crosses the process boundary.
+"""
+
+import mmap
+import os
+import sys
+from multiprocessing import shared_memory
+from typing import Dict, Optional
+
+import numpy as np
+
+from .price_panel import PricePanel
+
+# Array offsets inside the block are rounded up to this many bytes
+_ALIGNMENT = 64
+
+# Panel attached by init_panel_worker in a worker process
+_WORKER_PANEL: Optional[PricePanel] = None
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class SharedPanel:
+    """
+    Owner side of a published panel.
+
+    The block lives until ``unlink`` is called (or the ``with`` block exits);
+    workers that are still attached keep their mapping valid until they exit.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, manifest: Dict):
+        self.shm = shm
+        self.manifest = manifest
+
+    def close(self):
+        self.shm.close()
+
+    def unlink(self):
+        self.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.unlink()
+
+
+def publish_price_panel(panel: PricePanel, name: Optional[str] = None) -> SharedPanel:
+    """
+    Copy a panel into one shared-memory block.
+
+    Args:
+        panel (PricePanel): Panel to publish
+        name (str): Name of the block, or None for a generated one
+
+    Returns:
+        SharedPanel: Handle holding the block and the manifest workers attach with
+    """
+    arrays = {"__dates__": panel.dates, "__present__": panel.present}
+    arrays.update(panel.fields)
+
+    layout = {}
+    size = 0
+    for key, array in arrays.items():
+        array = np.asarray(array)
+        offset = _aligned(size)
+        layout[key] = {
+            "offset": offset,
+            "shape": list(array.shape),
+            "dtype": array.dtype.str,
+        }
+        size = offset + array.nbytes
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+    for key, array in arrays.items():
+        spec = layout[key]
+        target = np.ndarray(spec["shape"], dtype=spec["dtype"], buffer=shm.buf, offset=spec["offset"])
+        target[...] = array
+
+    manifest = {
+        "name": shm.name,
+        "symbols": list(panel.symbols),
+        "offsets": [int(offset) for offset in panel.offsets],
+        "fields": list(panel.fields.keys()),
+        "layout": layout,
+    }
+    return SharedPanel(shm, manifest)
+
+
+class _ReadOnlyBlock:
+    """A POSIX shared-memory block mapped read-only, without registering it with the resource tracker."""
+
+    def __init__(self, name: str):
+        import _posixshmem
+
+        fd = _posixshmem.shm_open("/" + name, os.O_RDONLY, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        self.name = name
+        self.buf = memoryview(self._mmap)
+
+    def close(self):
+        self.buf.release()
+        self._mmap.close()
+
+
+def _open_block(name: str):
+    # The owner is the only process that may unlink the block, so attaching
+    # must not register it with a resource tracker: a worker with a tracker of
+    # its own would unlink it on exit. Unregistering after attaching is not an
+    # option either, since pool workers share the owner's tracker and would
+    # drop the owner's registration.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    if os.name == "nt":
+        # Windows frees the block with its last handle and has no tracker
+        return shared_memory.SharedMemory(name=name)
+    return _ReadOnlyBlock(name)
+
+
+def attach_price_panel(manifest: Dict) -> PricePanel:
+    """
+    Attach to a published panel without copying.
+
+    Args:
+        manifest (dict): ``SharedPanel.manifest`` of the published panel
+
+    Returns:
+        PricePanel: Panel whose arrays are read-only views of the shared block
+    """
+    shm = _open_block(manifest["name"])
+
+    def view(key):
+        spec = manifest["layout"][key]
+        array = np.ndarray(spec["shape"], dtype=spec["dtype"], buffer=shm.buf, offset=spec["offset"])
+        array.flags.writeable = False
+        return array
+
+    # The views are only valid while the mapping is open, so the panel keeps the block
+    return PricePanel(
+        manifest["symbols"],
+        view("__dates__"),
+        {field: view(field) for field in manifest["fields"]},
+        view("__present__"),
+        np.asarray(manifest["offsets"], dtype=np.int64),
+        buffer_owner=shm,
+    )
+
+
+def init_panel_worker(manifest: Dict):
+    """Process-pool initializer: attach the published panel once per worker."""
+    global _WORKER_PANEL
+    _WORKER_PANEL = attach_price_panel(manifest)
+
+
+def get_worker_panel() -> PricePanel:
+    """Return the panel attached by ``init_panel_worker`` in this process."""
+    if _WORKER_PANEL is None:
+        raise RuntimeError("No shared price panel attached; use init_panel_worker as the pool initializer")
+    return _WORKER_PANEL
@@ -1,88 +1,183 @@
+import numpy as np
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
-from typing import Annotated
-import os
+from typing import Annotated, Dict, List
 from .config import get_config
+from .price_store import load_price_series
+from .catalog import get_catalog
+from .price_cache import get_online_price_history
+from . import indicators
 
 
 class StockstatsUtils:
     @staticmethod
-    def get_stock_stats(
+    def load_stock_frame(
         symbol: Annotated[str, "ticker symbol for the company"],
-        indicator: Annotated[
-            str, "quantitative indicators based off of the stock data for the company"
-        ],
-        curr_date: Annotated[
-            str, "curr date for retrieving stock price data, YYYY-mm-dd"
-        ],
         data_dir: Annotated[
             str,
-            "directory where the stock data is stored.",
+            "root directory of the offline data (DATA_DIR).",
         ],
         online: Annotated[
             bool,
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
+        """
+        Load the full price history of a symbol as a DataFrame with yyyy-mm-dd dates.
 
+        The frame is indexed by a sorted DatetimeIndex of the same dates, so
+        point and range lookups are a binary search instead of a string scan.
+        """
         if not online:
             try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2010-08-21-2025-08-21.csv",
-                        #f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
+                series = load_price_series(
+                    symbol, get_catalog(data_dir).price_path(symbol)
                 )
-                df = wrap(data)
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+            data = series.to_frame(iso_dates=True)
+            data.index = pd.DatetimeIndex(series.dates)
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
+            # Per-symbol cache that only fetches the bars it does not have yet
+            data = get_online_price_history(symbol)
+            data.index = pd.DatetimeIndex(data["Date"])
+            data["Date"] = data["Date"].dt.strftime("%Y-%m-%d")
+
+        data.index.name = None
+        return data
+
+    @staticmethod
+    def date_bounds(
+        data: Annotated[pd.DataFrame, "price history returned by load_stock_frame"],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+    ):
+        """Return the [lo, hi) row positions of the dates between start_date and end_date, inclusive."""
+        lo = data.index.searchsorted(pd.Timestamp(start_date), side="left")
+        hi = data.index.searchsorted(pd.Timestamp(end_date), side="right")
+        return int(lo), int(max(lo, hi))
+
+    @staticmethod
+    def compute_indicator(
+        data: Annotated[pd.DataFrame, "price history returned by load_stock_frame"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+    ) -> np.ndarray:
+        """
+        Compute an indicator column for a price frame.
+
+        Stockstats computes every indicator by default. With the
+        "indicator_engine" setting "native", indicators with a native
+        implementation use the vectorized engine in dataflows.indicators
+        instead; its values agree to about 1e-9 relative, so the printed
+        reports can differ in the last digits.
+        """
+        engine = get_config().get("indicator_engine", "stockstats")
+        if engine == "native" and indicators.is_supported(indicator):
+            return indicators.compute_indicator(indicator, data)
 
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+        df = wrap(data)
+        return df[indicator].values  # trigger stockstats to calculate the indicator
+
+    @staticmethod
+    def get_stock_stats(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        curr_date: Annotated[
+            str, "curr date for retrieving stock price data, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "root directory of the offline data (DATA_DIR).",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        df = StockstatsUtils.load_stock_frame(symbol, data_dir, online)
+        curr_date = pd.to_datetime(curr_date).normalize()
 
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        values = StockstatsUtils.compute_indicator(df, indicator)
+        row = df.index.searchsorted(curr_date, side="left")
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
+        if row < len(df) and df.index[row] == curr_date:
+            indicator_value = values[row]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[
+            str, "first date of the window, YYYY-mm-dd"
+        ],
+        end_date: Annotated[
+            str, "last date of the window, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "root directory of the offline data (DATA_DIR).",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> Dict[str, object]:
+        """
+        Compute an indicator once over the whole series and return its values for a date window.
+
+        Returns:
+            dict: Indicator value keyed by yyyy-mm-dd for every trading day in the window
+        """
+        df = StockstatsUtils.load_stock_frame(symbol, data_dir, online)
+        values = StockstatsUtils.compute_indicator(df, indicator)
+
+        dates = df["Date"].values
+        lo, hi = StockstatsUtils.date_bounds(df, start_date, end_date)
+
+        return dict(zip(dates[lo:hi], values[lo:hi]))
+
+    @staticmethod
+    def get_stock_stats_table(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            List[str], "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[
+            str, "first date of the window, YYYY-mm-dd"
+        ],
+        end_date: Annotated[
+            str, "last date of the window, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "root directory of the offline data (DATA_DIR).",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """
+        Compute several indicators from a single load of the price data.
+
+        Returns:
+            DataFrame: One row per trading day in the window (indexed by yyyy-mm-dd) and one column per indicator
+        """
+        df = StockstatsUtils.load_stock_frame(symbol, data_dir, online)
+
+        dates = df["Date"].values
+        lo, hi = StockstatsUtils.date_bounds(df, start_date, end_date)
+
+        table = pd.DataFrame(index=pd.Index(dates[lo:hi], name="Date"))
+        for indicator in indicators:
+            table[indicator] = StockstatsUtils.compute_indicator(df, indicator)[lo:hi]
+        return table
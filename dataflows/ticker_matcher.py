@@ -0,0 +1,213 @@
+"""
+Ticker Mention Matching
+
+Compiled matchers deciding whether a post mentions a company, by one of its
+names or its ticker. Each ticker's search terms are joined into a single
+pattern compiled once.
+
+``tickers_in`` reports every ticker mentioned in a text, which is what the
+ticker -> post inverted index is built with. The terms that are plain ASCII
+literals (nearly all company names and tickers) are found in one ``finditer``
+scan of the lowercased text with a single pattern of all of them, factored
+into a prefix tree so that a position costs one character dispatch rather
+than a try of every term. The few terms using regex syntax are searched
+separately, and a text containing one of the non-ASCII characters that
+case-fold to ASCII letters falls back to the per-ticker patterns.
+
+Terms are used as regular expressions, unescaped and case-insensitive, the
+same way the Reddit company-news filter has always searched them, and
+``tickers_in`` returns exactly the tickers ``mentions`` accepts.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Set, Tuple
+
+from .json_decoding import get_post_decoder
+from .reddit_index import post_date
+
+
+def company_terms(ticker: str, companies: Mapping[str, str]) -> List[str]:
+    """Search terms for a ticker: its " OR "-separated company names and the ticker itself."""
+    if "OR" in companies[ticker]:
+        terms = companies[ticker].split(" OR ")
+    else:
+        terms = [companies[ticker]]
+    terms.append(ticker)
+    return terms
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    return "|".join(f"(?:{term})" for term in terms)
+
+
+_REGEX_SYNTAX = frozenset(".^$*+?{}[]\\|()")
+
+# The non-ASCII characters re.IGNORECASE matches to an ASCII letter, or whose
+# lowercase contains one; lowercasing a text without them and searching it for
+# lowercase ASCII literals is the same as a case-insensitive regex search
+_CASE_FOLD_HAZARDS = re.compile("[\u0130\u0131\u017f\u212a]")
+
+
+def _is_literal(term: str) -> bool:
+    return term.isascii() and not _REGEX_SYNTAX.intersection(term)
+
+
+def _prefix_tree_pattern(terms: Iterable[str]) -> str:
+    """Regex of literal terms factored into a prefix tree, matching the longest term at a position."""
+    tree: Dict[str, dict] = {}
+    for term in terms:
+        node = tree
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # a term ends here; the greedy group tries the longer terms first
+            body = f"(?:{body})?"
+        return body
+
+    return emit(tree)
+
+
+class _LiteralScanner:
+    """
+    Finds which of many lowercase ASCII literals occur in a lowercased text, in one regex scan.
+
+    ``finditer`` over the prefix-tree pattern reports the longest term at each
+    match without overlaps; the overlapping terms are recovered from the terms
+    themselves. A match implies every term it contains, and the few terms that
+    start inside it and extend past its end are checked with ``startswith``.
+
+    Args:
+        term_tickers (dict): Lowercase literal term -> tickers it stands for
+    """
+
+    def __init__(self, term_tickers: Mapping[str, FrozenSet[str]]):
+        terms = sorted(term_tickers)
+        self._pattern = re.compile(_prefix_tree_pattern(terms))
+        # term -> tickers of every term it contains
+        self._implied = {
+            term: frozenset().union(*(term_tickers[other] for other in terms if other in term))
+            for term in terms
+        }
+        # term -> (offset, other term) of the terms that can start inside it and end past it
+        self._extensions = {
+            term: [
+                (offset, other)
+                for offset in range(1, len(term))
+                for other in terms
+                if len(other) > len(term) - offset and other.startswith(term[offset:])
+            ]
+            for term in terms
+        }
+
+    def scan(self, text: str) -> Set[str]:
+        """Return the tickers of the terms occurring in a lowercased text."""
+        found: Set[str] = set()
+        for match in self._pattern.finditer(text):
+            term = match.group()
+            found |= self._implied[term]
+            for offset, other in self._extensions[term]:
+                if text.startswith(other, match.start() + offset):
+                    found |= self._implied[other]
+        return found
+
+
+class TickerMatcher:
+    """
+    Mention matcher over a ticker -> company name(s) mapping.
+
+    Args:
+        companies (dict): Ticker -> company name, alternatives separated by " OR "
+    """
+
+    def __init__(self, companies: Mapping[str, str]):
+        self.companies = companies
+        self._patterns: Dict[str, Pattern] = {}
+        self._combined: Optional[Tuple[Tuple[str, ...], _LiteralScanner, Dict[str, Pattern]]] = None
+
+    def pattern(self, ticker: str) -> Pattern:
+        """Compiled pattern matching any search term of a ticker (KeyError for unknown tickers)."""
+        pattern = self._patterns.get(ticker)
+        if pattern is None:
+            pattern = re.compile(
+                _alternation(company_terms(ticker, self.companies)), re.IGNORECASE
+            )
+            self._patterns[ticker] = pattern
+        return pattern
+
+    def mentions(self, ticker: str, title: str, content: str) -> bool:
+        """Whether the title or the content mentions the ticker's company."""
+        pattern = self.pattern(ticker)
+        return bool(pattern.search(title) or pattern.search(content))
+
+    def _combined_matchers(self) -> Tuple[Tuple[str, ...], _LiteralScanner, Dict[str, Pattern]]:
+        tickers = tuple(self.companies)
+        if self._combined is None or self._combined[0] != tickers:
+            term_tickers: Dict[str, Set[str]] = {}
+            regex_terms: Dict[str, List[str]] = {}
+            for ticker in tickers:
+                for term in company_terms(ticker, self.companies):
+                    if _is_literal(term):
+                        term_tickers.setdefault(term.lower(), set()).add(ticker)
+                    else:
+                        regex_terms.setdefault(ticker, []).append(term)
+            scanner = _LiteralScanner(
+                {term: frozenset(found) for term, found in term_tickers.items()}
+            )
+            regexes = {
+                ticker: re.compile(_alternation(terms), re.IGNORECASE)
+                for ticker, terms in regex_terms.items()
+            }
+            self._combined = (tickers, scanner, regexes)
+        return self._combined
+
+    def tickers_in(self, *texts: str) -> List[str]:
+        """Return the tickers mentioned in any of the texts, in mapping order."""
+        tickers, scanner, regexes = self._combined_matchers()
+        found: Set[str] = set()
+        for text in texts:
+            if _CASE_FOLD_HAZARDS.search(text):
+                found.update(ticker for ticker in tickers if self.pattern(ticker).search(text))
+                continue
+            found |= scanner.scan(text.lower())
+            found.update(
+                ticker
+                for ticker, regex in regexes.items()
+                if ticker not in found and regex.search(text)
+            )
+        return [ticker for ticker in tickers if ticker in found]
+
+
+def build_ticker_index(
+    paths: Iterable[str], matcher: TickerMatcher
+) -> Dict[str, List[Tuple[str, int, str]]]:
+    """
+    Scan Reddit ``.jsonl`` files once and index the posts mentioning each ticker.
+
+    Args:
+        paths (list): Subreddit files to scan
+        matcher (TickerMatcher): Matcher holding the tickers to index
+
+    Returns:
+        dict: ticker -> list of (file path, byte offset of the post's line, posting date), in file order
+    """
+    decode_post = get_post_decoder()
+    index: Dict[str, List[Tuple[str, int, str]]] = {ticker: [] for ticker in matcher.companies}
+    for path in paths:
+        offset = 0
+        with open(path, "rb") as f:
+            for line in f:
+                start, offset = offset, offset + len(line)
+                if line.isspace():
+                    continue
+                post = decode_post(line)
+                date = post_date(post.created_utc)
+                for ticker in matcher.tickers_in(post.title, post.selftext):
+                    index[ticker].append((path, start, date))
+    return index
@@ -1,25 +1,153 @@
 # gets data/stats
 
 import yfinance as yf
-from typing import Annotated, Callable, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Callable, Any, Dict, Iterable, List, Optional, Tuple
 from pandas import DataFrame
 import pandas as pd
 from functools import wraps
 
+from .config import get_config
 from .utils import save_output, SavePathType, decorate_all_methods
 
+# Ticker properties whose payloads are cached; each one is a network round-trip
+CACHED_PAYLOADS = {
+    "info",
+    "financials",
+    "quarterly_financials",
+    "balance_sheet",
+    "quarterly_balance_sheet",
+    "cashflow",
+    "quarterly_cashflow",
+    "dividends",
+    "recommendations",
+}
+
+# Payloads fetched by fetch_fundamentals_bulk by default
+BULK_PAYLOADS = ("info", "financials", "dividends", "recommendations")
+
+# Process-level cache of tickers, keyed by upper-case symbol: (expires at, ticker)
+_TICKER_CACHE: Dict[str, Tuple[float, "CachedTicker"]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def get_cache_ttl() -> float:
+    """Return how long, in seconds, tickers and their payloads are cached."""
+    return float(get_config().get("yfinance_cache_ttl", 900))
+
+
+class CachedTicker:
+    """
+    Proxy around a yf.Ticker that keeps each fetched payload for ``ttl`` seconds.
+
+    Only the properties in CACHED_PAYLOADS are cached; everything else (e.g.
+    ``history``) goes straight to the wrapped ticker. Cached payloads are
+    shared between callers and must not be modified.
+    """
+
+    def __init__(self, symbol: str, ttl: float):
+        self._ticker = yf.Ticker(symbol)
+        self._ttl = ttl
+        self._payloads: Dict[str, Tuple[float, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _payload(self, name: str) -> Any:
+        cached = self._payloads.get(name)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        with self._locks_lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        # One request per payload: concurrent callers wait for the first fetch
+        with lock:
+            cached = self._payloads.get(name)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+            value = getattr(self._ticker, name)
+            self._payloads[name] = (time.monotonic() + self._ttl, value)
+            return value
+
+    def __getattr__(self, name: str) -> Any:
+        if name in CACHED_PAYLOADS:
+            return self._payload(name)
+        return getattr(self._ticker, name)
+
+
+def get_ticker(symbol: Annotated[str, "ticker symbol"]) -> CachedTicker:
+    """Return the cached ticker of a symbol, creating it if missing or expired."""
+    key = symbol.upper()
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        cached = _TICKER_CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        ttl = get_cache_ttl()
+        for expired in [k for k, (expires, _) in _TICKER_CACHE.items() if expires <= now]:
+            del _TICKER_CACHE[expired]
+        ticker = CachedTicker(key, ttl)
+        _TICKER_CACHE[key] = (now + ttl, ticker)
+        return ticker
+
+
+def clear_ticker_cache():
+    """Drop every cached ticker and payload."""
+    with _CACHE_LOCK:
+        _TICKER_CACHE.clear()
+
 
 def init_ticker(func: Callable) -> Callable:
-    """Decorator to initialize yf.Ticker and pass it to the function."""
+    """Decorator to pass the (cached) ticker of the symbol to the function."""
 
     @wraps(func)
     def wrapper(symbol: Annotated[str, "ticker symbol"], *args, **kwargs) -> Any:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
         return func(ticker, *args, **kwargs)
 
     return wrapper
 
 
+def fetch_fundamentals_bulk(
+    symbols: Annotated[Iterable[str], "ticker symbols"],
+    payloads: Annotated[Iterable[str], "ticker properties to fetch"] = BULK_PAYLOADS,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch several payloads for a list of symbols concurrently, through the ticker cache.
+
+    Args:
+        symbols (list): Ticker symbols
+        payloads (list): Properties to fetch, from CACHED_PAYLOADS
+        max_workers (int): Size of the thread pool, default is the yfinance_max_workers setting
+
+    Returns:
+        dict: symbol -> payload name -> value, None for payloads that failed to fetch
+    """
+    symbols = list(symbols)
+    payloads = list(payloads)
+    unknown = [name for name in payloads if name not in CACHED_PAYLOADS]
+    if unknown:
+        raise ValueError(f"Unknown payloads {unknown}. Please choose from: {sorted(CACHED_PAYLOADS)}")
+    if max_workers is None:
+        max_workers = get_config().get("yfinance_max_workers", 8)
+
+    def fetch(task: Tuple[str, str]) -> Any:
+        symbol, name = task
+        try:
+            return getattr(get_ticker(symbol), name)
+        except Exception as e:
+            print(f"Failed to fetch {name} for {symbol}: {e}")
+            return None
+
+    tasks: List[Tuple[str, str]] = [(symbol, name) for symbol in symbols for name in payloads]
+    results: Dict[str, Dict[str, Any]] = {symbol: {} for symbol in symbols}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks) or 1))) as executor:
+        for (symbol, name), value in zip(tasks, executor.map(fetch, tasks)):
+            results[symbol][name] = value
+    return results
+
+
 @decorate_all_methods(init_ticker)
 class YFinanceUtils:
 
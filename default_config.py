@@ -52,7 +52,51 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,      # Maximum rounds for research team debates
     "max_risk_discuss_rounds": 1, # Maximum rounds for risk management discussions
     "max_recur_limit": 100,      # Maximum recursion limit for agent interactions
+    "analyst_max_workers": 2,    # Analysts of the information gathering step run concurrently
+    "analyst_timeout": None,     # Seconds an analyst may run before the step stops waiting and records it as failed, None for no limit
     
     # Tool and data access settings
     "online_tools": True,  # Enable real-time data fetching vs cached data
+    "catalog_check_interval": 2,  # Seconds between checks of the offline data directories for changes, 0 to check on every lookup
+    "price_store_dir": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "results/data_cache/price_store",
+    ),  # Columnar (memory-mapped .npy) copies of the price CSV files
+    "indicator_engine": "stockstats",  # Options: "stockstats" (reference output), "native" (vectorized NumPy, equal to ~1e-9)
+    "indicator_state_dir": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "results/data_cache/indicator_state",
+    ),  # Persisted incremental indicator states, one JSON file per (symbol, indicator)
+    "reddit_index_dir": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "results/data_cache/reddit_index",
+    ),  # Per-date byte-range indexes of the Reddit .jsonl files
+    "json_decoder": "auto",  # Options: "auto" (fastest installed), "msgspec", "orjson", "json"
+    "finnhub_backend": "memory",  # Options: "memory" (cached, bisect range queries), "sqlite"
+    "finnhub_db_path": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "results/data_cache/finnhub.sqlite",
+    ),  # SQLite database used when finnhub_backend is "sqlite"
+    "simfin_store_dir": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "results/data_cache/simfin_store",
+    ),  # SimFin statement files partitioned by ticker and sorted by publish date
+    "yfinance_cache_ttl": 900,  # Seconds a yf.Ticker and its fetched payloads (info, statements, ...) are reused
+    "yfinance_max_workers": 8,  # Thread pool size of bulk Yahoo Finance fetches
+    "price_service_backend": "yfinance",  # Options: "yfinance", "stub" (serves the offline price data, no network)
+    "price_batch_window": 0.05,  # Seconds online price requests wait to be coalesced into one download
+    "price_live_ttl": 60,  # Seconds cached bars of ranges reaching today are reused
+    "google_news_base_url": "https://www.google.com/search",  # Search endpoint scraped by getNewsData
+    "google_news_rate": 0.25,  # Average Google News requests per second (token bucket)
+    "google_news_burst": 3,  # Google News requests allowed at once
+    "google_news_max_workers": 3,  # Result pages fetched concurrently
+    "google_news_max_pages": 10,  # Result pages scraped per search at most
+    "google_news_timeout": 30,  # Seconds before a Google News request times out
+    "html_parser": "auto",  # Options: "auto" (fastest installed), "selectolax", "lxml", "bs4"
+    "google_news_cache": True,  # Reuse stored Google News results (python -m dataflows.prewarm_news prewarm ...)
+    "google_news_cache_path": os.path.join(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+        "results/data_cache/google_news.sqlite",
+    ),  # SQLite database of Google News results, keyed by (query, start date, end date)
+    "google_news_cache_ttl": 3600,  # Seconds results of a window reaching today are reused; closed windows never expire
 }
@@ -6,8 +6,11 @@ the entire multi-agent trading workflow, from analysis to final decisions.
 """
 
 import os
+import asyncio
 import base64
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from strands import Agent
 from strands.telemetry import StrandsTelemetry
 
@@ -67,6 +70,10 @@ class TradingAgentsGraph:
         # Create trading agent
         self.trader = create_trader(self.quick_llm, "trader_memory", self.config)
         
+        # Analysts with a call in progress; an agent must not run two calls at once
+        self._busy_analysts = set()
+        self._busy_lock = threading.Lock()
+        
         # Ensure working directory exists
         if not os.path.exists(self.working_dir):
             os.makedirs(self.working_dir, exist_ok=True)
@@ -122,44 +129,194 @@ class TradingAgentsGraph:
         else:
             raise ValueError(f"File not found: {file_path}")
     
+    def _analysis_tasks(self, company_of_interest, trade_date):
+        """Return the (analyst, prompt, report file name) tasks of the information gathering step."""
+        return [
+            (self.market_analyst, 
+             f"Analyze the market for {company_of_interest} for the trade date {trade_date}", 
+             "market_report.txt"),
+            (self.news_analyst, 
+             f"Analyze the news for {company_of_interest} for the trade date {trade_date}", 
+             "news_report.txt")
+        ]
+    
+    def _debate_prompt(self, company_of_interest, trade_date, analysis_results):
+        """Build the research team's debate task from the analysts' reports."""
+        market_report = analysis_results.get("market_report.txt", "No market analysis available")
+        news_report = analysis_results.get("news_report.txt", "No news analysis available")
+        
+        return (
+            f"Debate and decide on an investment plan for {company_of_interest} "
+            f"for the trade date {trade_date} based on the following reports:\n\n"
+            f"Market Report:\n{market_report}\n\n"
+            f"News Report:\n{news_report}"
+        )
+    
+    def _debate_outputs(self, investment_plan, bull_history, bear_history):
+        """
+        Collect the outcome of a debate.
+        
+        Returns:
+            tuple: (debate_messages keyed by researcher name, report file name -> content)
+        """
+        messages = {
+            self.bull_researcher.name: [bull_history] if bull_history else [],
+            self.bear_researcher.name: [bear_history] if bear_history else [],
+        }
+        files = {
+            "bull_history.txt": "\n\n".join(messages[self.bull_researcher.name]),
+            "bear_history.txt": "\n\n".join(messages[self.bear_researcher.name]),
+            "investment_plan.txt": str(investment_plan),
+        }
+        return messages, files
+    
+    def _trader_prompt(self, company_of_interest, trade_date, investment_plan):
+        """Build the trader's prompt from the research team's investment plan."""
+        return (
+            f"Based on the following investment plan for {company_of_interest} "
+            f"for the trade date {trade_date}, what is your final trade decision?\n\n"
+            f"{investment_plan}"
+        )
+    
+    def _final_state(self, company_of_interest, trade_date, analysis_results,
+                     investment_plan, debate_messages, final_decision):
+        """Compile the state returned by propagate and apropagate."""
+        return {
+            "company": company_of_interest,
+            "trade_date": trade_date,
+            "analysis_results": analysis_results,
+            "investment_plan": str(investment_plan),
+            "debate_messages": debate_messages,
+            "final_decision": final_decision
+        }
+    
+    def _claim_analyst(self, analyst):
+        """
+        Mark an analyst as running.
+        
+        Raises:
+            RuntimeError: If a previous call on the analyst has not finished
+        """
+        with self._busy_lock:
+            if id(analyst) in self._busy_analysts:
+                raise RuntimeError(f"{analyst.name} is still running a previous analysis")
+            self._busy_analysts.add(id(analyst))
+    
+    def _release_analyst(self, analyst):
+        """Mark an analyst as no longer running."""
+        with self._busy_lock:
+            self._busy_analysts.discard(id(analyst))
+    
+    def _start_analyst(self, analyst, prompt, slots, started, key):
+        """
+        Run one analyst call on its own daemon thread.
+        
+        The thread waits for one of ``slots`` before calling the analyst and
+        records in ``started[key]`` when the call began. The analyst stays
+        claimed until the call really returns, even if nobody waits for it.
+        
+        Returns:
+            Future: The analyst's output as a string
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            self._claim_analyst(analyst)
+        except RuntimeError as e:
+            future.set_exception(e)
+            return future
+        
+        def run():
+            with slots:
+                started[key] = time.monotonic()
+                print(f"Running {analyst.name} analysis...")
+                try:
+                    result, error = str(analyst(prompt)), None
+                except Exception as e:
+                    result, error = None, e
+                finally:
+                    self._release_analyst(analyst)
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+        
+        # A daemon thread, so an analyst abandoned after a timeout never holds up interpreter exit
+        threading.Thread(target=run, name=f"analyst-{analyst.name}", daemon=True).start()
+        return future
+    
     def gather_information_step(self, company_of_interest, trade_date):
         """
         Step 1: Gather information from market and news analysts.
         
+        Analysts run concurrently, at most ``analyst_max_workers`` at a time. One
+        still running ``analyst_timeout`` seconds after it started is recorded as
+        an error and the step returns without it; a thread cannot be stopped, so
+        the call finishes in the background, its output is discarded, and the
+        analyst is refused by later steps until then.
+        
         Args:
             company_of_interest (str): Stock ticker to analyze
             trade_date (str): Date for the analysis
             
         Returns:
-            dict: Analysis results from all analysts
+            dict: Analysis results from all analysts, keyed by report file name, plus
+                "timings": seconds each analyst ran, keyed by analyst name
         """
         prefix = f"{company_of_interest}_{trade_date}".replace(" ", "_")
         
         print(f"Gathering information for {company_of_interest} on {trade_date}...")
         
         # Define analysis tasks
-        tasks = [
-            (self.market_analyst, 
-             f"Analyze the market for {company_of_interest} for the trade date {trade_date}", 
-             "market_report.txt"),
-            (self.news_analyst, 
-             f"Analyze the news for {company_of_interest} for the trade date {trade_date}", 
-             "news_report.txt")
-        ]
+        tasks = self._analysis_tasks(company_of_interest, trade_date)
         
-        results = {}
+        max_workers = self.config.get("analyst_max_workers", len(tasks))
+        timeout = self.config.get("analyst_timeout")
+        slots = threading.BoundedSemaphore(max(1, max_workers))
+        started = {}
         
-        # Execute analysis tasks
-        for analyst, prompt, filename in tasks:
-            print(f"Running {analyst.name} analysis...")
-            try:
-                result = analyst(prompt)
-                self.save_as_file(str(result), prefix, filename)
-                results[filename] = str(result)
-                print(f"{analyst.name} analysis completed")
-            except Exception as e:
-                print(f"Error in {analyst.name} analysis: {e}")
-                results[filename] = f"Error: {e}"
+        # Execute analysis tasks concurrently; they are independent of each other
+        futures = {
+            self._start_analyst(analyst, prompt, slots, started, filename): (analyst, filename)
+            for analyst, prompt, filename in tasks
+        }
+        outcomes = {}
+        timings = {}
+        pending = set(futures)
+        while pending:
+            wait_for = None
+            if timeout is not None:
+                # Each analyst's timeout counts from when it started running
+                deadlines = [started[futures[f][1]] + timeout for f in pending if futures[f][1] in started]
+                wait_for = max(0, min(deadlines) - time.monotonic()) if deadlines else timeout
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                analyst, filename = futures[future]
+                if filename in started:
+                    timings[analyst.name] = round(time.monotonic() - started[filename], 2)
+                try:
+                    result = future.result()
+                    self.save_as_file(result, prefix, filename)
+                    outcomes[filename] = result
+                    print(f"{analyst.name} analysis completed")
+                except Exception as e:
+                    print(f"Error in {analyst.name} analysis: {e}")
+                    outcomes[filename] = f"Error: {e}"
+            
+            if timeout is not None:
+                now = time.monotonic()
+                for future in list(pending):
+                    analyst, filename = futures[future]
+                    if filename in started and now - started[filename] >= timeout:
+                        pending.discard(future)
+                        timings[analyst.name] = round(now - started[filename], 2)
+                        print(f"Error in {analyst.name} analysis: timed out after {timeout}s")
+                        outcomes[filename] = f"Error: timed out after {timeout}s"
+        
+        results = {filename: outcomes[filename] for _, _, filename in tasks}
+        results["timings"] = timings
+        print(f"Analyst timings (seconds): {timings}")
         
         return results
     
@@ -187,26 +344,15 @@ class TradingAgentsGraph:
         )
         
         # Prepare debate context with analysis results
-        market_report = analysis_results.get("market_report.txt", "No market analysis available")
-        news_report = analysis_results.get("news_report.txt", "No news analysis available")
-        
-        debate_prompt = (
-            f"Debate and decide on an investment plan for {company_of_interest} "
-            f"for the trade date {trade_date} based on the following reports:\n\n"
-            f"Market Report:\n{market_report}\n\n"
-            f"News Report:\n{news_report}"
-        )
+        debate_prompt = self._debate_prompt(company_of_interest, trade_date, analysis_results)
         
         # Run the debate
-        investment_plan, messages = research_debate.run(debate_prompt)
+        investment_plan, bull_history, bear_history = research_debate.run(debate_prompt)
         
         # Save debate results
-        bull_history = "\n\n".join(messages.get(self.bull_researcher.name, []))
-        bear_history = "\n\n".join(messages.get(self.bear_researcher.name, []))
-        
-        self.save_as_file(bull_history, prefix, "bull_history.txt")
-        self.save_as_file(bear_history, prefix, "bear_history.txt")
-        self.save_as_file(str(investment_plan), prefix, "investment_plan.txt")
+        messages, files = self._debate_outputs(investment_plan, bull_history, bear_history)
+        for file_name, text in files.items():
+            self.save_as_file(text, prefix, file_name)
         
         print("Research team debate completed")
         
@@ -234,11 +380,7 @@ class TradingAgentsGraph:
             investment_plan = "No investment plan available from research team"
         
         # Generate trading decision
-        trader_prompt = (
-            f"Based on the following investment plan for {company_of_interest} "
-            f"for the trade date {trade_date}, what is your final trade decision?\n\n"
-            f"{investment_plan}"
-        )
+        trader_prompt = self._trader_prompt(company_of_interest, trade_date, investment_plan)
         
         trader_decision = self.trader(trader_prompt)
         self.save_as_file(str(trader_decision), prefix, "trader_decision.txt")
@@ -272,15 +414,139 @@ class TradingAgentsGraph:
         final_decision = self.trading_decision_step(company_of_interest, trade_date)
         
         # Compile final state
-        final_state = {
-            "company": company_of_interest,
-            "trade_date": trade_date,
-            "analysis_results": analysis_results,
-            "investment_plan": str(investment_plan),
-            "debate_messages": debate_messages,
-            "final_decision": final_decision
-        }
+        final_state = self._final_state(
+            company_of_interest, trade_date, analysis_results,
+            investment_plan, debate_messages, final_decision
+        )
+        
+        print(f"Complete analysis finished for {company_of_interest}")
+        
+        return final_state, final_decision
+    
+    async def asave_as_file(self, text, prefix='', file_name=''):
+        """Asynchronous ``save_as_file``; the write runs in a worker thread, off the event loop."""
+        await asyncio.to_thread(self.save_as_file, text, prefix, file_name)
+    
+    async def aread_file(self, prefix='', file_name=''):
+        """Asynchronous ``read_file``; the read runs in a worker thread, off the event loop."""
+        return await asyncio.to_thread(self.read_file, prefix, file_name)
+    
+    async def agather_information_step(self, company_of_interest, trade_date):
+        """
+        Asynchronous version of ``gather_information_step``.
+        
+        The analysts run on their own threads exactly as in the synchronous
+        step, which is awaited in a worker thread: the event loop stays free
+        and ``analyst_timeout`` bounds how long the step takes.
+        
+        Args:
+            company_of_interest (str): Stock ticker to analyze
+            trade_date (str): Date for the analysis
+            
+        Returns:
+            dict: Analysis results from all analysts, as returned by ``gather_information_step``
+        """
+        return await asyncio.to_thread(self.gather_information_step, company_of_interest, trade_date)
+    
+    async def aresearch_debate_step(self, company_of_interest, trade_date, analysis_results):
+        """
+        Asynchronous version of ``research_debate_step``, using ``ConversationSwarm.arun``.
+        
+        Args:
+            company_of_interest (str): Stock ticker to analyze
+            trade_date (str): Date for the analysis
+            analysis_results (dict): Results from information gathering step
+            
+        Returns:
+            tuple: (investment_plan, debate_messages)
+        """
+        prefix = f"{company_of_interest}_{trade_date}".replace(" ", "_")
+        
+        print("Starting research team debate...")
+        
+        research_debate = ConversationSwarm(
+            agents=[self.bull_researcher, self.bear_researcher],
+            summarizer_agent=self.research_manager,
+            coordination="competitive"
+        )
+        
+        debate_prompt = self._debate_prompt(company_of_interest, trade_date, analysis_results)
+        investment_plan, bull_history, bear_history = await research_debate.arun(debate_prompt)
+        
+        messages, files = self._debate_outputs(investment_plan, bull_history, bear_history)
+        await asyncio.gather(
+            *(self.asave_as_file(text, prefix, file_name) for file_name, text in files.items())
+        )
+        
+        print("Research team debate completed")
+        
+        return investment_plan, messages
+    
+    async def atrading_decision_step(self, company_of_interest, trade_date):
+        """
+        Asynchronous version of ``trading_decision_step``, using the trader's ``invoke_async``.
+        
+        Args:
+            company_of_interest (str): Stock ticker to analyze
+            trade_date (str): Date for the analysis
+            
+        Returns:
+            str: Final trading decision
+        """
+        prefix = f"{company_of_interest}_{trade_date}".replace(" ", "_")
+        
+        print("Making final trading decision...")
+        
+        try:
+            investment_plan = await self.aread_file(prefix, "investment_plan.txt")
+        except ValueError:
+            investment_plan = "No investment plan available from research team"
+        
+        trader_decision = await self.trader.invoke_async(
+            self._trader_prompt(company_of_interest, trade_date, investment_plan)
+        )
+        await self.asave_as_file(str(trader_decision), prefix, "trader_decision.txt")
+        
+        print("Trading decision completed")
+        
+        return str(trader_decision)
+    
+    async def apropagate(self, company_of_interest, trade_date):
+        """
+        Execute the complete trading analysis workflow as a coroutine.
+        
+        Same stages and results as ``propagate``, but every agent call is
+        awaited and file I/O runs off the event loop, so one event loop can
+        drive many runs concurrently, e.g.
+        ``await asyncio.gather(*(graph.apropagate(ticker, date) for graph, ticker in runs))``.
+        Agents keep their conversation history, so concurrent runs need
+        separate TradingAgentsGraph instances.
+        
+        Args:
+            company_of_interest (str): Stock ticker to analyze
+            trade_date (str): Date for the analysis
+            
+        Returns:
+            tuple: (final_state, final_decision) containing all results and final decision
+        """
+        print(f"Starting complete analysis for {company_of_interest} on {trade_date}")
+        
+        # Step 1: Information gathering
+        analysis_results = await self.agather_information_step(company_of_interest, trade_date)
+        
+        # Step 2: Research team debate
+        investment_plan, debate_messages = await self.aresearch_debate_step(
+            company_of_interest, trade_date, analysis_results
+        )
+        
+        # Step 3: Trading decision
+        final_decision = await self.atrading_decision_step(company_of_interest, trade_date)
+        
+        final_state = self._final_state(
+            company_of_interest, trade_date, analysis_results,
+            investment_plan, debate_messages, final_decision
+        )
         
         print(f"Complete analysis finished for {company_of_interest}")
         
-        return final_state, final_decision
\ No newline at end of file
+        return final_state, final_decision
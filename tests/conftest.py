@@ -0,0 +1,80 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from dataflows.config import get_config, set_config
+
+
+@pytest.fixture
+def configure():
+    """Override config values for one test; the previous config is restored afterwards."""
+    saved = get_config()
+
+    def apply(**overrides):
+        set_config(overrides)
+        return get_config()
+
+    yield apply
+    set_config(saved)
+
+
+def _price_frame(periods: int, seed: int = 0, start: str = "2010-08-23"):
+    """Synthetic Yahoo Finance daily bars: a random walk with consistent OHLC and volume."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=periods)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    high = close * (1 + rng.uniform(0, 0.02, periods))
+    low = close * (1 - rng.uniform(0, 0.02, periods))
+    return pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": (high + low) / 2,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, periods),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        }
+    )
+
+
+@pytest.fixture
+def price_frame():
+    """Factory of synthetic daily bars, ``price_frame(periods, seed=0, start="2010-08-23")``."""
+    return _price_frame
+
+
+@pytest.fixture
+def offline_data(tmp_path, configure, monkeypatch):
+    """
+    An empty offline data directory set as data_dir, with caches under it.
+
+    Returns a function writing the price file of a symbol, ``write_prices(symbol, frame)``.
+    """
+    data_dir = tmp_path / "data"
+    cache_dir = tmp_path / "cache"
+    configure(
+        data_dir=str(data_dir),
+        data_cache_dir=str(cache_dir),
+        price_store_dir=str(cache_dir / "price_store"),
+    )
+    # interface binds DATA_DIR at import
+    monkeypatch.setattr("dataflows.interface.DATA_DIR", str(data_dir))
+
+    def write_prices(symbol, frame):
+        price_dir = data_dir / "market_data" / "price_data"
+        price_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{symbol}-YFin-data-{frame['Date'].iloc[0][:10]}-{frame['Date'].iloc[-1][:10]}.csv"
+        frame.to_csv(price_dir / name, index=False)
+        return str(price_dir / name)
+
+    write_prices.data_dir = str(data_dir)
+    return write_prices
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from dataflows import catalog as catalog_module
+from dataflows.catalog import PRICE_DIR, DataCatalog
+
+
+def _touch(directory, name):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write("Date,Open,High,Low,Close,Adj Close,Volume\n")
+    return path
+
+
+@pytest.fixture
+def price_dir(tmp_path):
+    return os.path.join(tmp_path, PRICE_DIR)
+
+
+def test_price_file_follows_renamed_file(tmp_path, price_dir, configure):
+    configure(catalog_check_interval=0)
+    old = _touch(price_dir, "AAPL-YFin-data-2015-01-01-2025-03-25.csv")
+    catalog = DataCatalog(str(tmp_path))
+    assert catalog.price_file("AAPL", "2025-03-01").path == old
+
+    new = os.path.join(price_dir, "AAPL-YFin-data-2015-01-01-2025-10-01.csv")
+    os.rename(old, new)
+
+    entry = catalog.price_file("AAPL", "2025-09-01")
+    assert entry.path == new
+    assert entry.covers("2025-09-01")
+
+
+def test_price_file_picks_up_newer_file(tmp_path, price_dir, configure):
+    configure(catalog_check_interval=0)
+    _touch(price_dir, "AAPL-YFin-data-2015-01-01-2025-03-25.csv")
+    catalog = DataCatalog(str(tmp_path))
+    newer = _touch(price_dir, "AAPL-YFin-data-2020-01-01-2025-10-01.csv")
+
+    assert catalog.price_file("AAPL").path == newer
+
+
+def test_removed_files_are_not_returned(tmp_path, price_dir):
+    path = _touch(price_dir, "AAPL-YFin-data-2015-01-01-2025-03-25.csv")
+    catalog = DataCatalog(str(tmp_path))
+    os.remove(path)
+
+    assert catalog.price_file("AAPL", "2025-03-01") is None
+    with pytest.raises(FileNotFoundError):
+        catalog.price_path("AAPL", "2025-03-01")
+
+
+def test_entry_is_checked_even_when_directory_looks_unchanged(tmp_path, price_dir):
+    path = _touch(price_dir, "AAPL-YFin-data-2015-01-01-2025-03-25.csv")
+    catalog = DataCatalog(str(tmp_path))
+    mtime = os.stat(price_dir).st_mtime_ns
+    os.remove(path)
+    os.utime(price_dir, ns=(mtime, mtime))
+
+    assert catalog.price_file("AAPL") is None
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_directories_are_checked_once_per_interval(tmp_path, price_dir, configure, monkeypatch):
+    configure(catalog_check_interval=5)
+    clock = Clock()
+    monkeypatch.setattr(catalog_module.time, "monotonic", clock)
+    _touch(price_dir, "AAPL-YFin-data-2015-01-01-2025-03-25.csv")
+    catalog = DataCatalog(str(tmp_path))
+    checks = []
+    is_stale = catalog.is_stale
+    monkeypatch.setattr(catalog, "is_stale", lambda: checks.append(clock.now) or is_stale())
+    newer = _touch(price_dir, "AAPL-YFin-data-2020-01-01-2025-10-01.csv")
+
+    for _ in range(100):
+        assert catalog.price_file("AAPL").end == "2025-03-25"
+    assert catalog.symbols() == ["AAPL"]
+    assert checks == []
+
+    clock.now += 5
+    assert catalog.price_file("AAPL").path == newer
+    assert catalog.price_file("AAPL").path == newer
+    assert checks == [1005.0]
+
+
+def test_refresh_checks_right_away(tmp_path, price_dir, configure):
+    configure(catalog_check_interval=3600)
+    _touch(price_dir, "AAPL-YFin-data-2015-01-01-2025-03-25.csv")
+    catalog = DataCatalog(str(tmp_path))
+    assert catalog.refresh() is False
+
+    _touch(price_dir, "MSFT-YFin-data-2015-01-01-2025-03-25.csv")
+    assert catalog.symbols() == ["AAPL"]
+    assert catalog.refresh() is True
+    assert catalog.symbols() == ["AAPL", "MSFT"]
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from dataflows.finnhub_records import InsiderSentiment, InsiderTransaction, entry_key, unique_records
+
+
+def _baseline_transactions(data):
+    # The list scan the insider transactions report made before the record keys
+    result_str = ""
+    seen_dicts = []
+    for entries in data.values():
+        for entry in entries:
+            if entry not in seen_dicts:
+                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
+                seen_dicts.append(entry)
+    return result_str
+
+
+def _transactions(seed):
+    """Date-keyed insider transactions with repeats across and within days, and fields in shuffled order."""
+    rng = random.Random(seed)
+    pool = [
+        {
+            "name": rng.choice(["COOK TIMOTHY D", "WILLIAMS JEFFREY E", "MAESTRI LUCA"]),
+            "share": rng.randrange(1000, 100000),
+            "change": -rng.randrange(100, 5000),
+            "filingDate": f"2024-01-{rng.randrange(1, 29):02d}",
+            "transactionDate": "2024-01-02",
+            "transactionCode": rng.choice(["S", "M", "F"]),
+            "transactionPrice": rng.choice([185.5, 190.0, 0]),
+            "isDerivative": rng.random() < 0.2,
+            "source": {"id": f"0001-{rng.randrange(5)}", "links": ["sec.gov"]},
+        }
+        for _ in range(40)
+    ]
+    data = {}
+    for day in range(1, 29):
+        entries = []
+        for _ in range(rng.randrange(6)):
+            entry = rng.choice(pool)
+            # a decoded repeat is an equal dict, not necessarily with the same key order
+            items = list(entry.items())
+            rng.shuffle(items)
+            entries.append(dict(items))
+        data[f"2024-01-{day:02d}"] = entries
+    return data
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_transactions_match_list_scan(seed):
+    data = _transactions(seed)
+
+    records = unique_records(data, InsiderTransaction)
+
+    assert "".join(record.to_markdown() for record in records) == _baseline_transactions(data)
+    assert len({record.key for record in records}) == len(records)
+
+
+def test_entry_key_equality_follows_dict_equality():
+    entry = {"year": 2024, "month": 1, "change": -500, "mspr": -12.5, "extra": [1, {"a": None}]}
+    reordered = {"mspr": -12.5, "extra": [1, {"a": None}], "change": -500, "month": 1, "year": 2024}
+
+    assert entry_key(entry) == entry_key(reordered)
+    # 2024 == 2024.0 in a dict comparison, so the keys must agree too
+    assert entry_key(entry) == entry_key(dict(entry, year=2024.0))
+    assert entry_key(entry) != entry_key(dict(entry, extra=[1, {"a": 0}]))
+    # a list is never equal to a dict holding the same items
+    assert entry_key({"a": [1, 2]}) != entry_key({"a": {1: 2}})
+
+
+def test_sentiment_keeps_first_occurrence_in_order():
+    january = {"year": 2024, "month": 1, "change": -500, "mspr": -12.5}
+    february = {"year": 2024, "month": 2, "change": 200, "mspr": 4.0}
+    data = {"2024-01-31": [january], "2024-02-29": [february, dict(january)], "2024-03-01": []}
+
+    records = unique_records(data, InsiderSentiment)
+
+    assert [(record.year, record.month) for record in records] == [(2024, 1), (2024, 2)]
+    assert records[0].to_markdown() == "### 2024-1:\nChange: -500\nMonthly Share Purchase Ratio: -12.5\n\n"
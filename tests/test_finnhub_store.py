@@ -0,0 +1,118 @@
+import json
+import os
+
+import pytest
+
+from dataflows import finnhub_store
+from dataflows.finnhub_store import SQLiteFinnhubStore, load_finnhub_file, query_finnhub
+from dataflows.interface import get_finnhub_company_insider_sentiment, get_finnhub_news
+
+# keys out of order and empty days, as the formatted files have them
+ENTRIES = {
+    "2024-01-05": [{"headline": "Earnings", "summary": "Beat estimates"}],
+    "2024-01-02": [{"headline": "New year", "summary": "Quiet open"}],
+    "2024-01-03": [],
+    "2024-01-09": [{"headline": "Buyback", "summary": "10B"}, {"headline": "Dividend", "summary": "Raised"}],
+    "2023-12-29": [{"headline": "Year end", "summary": "Rally"}],
+    "2024-01-04": [{"headline": "Recall", "summary": "Minor"}],
+}
+
+
+def _baseline(data, start_date, end_date):
+    """The linear filter of the file's keys the store replaces."""
+    return {key: value for key, value in data.items() if start_date <= key <= end_date and len(value) > 0}
+
+
+@pytest.fixture
+def news_path(tmp_path, configure):
+    configure(data_cache_dir=str(tmp_path / "cache"), finnhub_db_path=str(tmp_path / "cache" / "finnhub.sqlite"))
+    directory = tmp_path / "data" / "finnhub_data" / "news_data"
+    directory.mkdir(parents=True)
+    path = directory / "AAPL_data_formatted.json"
+    path.write_text(json.dumps(ENTRIES))
+    finnhub_store._FILE_CACHE.clear()
+    finnhub_store._SQLITE_STORES.clear()
+    yield str(path)
+    finnhub_store._FILE_CACHE.clear()
+    finnhub_store._SQLITE_STORES.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+@pytest.mark.parametrize(
+    "start_date, end_date",
+    [("2024-01-01", "2024-01-31"), ("2024-01-03", "2024-01-04"), ("2023-12-29", "2023-12-29"), ("2025-01-01", "2025-01-31")],
+)
+def test_range_matches_linear_filter(news_path, configure, backend, start_date, end_date):
+    configure(finnhub_backend=backend)
+
+    result = query_finnhub(news_path, "AAPL", "news_data", start_date, end_date)
+
+    expected = _baseline(ENTRIES, start_date, end_date)
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_changed_file_is_read_again(news_path, configure, backend):
+    configure(finnhub_backend=backend)
+    query_finnhub(news_path, "AAPL", "news_data", "2024-01-01", "2024-01-31")
+
+    updated = dict(ENTRIES, **{"2024-01-10": [{"headline": "Split", "summary": "4-for-1"}]})
+    with open(news_path, "w") as f:
+        json.dump(updated, f)
+
+    result = query_finnhub(news_path, "AAPL", "news_data", "2024-01-01", "2024-01-31")
+    assert result == _baseline(updated, "2024-01-01", "2024-01-31")
+
+
+def test_memory_backend_parses_each_file_once(news_path):
+    assert load_finnhub_file(news_path) is load_finnhub_file(news_path)
+
+
+def test_sqlite_store_imports_each_file_once(news_path, tmp_path, monkeypatch):
+    store = SQLiteFinnhubStore(str(tmp_path / "store.sqlite"))
+    store.ensure_imported(news_path, "AAPL", "news_data")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file imported again")
+
+    monkeypatch.setattr(finnhub_store, "get_loads", lambda: fail)
+    store.ensure_imported(news_path, "AAPL", "news_data")
+    monkeypatch.undo()
+
+    # the same file imported as another ticker and period does not mix with the first
+    store.ensure_imported(news_path, "MSFT", "news_data", "annual")
+    assert store.range("AAPL", "news_data", "2024-01-01", "2024-01-31") == _baseline(ENTRIES, "2024-01-01", "2024-01-31")
+    assert store.range("MSFT", "news_data", "2024-01-01", "2024-01-31") == {}
+    assert len(store.range("MSFT", "news_data", "2024-01-01", "2024-01-31", "annual")) == 4
+
+
+def test_unknown_backend(news_path, configure):
+    configure(finnhub_backend="redis")
+
+    with pytest.raises(ValueError):
+        query_finnhub(news_path, "AAPL", "news_data", "2024-01-01", "2024-01-31")
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_reports_are_the_same_with_either_backend(news_path, tmp_path, configure, monkeypatch, backend):
+    configure(finnhub_backend=backend)
+    monkeypatch.setattr("dataflows.interface.DATA_DIR", str(tmp_path / "data"))
+    sentiment = {
+        "2024-01-31": [{"year": 2024, "month": 1, "change": -500, "mspr": -12.5}],
+        "2023-12-31": [{"year": 2023, "month": 12, "change": 200, "mspr": 4.0}],
+    }
+    os.makedirs(tmp_path / "data" / "finnhub_data" / "insider_senti")
+    (tmp_path / "data" / "finnhub_data" / "insider_senti" / "AAPL_data_formatted.json").write_text(json.dumps(sentiment))
+
+    news = get_finnhub_news("AAPL", "2024-01-05", 4)
+    report = get_finnhub_company_insider_sentiment("AAPL", "2024-02-01", 30)
+
+    assert news == (
+        "## AAPL News, from 2024-01-01 to 2024-01-05:\n"
+        "### Earnings (2024-01-05)\nBeat estimates\n\n"
+        "### New year (2024-01-02)\nQuiet open\n\n"
+        "### Recall (2024-01-04)\nMinor\n\n"
+    )
+    assert "### 2024-1:\nChange: -500\nMonthly Share Purchase Ratio: -12.5" in report
+    assert "2023-12" not in report
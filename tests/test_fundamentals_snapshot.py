@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataflows import fundamentals_store
+from dataflows.interface import get_fundamentals_snapshot, get_simfin_balance_sheet
+from tools import toolkit
+
+META = ["Ticker", "SimFinId", "Currency", "Fiscal Year", "Fiscal Period", "Report Date", "Publish Date", "Restated Date"]
+STATEMENTS = {
+    ("income_statements", "income"): {"Revenue": [119575e6, 90753e6], "Net Income": [33916e6, 23636e6]},
+    ("balance_sheet", "balance"): {"Total Assets": [353514e6, 337411e6], "Treasury Stock": [np.nan, np.nan]},
+    ("cash_flow", "cashflow"): {"Net Cash from Operating Activities": [39895e6, 22690e6], "Dividends Paid": [-3825e6, np.nan]},
+}
+
+
+@pytest.fixture
+def simfin(offline_data):
+    """Two quarterly AAPL statements of each kind, published 2024-02-02 and 2024-05-03."""
+
+    def write(statements=STATEMENTS):
+        for (statement, name), items in statements.items():
+            directory = Path(offline_data.data_dir) / "fundamental_data" / "simfin_data_all" / statement / "companies" / "us"
+            directory.mkdir(parents=True, exist_ok=True)
+            frame = pd.DataFrame(
+                [
+                    ["AAPL", 111052, "USD", 2024, "Q1", "2023-12-31", "2024-02-02", "2024-05-03"],
+                    ["AAPL", 111052, "USD", 2024, "Q2", "2024-03-31", "2024-05-03", "2024-05-03"],
+                ],
+                columns=META,
+            )
+            for item, values in items.items():
+                frame[item] = values
+            frame.to_csv(directory / f"us-{name}-quarterly.csv", sep=";", index=False)
+
+    fundamentals_store._STATEMENT_CACHE.clear()
+    yield write
+    fundamentals_store._STATEMENT_CACHE.clear()
+
+
+def test_snapshot_reports_latest_published_statements(simfin):
+    simfin()
+
+    report = get_fundamentals_snapshot("AAPL", "2024-04-01")
+
+    assert report == (
+        "## quarterly fundamentals snapshot for AAPL as of 2024-04-01 (SimFin):\n\n"
+        "### Income statement for 2024 Q1 (report date 2023-12-31, published 2024-02-02, USD)\n"
+        "Revenue: 119575000000\nNet Income: 33916000000\n\n"
+        "### Balance sheet for 2024 Q1 (report date 2023-12-31, published 2024-02-02, USD)\n"
+        "Total Assets: 353514000000\n\n"
+        "### Cash flow statement for 2024 Q1 (report date 2023-12-31, published 2024-02-02, USD)\n"
+        "Net Cash from Operating Activities: 39895000000\nDividends Paid: -3825000000"
+    )
+    assert "for 2024 Q2" in get_fundamentals_snapshot("AAPL", "2024-05-03")
+
+
+def test_snapshot_reads_the_same_statement_as_the_single_tools(simfin):
+    simfin()
+
+    single = get_simfin_balance_sheet("AAPL", "quarterly", "2024-06-01")
+    snapshot = get_fundamentals_snapshot("AAPL", "2024-06-01")
+
+    assert "released on 2024-05-03" in single
+    assert "### Balance sheet for 2024 Q2 (report date 2024-03-31, published 2024-05-03, USD)\nTotal Assets: 337411000000" in snapshot
+
+
+def test_snapshot_skips_missing_statements(simfin):
+    simfin({key: items for key, items in STATEMENTS.items() if key[0] != "balance_sheet"})
+
+    report = get_fundamentals_snapshot("AAPL", "2024-04-01")
+
+    assert "### Income statement" in report and "### Cash flow statement" in report
+    assert "Balance sheet" not in report
+
+
+@pytest.mark.parametrize("ticker, curr_date", [("AAPL", "2024-01-15"), ("MSFT", "2024-06-01")])
+def test_snapshot_without_statements_is_empty(simfin, ticker, curr_date):
+    simfin()
+
+    assert get_fundamentals_snapshot(ticker, curr_date) == ""
+
+
+class FakeTicker:
+    """Yahoo Finance statements: line items by period end date, newest first."""
+
+    def __init__(self):
+        self.fetched = []
+
+    def __getattr__(self, name):
+        if name not in ("financials", "quarterly_financials", "balance_sheet", "quarterly_balance_sheet", "cashflow", "quarterly_cashflow"):
+            raise AttributeError(name)
+        self.fetched.append(name)
+        periods = ["2024-06-30", "2024-03-31", "2023-12-31"] if name.startswith("quarterly") else ["2023-09-30", "2022-09-30"]
+        return pd.DataFrame(
+            {period: [float(i + 1), np.nan] for i, period in enumerate(periods)},
+            index=[f"{name} total", f"{name} missing"],
+        )
+
+
+@pytest.fixture
+def fake_ticker(monkeypatch):
+    ticker = FakeTicker()
+    monkeypatch.setattr("dataflows.interface.get_ticker", lambda symbol: ticker)
+    return ticker
+
+
+def test_online_snapshot_uses_latest_period_ended_by_curr_date(fake_ticker):
+    report = get_fundamentals_snapshot("AAPL", "2024-05-01", online=True)
+
+    assert sorted(fake_ticker.fetched) == ["quarterly_balance_sheet", "quarterly_cashflow", "quarterly_financials"]
+    assert report.startswith("## quarterly fundamentals snapshot for AAPL as of 2024-05-01 (Yahoo Finance):\n\n")
+    assert "### Income statement for the period ended 2024-03-31\nquarterly_financials total: 2" in report
+    assert "missing" not in report
+
+
+def test_online_snapshot_annual(fake_ticker):
+    report = get_fundamentals_snapshot("AAPL", "2023-01-01", freq="annual", online=True)
+
+    assert sorted(fake_ticker.fetched) == ["balance_sheet", "cashflow", "financials"]
+    assert "### Cash flow statement for the period ended 2022-09-30\ncashflow total: 2" in report
+    assert get_fundamentals_snapshot("AAPL", "2022-01-01", freq="annual", online=True) == ""
+
+
+def test_toolkit_wrappers_choose_the_source(simfin, fake_ticker):
+    simfin()
+
+    assert "(SimFin)" in toolkit.get_fundamentals_snapshot("AAPL", "2024-04-01")
+    assert fake_ticker.fetched == []
+    assert "(Yahoo Finance)" in toolkit.get_fundamentals_snapshot_online("AAPL", "2024-04-01")
@@ -0,0 +1,135 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataflows import fundamentals_store
+from dataflows.fundamentals_store import META_FILE, _store_path, load_statement_file
+
+ROWS = [
+    ("AAPL", "2023-09-30", "2023-11-03", 383),
+    ("MSFT", "2023-06-30", "2023-07-27", 211),
+    ("AAPL", "2023-12-31", "2024-02-02", 119),
+    ("AAPL", "2023-12-31", "2024-02-02", 120),
+    ("MSFT", "2023-09-30", "2023-10-24", 56),
+    ("AAPL", "2024-03-30", "2024-05-03", 90),
+]
+
+
+@pytest.fixture
+def statement_path(tmp_path, configure):
+    configure(data_cache_dir=str(tmp_path / "cache"), simfin_store_dir=str(tmp_path / "cache" / "simfin_store"))
+    directory = tmp_path / "simfin_data_all" / "income_statements" / "companies" / "us"
+    directory.mkdir(parents=True)
+    path = directory / "us-income-quarterly.csv"
+    frame = pd.DataFrame(ROWS, columns=["Ticker", "Report Date", "Publish Date", "Revenue"])
+    frame.to_csv(path, sep=";", index=False)
+    fundamentals_store._STATEMENT_CACHE.clear()
+    yield str(path)
+    fundamentals_store._STATEMENT_CACHE.clear()
+
+
+def _baseline(path, ticker, curr_date):
+    """The latest statement the way interface.py found it before the store: a filtered idxmax."""
+    data = pd.read_csv(path, sep=";")
+    data["Publish Date"] = pd.to_datetime(data["Publish Date"], utc=True).dt.normalize()
+    rows = data[(data["Ticker"] == ticker) & (data["Publish Date"] <= pd.to_datetime(curr_date, utc=True))]
+    if rows.empty:
+        return None
+    return rows.loc[rows["Publish Date"].idxmax()]
+
+
+@pytest.mark.parametrize("ticker", ["AAPL", "MSFT", "NVDA"])
+@pytest.mark.parametrize("curr_date", ["2023-01-01", "2023-10-24", "2024-02-02", "2024-04-01", "2025-01-01"])
+def test_latest_matches_baseline(statement_path, ticker, curr_date):
+    latest = load_statement_file(statement_path).latest(ticker, curr_date)
+    expected = _baseline(statement_path, ticker, curr_date)
+    if expected is None:
+        assert latest is None
+    else:
+        assert latest.name == expected.name
+        assert latest["Revenue"] == expected["Revenue"]
+
+
+def test_stored_frame_matches_parsed_frame(statement_path):
+    frame = pd.read_csv(statement_path, sep=";")
+    frame["Currency"] = ["USD", None, "USD", "USD", "USD", None]
+    frame["Net Income"] = [96.9, np.nan, 33.9, 33.9, 22.0, 23.6]
+    frame.to_csv(statement_path, sep=";", index=False)
+    parsed = load_statement_file(statement_path).frame
+    fundamentals_store._STATEMENT_CACHE.clear()
+
+    stored = load_statement_file(statement_path).frame
+
+    pd.testing.assert_frame_equal(stored, parsed)
+
+
+def _pickled_npy(path):
+    np.save(path, np.array([{"rows": 1}], dtype=object), allow_pickle=True)
+
+
+def _truncated_npy(path):
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 8)
+
+
+def _corrupt_meta(text):
+    def corrupt(store_path):
+        with open(os.path.join(store_path, META_FILE), "w") as f:
+            f.write(text)
+
+    return corrupt
+
+
+def _corrupt_column(damage):
+    def corrupt(store_path):
+        with open(os.path.join(store_path, META_FILE)) as f:
+            column = json.load(f)["columns"][-1]
+        damage(os.path.join(store_path, column["file"]))
+
+    return corrupt
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        _corrupt_meta(""),
+        _corrupt_meta("not json"),
+        _corrupt_meta('["not", "a", "meta"]'),
+        _corrupt_meta('{"version": 2}'),
+        _corrupt_column(os.remove),
+        _corrupt_column(_truncated_npy),
+        _corrupt_column(_pickled_npy),
+    ],
+    ids=["empty-meta", "garbage-meta", "not-a-dict", "incomplete-meta", "missing-column", "truncated-column", "pickled-column"],
+)
+def test_unreadable_store_is_rebuilt(statement_path, corrupt):
+    load_statement_file(statement_path)
+    fundamentals_store._STATEMENT_CACHE.clear()
+    corrupt(_store_path(statement_path))
+
+    latest = load_statement_file(statement_path).latest("AAPL", "2024-04-01")
+
+    assert latest["Revenue"] == 119
+    fundamentals_store._STATEMENT_CACHE.clear()
+    assert fundamentals_store._read_store(
+        _store_path(statement_path), statement_path, fundamentals_store._signature(statement_path)
+    ) is not None
+
+
+def test_store_is_reused_until_source_changes(statement_path, monkeypatch):
+    load_statement_file(statement_path)
+    fundamentals_store._STATEMENT_CACHE.clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("statement file parsed again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(fundamentals_store.pd, "read_csv", fail)
+        assert load_statement_file(statement_path).latest("MSFT", "2024-01-01")["Revenue"] == 56
+
+    with open(statement_path, "a") as f:
+        f.write("MSFT;2023-12-31;2024-01-30;62\n")
+    assert load_statement_file(statement_path).latest("MSFT", "2024-02-01")["Revenue"] == 62
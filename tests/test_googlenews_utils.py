@@ -0,0 +1,165 @@
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from dataflows.googlenews_utils import GoogleNewsClient, TokenBucket
+
+RESULT = (
+    '<div class="SoaBEf"><a href="https://news.example.com/{n}">'
+    '<div class="MBeuO">Title {n}</div><div class="GI74Re">Snippet {n}</div>'
+    '<div class="LfVVr"><span>{n} days ago</span></div>'
+    '<div class="NUnG9d"><span>Source {n}</span></div></a></div>'
+)
+
+
+def _page(first: int, count: int, has_next: bool) -> bytes:
+    results = "".join(RESULT.format(n=n) for n in range(first, first + count))
+    next_link = '<a id="pnnext" href="/search?start=next">Next</a>' if has_next else ""
+    return f"<html><body><div id='rso'>{results}</div>{next_link}</body></html>".encode()
+
+
+class FakeTransport(BaseAdapter):
+    """
+    Answers search requests from ``pages`` (page number -> body) and records the pages requested.
+
+    A page listed in ``rate_limited`` answers 429 that many times before its body.
+    """
+
+    def __init__(self, pages, rate_limited=None, delay=0.0):
+        super().__init__()
+        self.pages = pages
+        self.rate_limited = dict(rate_limited or {})
+        self.delay = delay
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        query = parse_qs(urlsplit(request.url).query)
+        page = int(query["start"][0]) // 10
+        with self._lock:
+            self.requested.append(page)
+            limited = self.rate_limited.get(page, 0) > 0
+            if limited:
+                self.rate_limited[page] -= 1
+        time.sleep(self.delay)
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if limited:
+            response.status_code = 429
+            response._content = b""
+        elif page in self.pages:
+            response.status_code = 200
+            response._content = self.pages[page]
+        else:
+            response.status_code = 404
+            response._content = b"<html></html>"
+        return response
+
+    def close(self):
+        pass
+
+
+def _client(transport, **kwargs):
+    kwargs.setdefault("rate", 1000)
+    kwargs.setdefault("burst", 10)
+    client = GoogleNewsClient("http://news.test/search", **kwargs)
+    client.session.mount("http://", transport)
+    return client
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    """The retry backoff waits of GoogleNewsClient.request, recorded instead of slept."""
+    recorded = []
+    monkeypatch.setattr(GoogleNewsClient.request.retry, "sleep", recorded.append)
+    return recorded
+
+
+def test_token_bucket_allows_burst_then_rate():
+    bucket = TokenBucket(rate=20, capacity=3)
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.04
+
+    for _ in range(4):
+        bucket.acquire()
+    # four more tokens at 20 per second
+    assert time.monotonic() - started >= 0.19
+
+
+def test_token_bucket_is_shared_across_threads():
+    bucket = TokenBucket(rate=50, capacity=1)
+    started = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_search_returns_pages_in_order_until_last_page():
+    transport = FakeTransport(
+        {0: _page(0, 2, True), 1: _page(2, 2, True), 2: _page(4, 2, True), 3: _page(6, 2, False)},
+        delay=0.01,
+    )
+    results = _client(transport, max_workers=3).search("AAPL", "01/01/2024", "01/31/2024", limit=100)
+
+    assert [r["link"] for r in results] == [f"https://news.example.com/{n}" for n in range(8)]
+    assert results[0] == {
+        "link": "https://news.example.com/0",
+        "title": "Title 0",
+        "snippet": "Snippet 0",
+        "date": "0 days ago",
+        "source": "Source 0",
+    }
+    # the first page is fetched alone, later pages up to max_workers at a time
+    assert transport.requested[0] == 0
+    assert sorted(transport.requested) == [0, 1, 2, 3]
+
+
+def test_search_stops_at_limit():
+    transport = FakeTransport({p: _page(10 * p, 10, True) for p in range(10)})
+    results = _client(transport, max_workers=1).search("AAPL", "01/01/2024", "01/31/2024", limit=15)
+
+    assert len(results) == 20
+    assert transport.requested == [0, 1]
+
+
+def test_search_stops_at_max_pages():
+    transport = FakeTransport({p: _page(p, 1, True) for p in range(10)})
+    results = _client(transport, max_workers=2, max_pages=3).search("AAPL", "01/01/2024", "01/31/2024", limit=100)
+
+    assert len(results) == 3
+    assert sorted(transport.requested) == [0, 1, 2]
+
+
+def test_search_without_results_stops():
+    transport = FakeTransport({0: _page(0, 0, True)})
+    assert _client(transport).search("AAPL", "01/01/2024", "01/31/2024") == []
+    assert transport.requested == [0]
+
+
+def test_rate_limited_requests_are_retried(waits):
+    transport = FakeTransport({0: _page(0, 3, False)}, rate_limited={0: 2})
+    results = _client(transport).search("AAPL", "01/01/2024", "01/31/2024")
+
+    assert len(results) == 3
+    assert transport.requested == [0, 0, 0]
+    assert waits == [4, 4]
+
+
+def test_search_keeps_results_when_retries_run_out(waits, capsys):
+    transport = FakeTransport({0: _page(0, 2, True), 1: _page(2, 2, False)}, rate_limited={1: 5})
+    results = _client(transport, max_workers=1).search("AAPL", "01/01/2024", "01/31/2024", limit=100)
+
+    assert len(results) == 2
+    assert transport.requested == [0, 1, 1, 1, 1, 1]
+    assert "Failed after multiple retries" in capsys.readouterr().out
@@ -0,0 +1,69 @@
+import json
+import os
+
+import pytest
+
+from dataflows import html_parsing
+from dataflows.googlenews_utils import parse_results_page
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "google_news")
+
+with open(os.path.join(FIXTURES, "expected.json"), encoding="utf-8") as f:
+    EXPECTED = json.load(f)
+
+INSTALLED = [
+    backend
+    for backend, available in (
+        ("selectolax", html_parsing.SelectolaxParser is not None),
+        ("lxml", html_parsing.etree is not None),
+        ("bs4", True),
+    )
+    if available
+]
+
+
+def _page(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+@pytest.mark.parametrize("backend", INSTALLED)
+def test_backend_matches_saved_results(backend, name):
+    results, has_next = html_parsing.get_page_parser(backend)(_page(name))
+    assert results == EXPECTED[name]["results"]
+    assert has_next == EXPECTED[name]["has_next"]
+
+
+def test_fixtures_cover_skipped_results_and_pagination():
+    assert len(EXPECTED["results_next.html"]["results"]) == 8
+    assert EXPECTED["results_next.html"]["has_next"]
+    assert not EXPECTED["last_page.html"]["has_next"]
+    assert EXPECTED["no_results.html"] == {"results": [], "has_next": False}
+    assert EXPECTED["latin1.html"]["results"][0]["title"] == "Café crème sales"
+
+
+def test_auto_picks_the_fastest_installed(configure, monkeypatch):
+    configure(html_parser="auto")
+    # fastest first, as benchmarks/bench_html_parsing.py measures them
+    assert html_parsing.get_backend() == INSTALLED[0]
+
+    monkeypatch.setattr(html_parsing, "SelectolaxParser", None)
+    assert html_parsing.get_backend() == ("lxml" if html_parsing.etree is not None else "bs4")
+    monkeypatch.setattr(html_parsing, "etree", None)
+    assert html_parsing.get_backend() == "bs4"
+
+
+def test_pinned_backend(configure):
+    configure(html_parser="bs4")
+    assert html_parsing.get_backend() == "bs4"
+    assert parse_results_page(_page("last_page.html")) == (
+        EXPECTED["last_page.html"]["results"],
+        EXPECTED["last_page.html"]["has_next"],
+    )
+
+
+def test_unknown_backend(configure):
+    configure(html_parser="html5lib")
+    with pytest.raises(ValueError):
+        html_parsing.get_backend()
@@ -0,0 +1,92 @@
+import json
+
+import numpy as np
+import pytest
+
+from dataflows import indicators
+from dataflows.incremental_indicators import IndicatorStateStore, IncrementalIndicator, create_incremental_indicator
+
+INDICATORS = [
+    "close_50_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+]
+
+
+def _stream(indicator, frame):
+    """Feed the frame bar by bar; return the value after each bar."""
+    state = create_incremental_indicator(indicator)
+    return np.array([state.update(bar) for bar in frame.to_dict("records")])
+
+
+def _assert_close(expected, actual):
+    assert np.array_equal(np.isnan(expected), np.isnan(actual))
+    valid = ~np.isnan(expected)
+    np.testing.assert_allclose(actual[valid], expected[valid], rtol=1e-8, atol=1e-8)
+
+
+@pytest.mark.parametrize("indicator", INDICATORS)
+def test_matches_vectorized_indicators(price_frame, indicator):
+    frame = price_frame(1500, seed=4)
+
+    _assert_close(indicators.compute_indicator(indicator, frame), _stream(indicator, frame))
+
+
+@pytest.mark.parametrize("indicator", INDICATORS)
+def test_nan_bars_are_skipped(price_frame, indicator):
+    frame = price_frame(400, seed=5)
+    # a leading gap, a one-day gap and a week-long gap
+    for rows in ([0, 1], [120], slice(250, 255)):
+        frame.loc[frame.index[rows], ["Close", "High", "Low", "Volume"]] = np.nan
+
+    streamed = _stream(indicator, frame)
+
+    _assert_close(indicators.compute_indicator(indicator, frame), streamed)
+    assert np.isfinite(streamed[-100:]).all()
+
+
+@pytest.mark.parametrize("indicator", INDICATORS)
+def test_restored_state_continues_the_series(price_frame, indicator):
+    frame = price_frame(300, seed=6)
+    frame.loc[frame.index[140], "Close"] = np.nan
+    bars = frame.to_dict("records")
+    state = create_incremental_indicator(indicator)
+    for bar in bars[:150]:
+        state.update(bar)
+
+    restored = IncrementalIndicator.from_dict(json.loads(json.dumps(state.to_dict(), allow_nan=False)))
+    values = [restored.update(bar) for bar in bars[150:]]
+
+    _assert_close(indicators.compute_indicator(indicator, frame)[150:], np.array(values))
+
+
+def test_state_store_round_trip(tmp_path, price_frame):
+    frame = price_frame(60, seed=7)
+    store = IndicatorStateStore(str(tmp_path))
+    rsi = store.get("AAPL", "rsi")
+    rsi.update_from_series(frame.iloc[:40])
+    store.save("AAPL", rsi)
+
+    reloaded = IndicatorStateStore(str(tmp_path)).get("AAPL", "rsi")
+
+    assert reloaded.last_date == frame["Date"].iloc[39]
+    # the overlapping bars are skipped, only the last 20 are new
+    assert reloaded.update_from_series(frame) == pytest.approx(indicators.compute_indicator("rsi", frame)[-1])
+
+
+def test_indicators_must_implement_the_state_methods():
+    class Partial(IncrementalIndicator):
+        def _consume(self, bar):
+            return 0.0
+
+    with pytest.raises(TypeError):
+        Partial("partial")
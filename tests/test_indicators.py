@@ -0,0 +1,72 @@
+import warnings
+
+import numpy as np
+import pytest
+from stockstats import wrap
+
+from dataflows import indicators
+
+INDICATORS = [
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+]
+
+
+def _stockstats(frame, indicator):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return wrap(frame.copy())[indicator].to_numpy(dtype=np.float64)
+
+
+def _assert_close(expected, actual):
+    assert np.array_equal(np.isnan(expected), np.isnan(actual))
+    valid = ~np.isnan(expected)
+    np.testing.assert_allclose(actual[valid], expected[valid], rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("periods", [1, 2, 15, 250, 3000])
+@pytest.mark.parametrize("indicator", INDICATORS)
+def test_matches_stockstats(price_frame, indicator, periods):
+    frame = price_frame(periods, seed=periods)
+    _assert_close(_stockstats(frame, indicator), indicators.compute_indicator(indicator, frame))
+
+
+@pytest.mark.parametrize("indicator", INDICATORS)
+def test_panel_column_matches_single_series(price_frame, indicator):
+    frames = [price_frame(600, seed=1), price_frame(400, seed=2)]
+    # the second symbol starts trading 200 rows into the panel
+    panel = {}
+    for column in ("Close", "High", "Low", "Volume"):
+        values = np.full((600, 2), np.nan)
+        values[:, 0] = frames[0][column]
+        values[200:, 1] = frames[1][column]
+        panel[column] = values
+
+    result = indicators.compute_indicator(indicator, panel)
+
+    assert np.isnan(result[:200, 1]).all()
+    _assert_close(_stockstats(frames[0], indicator), result[:, 0])
+    _assert_close(_stockstats(frames[1], indicator), result[200:, 1])
+
+
+def test_long_ema_stays_finite():
+    close = np.full(20000, 100.0)
+    np.testing.assert_allclose(indicators.ema(close, 200), 100.0)
+
+
+def test_unsupported_indicator():
+    assert indicators.is_supported("close_30_ema")
+    assert not indicators.is_supported("kdjk")
+    with pytest.raises(ValueError):
+        indicators.compute_indicator("kdjk", {"close": [1.0, 2.0]})
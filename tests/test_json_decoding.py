@@ -0,0 +1,63 @@
+import json
+import math
+
+import pytest
+
+from dataflows import json_decoding
+from dataflows.finnhub_store import query_finnhub
+
+INSTALLED = [
+    backend
+    for backend, module in (
+        ("msgspec", json_decoding.msgspec),
+        ("orjson", json_decoding.orjson),
+        ("json", json),
+    )
+    if module is not None
+]
+
+NAN_POST = b'{"created_utc": 1704200000, "title": "t", "selftext": "s", "url": "u", "ups": NaN}'
+NAN_RECORD = {
+    "2024-01-02": [{"symbol": "AAPL", "change": -100, "mspr": float("nan")}],
+    "2024-01-03": [{"symbol": "AAPL", "change": 50, "mspr": float("inf")}],
+    "2024-01-04": [],
+}
+
+
+@pytest.mark.parametrize("backend", INSTALLED)
+def test_loads_accepts_non_finite_literals(backend):
+    data = json_decoding.get_loads(backend)(b'{"a": NaN, "b": Infinity, "c": -Infinity, "d": 1}')
+    assert math.isnan(data["a"])
+    assert data["b"] == float("inf") and data["c"] == float("-inf") and data["d"] == 1
+
+
+@pytest.mark.parametrize("backend", INSTALLED)
+def test_loads_still_rejects_invalid_json(backend):
+    with pytest.raises(ValueError):
+        json_decoding.get_loads(backend)(b'{"a": ')
+
+
+@pytest.mark.parametrize("backend", INSTALLED)
+def test_reddit_decoders_accept_non_finite_literals(backend):
+    post = json_decoding.get_post_decoder(backend)(NAN_POST)
+    assert (post.created_utc, post.title, post.url) == (1704200000, "t", "u")
+    assert math.isnan(post.ups)
+    assert json_decoding.get_timestamp_decoder(backend)(NAN_POST) == 1704200000
+
+
+@pytest.mark.parametrize("finnhub_backend", ["memory", "sqlite"])
+@pytest.mark.parametrize("backend", INSTALLED)
+def test_finnhub_query_with_nan_record(tmp_path, configure, backend, finnhub_backend):
+    configure(
+        json_decoder=backend,
+        finnhub_backend=finnhub_backend,
+        finnhub_db_path=str(tmp_path / "finnhub.sqlite"),
+    )
+    path = tmp_path / "AAPL_data_formatted.json"
+    path.write_text(json.dumps(NAN_RECORD))
+
+    result = query_finnhub(str(path), "AAPL", "insider_senti", "2024-01-01", "2024-01-31")
+
+    assert list(result) == ["2024-01-02", "2024-01-03"]
+    assert math.isnan(result["2024-01-02"][0]["mspr"])
+    assert result["2024-01-03"][0]["mspr"] == float("inf")
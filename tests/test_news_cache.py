@@ -0,0 +1,75 @@
+import sqlite3
+from datetime import datetime
+
+from dataflows import news_cache
+from dataflows.interface import get_google_news
+from dataflows.news_cache import NewsCache, prewarm
+
+RESULTS = [{"link": "https://example.com/a", "title": "A", "snippet": "", "date": "1 day ago", "source": "X"}]
+
+
+def _set_fetched_at(cache, when):
+    conn = sqlite3.connect(cache.db_path)
+    with conn:
+        conn.execute("UPDATE news SET fetched_at = ?", (when.timestamp(),))
+    conn.close()
+
+
+def test_window_scraped_after_it_ended_never_expires(tmp_path):
+    cache = NewsCache(str(tmp_path / "news.sqlite"), recent_ttl=60)
+    cache.put("AAPL", "2024-01-03", "2024-01-10", RESULTS)
+    _set_fetched_at(cache, datetime(2024, 1, 11, 12))
+
+    assert cache.get("AAPL", "01/03/2024", "01/10/2024") == RESULTS
+
+
+def test_window_scraped_while_open_expires_after_it_ends(tmp_path):
+    cache = NewsCache(str(tmp_path / "news.sqlite"), recent_ttl=60)
+    cache.put("AAPL", "2024-01-03", "2024-01-10", RESULTS)
+    _set_fetched_at(cache, datetime(2024, 1, 10, 12))
+
+    assert cache.get("AAPL", "2024-01-03", "2024-01-10") is None
+
+
+def test_fetch_scrapes_on_miss_and_skips_empty_results(tmp_path):
+    cache = NewsCache(str(tmp_path / "news.sqlite"))
+    calls = []
+
+    def scrape(query, start_date, end_date):
+        calls.append(query)
+        return RESULTS if query == "AAPL" else []
+
+    assert cache.fetch("AAPL", "2024-01-03", "2024-01-10", scrape) == RESULTS
+    assert cache.fetch("AAPL", "2024-01-03", "2024-01-10", scrape) == RESULTS
+    assert cache.fetch("ZZZZ", "2024-01-03", "2024-01-10", scrape) == []
+    assert cache.fetch("ZZZZ", "2024-01-03", "2024-01-10", scrape) == []
+    assert calls == ["AAPL", "ZZZZ", "ZZZZ"]
+
+
+def test_stats_are_shared_through_the_database(tmp_path):
+    path = str(tmp_path / "news.sqlite")
+    cache = NewsCache(path)
+    cache.fetch("AAPL", "2024-01-03", "2024-01-10", lambda *args: RESULTS)
+    cache.fetch("AAPL", "2024-01-03", "2024-01-10", lambda *args: RESULTS)
+
+    # a new instance stands for a fresh process, e.g. `prewarm_news stats`
+    assert NewsCache(path).stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_prewarmed_searches_are_hits_for_get_google_news(tmp_path, configure, monkeypatch):
+    configure(google_news_cache_path=str(tmp_path / "news.sqlite"), google_news_cache=True)
+    scraped = []
+
+    def scrape(query, start_date, end_date):
+        scraped.append(query)
+        return RESULTS
+
+    monkeypatch.setattr(news_cache, "getNewsData", scrape)
+    prewarm(["AAPL"], "2024-01-10", "2024-01-10", look_back_days=7, query_templates=["{ticker}", "{ticker} stock"])
+    assert scraped == ["AAPL", "AAPL+stock"]
+
+    report = get_google_news("AAPL stock", "2024-01-10", 7)
+
+    assert report.startswith("## AAPL+stock Google News, from 2024-01-03 to 2024-01-10:")
+    assert scraped == ["AAPL", "AAPL+stock"]
+    assert news_cache.get_news_cache().stats() == {"hits": 1, "misses": 2, "entries": 2}
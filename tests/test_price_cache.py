@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from dataflows import price_cache
+from dataflows.price_cache import _atomic_write, _cache_paths, _is_revised, get_online_price_history
+
+
+class FakeDownloads:
+    """Stands in for ``price_cache._download``, serving [start, end) of ``bars`` and recording each call."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, symbol, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        if self.fail:
+            # yf.download reports failures by returning an empty frame
+            return pd.DataFrame()
+        dates = self.bars["Date"]
+        return self.bars[(dates >= start_date) & (dates < end_date)].reset_index(drop=True)
+
+
+@pytest.fixture
+def downloads(monkeypatch, price_frame):
+    yesterday = pd.Timestamp.today().normalize() - pd.offsets.BDay(1)
+    bars = price_frame(400, start=yesterday - pd.offsets.BDay(399))
+    bars["Date"] = pd.to_datetime(bars["Date"])
+    fake = FakeDownloads(bars)
+    monkeypatch.setattr(price_cache, "_download", fake)
+    return fake
+
+
+def _age_cache(cache_dir, days=1):
+    """Pretend the cache was last refreshed some days ago."""
+    _, meta_path = _cache_paths(cache_dir, "AAPL")
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    meta["refreshed_on"] = (pd.Timestamp.today().normalize() - pd.Timedelta(days=days)).strftime("%Y-%m-%d")
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def test_same_day_calls_are_served_from_cache(tmp_path, downloads):
+    first = get_online_price_history("AAPL", str(tmp_path))
+    second = get_online_price_history("AAPL", str(tmp_path))
+
+    assert len(downloads.calls) == 1
+    pd.testing.assert_frame_equal(first, second, check_dtype=False)
+    assert len(first) == 400
+
+
+def test_stale_cache_fetches_only_the_tail(tmp_path, downloads):
+    get_online_price_history("AAPL", str(tmp_path))
+    _age_cache(str(tmp_path))
+
+    data = get_online_price_history("AAPL", str(tmp_path))
+
+    tail_start = pd.Timestamp(downloads.calls[-1][0])
+    assert tail_start == downloads.bars["Date"].iloc[-1] - pd.Timedelta(days=price_cache.OVERLAP_DAYS)
+    assert len(data) == 400
+
+
+def test_failed_tail_download_serves_the_cache(tmp_path, downloads):
+    expected = get_online_price_history("AAPL", str(tmp_path))
+    _age_cache(str(tmp_path))
+    downloads.fail = True
+
+    data = get_online_price_history("AAPL", str(tmp_path))
+
+    pd.testing.assert_frame_equal(data, expected, check_dtype=False)
+    # the cache is not marked refreshed, so the next call tries again
+    downloads.fail = False
+    get_online_price_history("AAPL", str(tmp_path))
+    assert len(downloads.calls) == 3
+
+
+def test_revised_history_is_downloaded_again(tmp_path, downloads):
+    get_online_price_history("AAPL", str(tmp_path))
+    _age_cache(str(tmp_path))
+    # a dividend rewrites the adjusted closes
+    downloads.bars["Close"] *= 0.99
+
+    data = get_online_price_history("AAPL", str(tmp_path))
+
+    assert len(downloads.calls) == 3
+    assert data["Close"].to_numpy() == pytest.approx(downloads.bars["Close"].to_numpy())
+
+
+def test_is_revised_ignores_empty_download(price_frame):
+    cached = price_frame(10)
+    cached["Date"] = pd.to_datetime(cached["Date"])
+
+    assert not _is_revised(cached, pd.DataFrame())
+    assert not _is_revised(cached, cached.copy())
+    revised = cached.copy()
+    revised["Close"] += 1
+    assert _is_revised(cached, revised)
+
+
+def test_atomic_write_from_threads(tmp_path):
+    path = str(tmp_path / "AAPL-YFin-data.json")
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def write(n):
+        def dump(tmp_path):
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                barrier.wait()
+                json.dump({"writer": n, "padding": "x" * 100_000}, f)
+
+        try:
+            _atomic_write(path, dump)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["writer"] in range(8)
+    assert os.listdir(tmp_path) == ["AAPL-YFin-data.json"]
+
+
+def test_legacy_files_are_removed_on_write_only(tmp_path, downloads, monkeypatch):
+    legacy = tmp_path / "AAPL-YFin-data-2010-01-04-2025-01-03.csv"
+    other = tmp_path / "MSFT-YFin-data-2010-01-04-2025-01-03.csv"
+    legacy.write_text("Date,Close\n")
+    other.write_text("Date,Close\n")
+
+    get_online_price_history("AAPL", str(tmp_path))
+
+    assert not legacy.exists()
+    assert other.exists()
+
+    def listdir(path):
+        raise AssertionError("cache directory scanned on a cache hit")
+
+    monkeypatch.setattr(price_cache.os, "listdir", listdir)
+    get_online_price_history("AAPL", str(tmp_path))
+    assert len(downloads.calls) == 1
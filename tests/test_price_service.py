@@ -0,0 +1,153 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from dataflows.price_service import HISTORY_COLUMNS, PriceService, StubBackend
+
+
+@pytest.fixture
+def stub(offline_data, price_frame):
+    offline_data("AAPL", price_frame(60, seed=1))
+    offline_data("MSFT", price_frame(60, seed=2))
+    return StubBackend(offline_data.data_dir)
+
+
+def _concurrently(calls):
+    """Run the (function, args) calls on their own threads, released together; return their results in order."""
+    barrier = threading.Barrier(len(calls))
+
+    def run(call):
+        function, args = call
+        barrier.wait()
+        return function(*args)
+
+    with ThreadPoolExecutor(len(calls)) as executor:
+        return list(executor.map(run, calls))
+
+
+def test_history_slices_end_exclusive(stub):
+    bars = PriceService(stub, window=0).history("AAPL", "2010-08-24", "2010-08-27")
+
+    assert list(bars.index.strftime("%Y-%m-%d")) == ["2010-08-24", "2010-08-25", "2010-08-26"]
+    assert list(bars.columns) == [c for c in HISTORY_COLUMNS if c in bars.columns]
+    assert bars.index.name == "Date"
+
+
+def test_concurrent_requests_share_one_download(stub):
+    service = PriceService(stub, window=0.2)
+    requests = [
+        ("AAPL", "2010-08-23", "2010-09-01"),
+        ("MSFT", "2010-09-01", "2010-09-15"),
+        ("AAPL", "2010-09-10", "2010-09-20"),
+    ]
+
+    results = _concurrently([(service.history, request) for request in requests])
+
+    assert stub.calls == [(["AAPL", "MSFT"], "2010-08-23", "2010-09-20")]
+    for (symbol, start, end), bars in zip(requests, results):
+        expected = PriceService(StubBackend(stub.data_dir), window=0).history(symbol, start, end)
+        pd.testing.assert_frame_equal(bars, expected)
+
+
+def test_identical_requests_are_downloaded_once(stub):
+    service = PriceService(stub, window=0.2)
+
+    results = _concurrently([(service.history, ("AAPL", "2010-08-23", "2010-09-01"))] * 8)
+
+    assert len(stub.calls) == 1
+    for bars in results[1:]:
+        pd.testing.assert_frame_equal(bars, results[0])
+    # every caller gets its own copy
+    results[0].loc[:, "Close"] = 0.0
+    assert (results[1]["Close"] != 0.0).all()
+
+
+def test_covered_ranges_are_served_from_the_cache(stub):
+    service = PriceService(stub, window=0)
+    service.history("AAPL", "2010-08-23", "2010-10-01")
+    service.history("AAPL", "2010-09-01", "2010-09-10")
+
+    assert len(stub.calls) == 1
+
+    service.history("AAPL", "2010-09-01", "2010-10-15")
+    assert len(stub.calls) == 2
+
+
+def test_unknown_symbol_returns_empty_frame(stub):
+    bars = PriceService(stub, window=0).history("ZZZZ", "2010-08-23", "2010-09-01")
+
+    assert bars.empty
+    assert stub.calls == [(["ZZZZ"], "2010-08-23", "2010-09-01")]
+
+
+def test_backend_errors_reach_every_waiting_caller():
+    class FailingBackend:
+        def __init__(self):
+            self.calls = 0
+
+        def download(self, symbols, start_date, end_date):
+            self.calls += 1
+            raise ConnectionError("rate limited")
+
+    backend = FailingBackend()
+    service = PriceService(backend, window=0.2)
+
+    def history(symbol):
+        try:
+            service.history(symbol, "2024-01-02", "2024-02-01")
+        except ConnectionError as e:
+            return str(e)
+
+    assert _concurrently([(history, ("AAPL",)), (history, ("MSFT",))]) == ["rate limited"] * 2
+    assert backend.calls == 1
+
+    # failures are not cached
+    history("AAPL")
+    assert backend.calls == 2
+
+
+def test_ranges_reaching_today_expire(stub, price_frame):
+    class TodayBackend:
+        def __init__(self):
+            self.calls = 0
+
+        def download(self, symbols, start_date, end_date):
+            self.calls += 1
+            frame = price_frame(5, start=date.today() - timedelta(days=7)).set_index("Date")
+            frame.index = pd.DatetimeIndex(frame.index)
+            return {symbol: frame for symbol in symbols}
+
+    start = (date.today() - timedelta(days=10)).isoformat()
+    end = (date.today() + timedelta(days=1)).isoformat()
+
+    backend = TodayBackend()
+    service = PriceService(backend, window=0, live_ttl=60)
+    service.history("AAPL", start, end)
+    service.history("AAPL", start, end)
+    assert backend.calls == 1
+
+    backend = TodayBackend()
+    service = PriceService(backend, window=0, live_ttl=0)
+    service.history("AAPL", start, end)
+    service.history("AAPL", start, end)
+    assert backend.calls == 2
+
+
+def test_cache_failures_do_not_strand_waiters(stub, monkeypatch):
+    service = PriceService(stub, window=0.2)
+
+    def put(*args):
+        raise MemoryError("no room for bars")
+
+    monkeypatch.setattr(service.cache, "put", put)
+
+    results = _concurrently([(service.history, ("AAPL", "2010-08-23", "2010-09-01"))] * 4)
+
+    assert all(len(bars) == 7 for bars in results)
+    assert service._inflight == {}
+    # nothing was cached, so a later request downloads again instead of joining a dead future
+    assert len(service.history("AAPL", "2010-08-23", "2010-09-01")) == 7
+    assert len(stub.calls) == 2
@@ -0,0 +1,80 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataflows import price_store
+from dataflows.interface import get_YFin_data, get_YFin_data_window
+from dataflows.price_store import META_FILE, load_price_series
+
+
+@pytest.fixture
+def aapl(offline_data, price_frame):
+    frame = price_frame(300, seed=3, start="2024-01-02")
+    # yfinance dumps carry the exchange's UTC offset, which changes with daylight saving
+    offsets = np.where(pd.to_datetime(frame["Date"]).dt.month.between(4, 10), "-04:00", "-05:00")
+    frame["Date"] = frame["Date"] + " 00:00:00" + offsets
+    path = offline_data("AAPL", frame)
+    price_store._SERIES_CACHE.clear()
+    yield path
+    price_store._SERIES_CACHE.clear()
+
+
+def _baseline(path, start_date, end_date):
+    """Filter the CSV frame on the date part of its Date strings, as get_YFin_data did before the store."""
+    data = pd.read_csv(path)
+    day = data["Date"].str[:10]
+    return data[(day >= start_date) & (day <= end_date)].reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "start_date, end_date",
+    [("2024-01-01", "2024-12-31"), ("2024-03-05", "2024-03-15"), ("2024-06-01", "2024-06-02"), ("2025-01-01", "2025-06-30")],
+)
+def test_get_YFin_data_matches_csv_filter(aapl, start_date, end_date):
+    # get_YFin_data refuses end dates past the file's last day
+    end_date = min(end_date, pd.read_csv(aapl)["Date"].iloc[-1][:10])
+    expected = _baseline(aapl, start_date, end_date)
+
+    data = get_YFin_data("AAPL", start_date, end_date)
+
+    # an empty filter of the CSV frame keeps pandas' inferred string dtype for Date
+    pd.testing.assert_frame_equal(data, expected, check_dtype=not expected.empty)
+    assert data.empty or data["Date"].iloc[0].endswith(("-04:00", "-05:00"))
+
+
+def test_get_YFin_data_window_shows_source_dates(aapl):
+    report = get_YFin_data_window("AAPL", "2024-07-10", 7)
+
+    assert "2024-07-03 00:00:00-04:00" in report
+    assert "2024-07-10 00:00:00-04:00" in report
+    assert "2024-07-02 00:00:00-04:00" not in report
+
+
+def test_iso_dates(aapl):
+    series = load_price_series("AAPL", aapl).slice("2024-01-02", "2024-01-04")
+
+    assert list(series.to_frame(iso_dates=True)["Date"]) == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert list(series.to_frame()["Date"]) == [
+        "2024-01-02 00:00:00-05:00",
+        "2024-01-03 00:00:00-05:00",
+        "2024-01-04 00:00:00-05:00",
+    ]
+
+
+def test_stores_of_an_older_version_are_converted_again(aapl):
+    series = load_price_series("AAPL", aapl)
+    store_path = os.path.join(price_store.get_store_dir(), "AAPL", os.path.splitext(os.path.basename(aapl))[0])
+    os.remove(os.path.join(store_path, price_store.DATE_LABEL_FILE))
+    with open(os.path.join(store_path, META_FILE), encoding="utf-8") as f:
+        meta = json.load(f)
+    meta["version"] = 1
+    with open(os.path.join(store_path, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    price_store._SERIES_CACHE.clear()
+
+    reloaded = load_price_series("AAPL", aapl)
+
+    np.testing.assert_array_equal(reloaded.date_labels, series.date_labels)
@@ -0,0 +1,119 @@
+import json
+import os
+import random
+import re
+from datetime import datetime, timezone
+
+import pytest
+
+from dataflows.reddit_utils import (
+    fetch_top_from_category,
+    fetch_top_from_category_range,
+    ticker_to_company,
+)
+
+DAYS = [f"2024-03-{day:02d}" for day in range(1, 21)]
+TITLES = [
+    "Apple unveils new chips",
+    "Is META or Facebook still a buy?",
+    "Snap Inc. earnings",
+    "SnapXInc dips",  # "Snap Inc." is matched as a regex
+    "Microsoft and Nvidia partner",
+    "Markets rally",
+    "aapl calls printing",
+]
+
+
+def _baseline_fetch_top(category, date, max_limit, query, data_path):
+    # The per-day full-file scan the range query replaces
+    files = os.listdir(os.path.join(data_path, category))
+    limit_per_subreddit = max_limit // len(files)
+    all_content = []
+    for data_file in files:
+        if not data_file.endswith(".jsonl"):
+            continue
+        posts = []
+        with open(os.path.join(data_path, category, data_file), "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                parsed = json.loads(line)
+                posted = datetime.fromtimestamp(parsed["created_utc"], timezone.utc).strftime("%Y-%m-%d")
+                if posted != date:
+                    continue
+                if "company" in category and query:
+                    terms = ticker_to_company[query].split(" OR ") + [query]
+                    if not any(
+                        re.search(term, parsed["title"], re.IGNORECASE)
+                        or re.search(term, parsed["selftext"], re.IGNORECASE)
+                        for term in terms
+                    ):
+                        continue
+                posts.append(
+                    {
+                        "title": parsed["title"],
+                        "content": parsed["selftext"],
+                        "url": parsed["url"],
+                        "upvotes": parsed["ups"],
+                        "posted_date": posted,
+                    }
+                )
+        posts.sort(key=lambda post: post["upvotes"], reverse=True)
+        all_content.extend(posts[:limit_per_subreddit])
+    return all_content
+
+
+@pytest.fixture
+def reddit_dir(tmp_path, configure):
+    configure(reddit_index_dir=str(tmp_path / "index"))
+    rng = random.Random(11)
+    for category, subreddits in (("company_news", 3), ("global_news", 2)):
+        os.makedirs(tmp_path / category)
+        for i in range(subreddits):
+            lines = []
+            for n in range(400):
+                day = rng.choice(DAYS)
+                created = datetime.fromisoformat(day).replace(tzinfo=timezone.utc).timestamp()
+                post = {
+                    "created_utc": int(created) + rng.randrange(86400),
+                    "title": f"{rng.choice(TITLES)} #{n}",
+                    "selftext": rng.choice(["", "Tesla deliveries", "visa fees", "nothing here"]),
+                    "url": f"https://reddit.com/r/sub{i}/{n}",
+                    "ups": rng.randrange(30),  # plenty of ties
+                    "extra": {"ignored": True},
+                }
+                lines.append(json.dumps(post))
+                if rng.random() < 0.02:
+                    lines.append("")
+            (tmp_path / category / f"sub{i}.jsonl").write_text("\n".join(lines) + "\n")
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "category, query, max_limit",
+    [
+        ("global_news", None, 10),
+        ("global_news", None, 1000),
+        ("company_news", "AAPL", 9),
+        ("company_news", "META", 30),
+        ("company_news", "SNAP", 12),
+        ("company_news", "TSLA", 6),
+    ],
+)
+def test_range_matches_per_day_scan(reddit_dir, category, query, max_limit):
+    result = fetch_top_from_category_range(
+        category, "2024-03-03", "2024-03-17", max_limit, query, data_path=reddit_dir
+    )
+
+    for day in DAYS:
+        expected = _baseline_fetch_top(category, day, max_limit, query, reddit_dir)
+        if "2024-03-03" <= day <= "2024-03-17" and expected:
+            assert result[day] == expected
+        else:
+            assert day not in result
+        assert fetch_top_from_category(category, day, max_limit, query, data_path=reddit_dir) == expected
+
+
+def test_limit_below_number_of_files(reddit_dir):
+    with pytest.raises(ValueError):
+        fetch_top_from_category_range("company_news", "2024-03-01", "2024-03-02", 2, data_path=reddit_dir)
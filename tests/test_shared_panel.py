@@ -0,0 +1,107 @@
+import gc
+import multiprocessing
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from dataflows.price_panel import load_price_panel
+from dataflows.shared_panel import (
+    attach_price_panel,
+    get_worker_panel,
+    init_panel_worker,
+    publish_price_panel,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _worker_close_sum(_):
+    panel = get_worker_panel()
+    return float(np.nansum(panel["Close"])), panel["Close"].flags.writeable
+
+
+@pytest.fixture
+def panel(offline_data, price_frame):
+    offline_data("AAPL", price_frame(300, seed=1, start="2023-01-02"))
+    offline_data("MSFT", price_frame(200, seed=2, start="2023-05-01"))
+    return load_price_panel(["AAPL", "MSFT"])
+
+
+def test_attached_panel_is_a_read_only_view(panel):
+    with publish_price_panel(panel) as shared:
+        attached = attach_price_panel(shared.manifest)
+
+        assert attached.symbols == panel.symbols
+        np.testing.assert_array_equal(attached.dates, panel.dates)
+        np.testing.assert_array_equal(attached.present, panel.present)
+        np.testing.assert_array_equal(attached.offsets, panel.offsets)
+        for field in panel.field_names:
+            np.testing.assert_array_equal(attached[field], panel[field])
+            assert not attached[field].flags.writeable
+        np.testing.assert_array_equal(
+            attached.compute_indicator("close_10_ema"), panel.compute_indicator("close_10_ema")
+        )
+        assert attached.buffer_owner is not None
+
+
+def test_slice_of_attached_panel_outlives_the_panel(panel):
+    with publish_price_panel(panel) as shared:
+        attached = attach_price_panel(shared.manifest)
+        owner = attached.buffer_owner
+        window = attached.slice("2023-06-01", "2023-06-30")
+        del attached
+        gc.collect()
+
+        assert window.buffer_owner is owner
+        np.testing.assert_array_equal(window["Close"], panel.slice("2023-06-01", "2023-06-30")["Close"])
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_pool_workers_attach_and_leave_the_block_to_the_owner(panel, start_method):
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method} is not available")
+    expected = float(np.nansum(panel["Close"]))
+
+    with publish_price_panel(panel) as shared:
+        with ProcessPoolExecutor(
+            2,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=init_panel_worker,
+            initargs=(shared.manifest,),
+        ) as pool:
+            results = list(pool.map(_worker_close_sum, range(4)))
+
+        assert results == [(pytest.approx(expected), False)] * 4
+        # the workers have exited; the block must still be there
+        np.testing.assert_array_equal(attach_price_panel(shared.manifest)["Close"], panel["Close"])
+
+
+def test_unrelated_process_does_not_unlink_the_block(panel):
+    # a process that is not a pool worker has a resource tracker of its own
+    code = (
+        "import sys, numpy as np\n"
+        "from dataflows.shared_panel import attach_price_panel\n"
+        "panel = attach_price_panel(eval(sys.argv[1]))\n"
+        "print(float(np.nansum(panel['Close'])))\n"
+    )
+    with publish_price_panel(panel) as shared:
+        output = subprocess.run(
+            [sys.executable, "-c", code, repr(shared.manifest)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+        )
+        assert float(output.stdout) == pytest.approx(float(np.nansum(panel["Close"])))
+        np.testing.assert_array_equal(attach_price_panel(shared.manifest)["Close"], panel["Close"])
+
+
+def test_unlinked_block_cannot_be_attached(panel):
+    shared = publish_price_panel(panel)
+    shared.unlink()
+    with pytest.raises(FileNotFoundError):
+        attach_price_panel(shared.manifest)
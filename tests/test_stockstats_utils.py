@@ -0,0 +1,147 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from stockstats import wrap
+
+from default_config import DEFAULT_CONFIG
+
+from dataflows.interface import get_stock_stats_cross_section, get_stock_stats_indicators_batch
+from dataflows.stockstats_utils import StockstatsUtils
+from tools import toolkit
+
+NOT_TRADING = "N/A: Not a trading day (weekend or holiday)"
+
+
+def _baseline_stock_stats(path, indicator, curr_date):
+    # The lookup get_stock_stats made before the frames were date-indexed
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        df = wrap(pd.read_csv(path))
+        df[indicator]
+    matching_rows = df[df["Date"].str.startswith(curr_date)]
+    if not matching_rows.empty:
+        return matching_rows[indicator].values[0]
+    return NOT_TRADING
+
+
+@pytest.fixture
+def aapl(offline_data, configure, price_frame):
+    configure(indicator_engine="stockstats")
+    return offline_data("AAPL", price_frame(400, start="2023-01-02"))
+
+
+def test_frame_is_indexed_by_its_dates(aapl, offline_data):
+    frame = StockstatsUtils.load_stock_frame("AAPL", offline_data.data_dir)
+
+    assert isinstance(frame.index, pd.DatetimeIndex)
+    assert frame.index.is_monotonic_increasing
+    assert list(frame.index.strftime("%Y-%m-%d")) == list(frame["Date"])
+
+
+@pytest.mark.parametrize("indicator", ["close_50_sma", "rsi", "macdh", "boll_ub", "atr"])
+@pytest.mark.parametrize(
+    "curr_date",
+    [
+        "2023-01-02",  # first row
+        "2023-06-14",
+        "2023-06-17",  # Saturday
+        "2024-07-12",  # last row
+        "2022-12-30",  # before the data
+        "2024-08-01",  # after the data
+    ],
+)
+def test_point_lookup_matches_baseline(aapl, offline_data, indicator, curr_date):
+    expected = _baseline_stock_stats(aapl, indicator, curr_date)
+    actual = StockstatsUtils.get_stock_stats("AAPL", indicator, curr_date, offline_data.data_dir)
+
+    # assert_equal treats NaN (the first rows of boll_ub) as equal to NaN
+    np.testing.assert_equal(actual, expected)
+
+
+@pytest.mark.parametrize("indicator", ["close_10_ema", "mfi"])
+def test_window_matches_baseline_lookups(aapl, offline_data, indicator):
+    window = StockstatsUtils.get_stock_stats_window(
+        "AAPL", indicator, "2023-12-20", "2024-01-10", offline_data.data_dir
+    )
+
+    days = pd.date_range("2023-12-20", "2024-01-10").strftime("%Y-%m-%d")
+    expected = {day: _baseline_stock_stats(aapl, indicator, day) for day in days}
+    expected = {day: value for day, value in expected.items() if value != NOT_TRADING}
+    assert list(window) == list(expected)
+    np.testing.assert_array_equal(list(window.values()), list(expected.values()))
+
+
+def test_batch_reports_every_trading_day(aapl):
+    report = get_stock_stats_indicators_batch("AAPL", ["rsi", "close_50_sma", "rsi"], "2024-01-10", 10, False)
+
+    assert report.startswith("## rsi, close_50_sma values from 2023-12-31 to 2024-01-10 (trading days only):")
+    rows = [line.split()[0] for line in report.splitlines() if line[:4] in ("2023", "2024")]
+    assert rows == list(pd.bdate_range("2024-01-01", "2024-01-10").strftime("%Y-%m-%d")[::-1])
+
+
+@pytest.mark.parametrize(
+    "indicators, curr_date, look_back_days, message",
+    [
+        (["rsi"], "2023-06-18", 1, "N/A: No trading days in this window"),
+        (["rsi"], "2025-01-10", 10, "N/A: No trading days in this window"),
+        (["rsi", "not_an_indicator"], "2024-01-10", 10, "Indicators ['not_an_indicator'] are not supported"),
+        ([], "2024-01-10", 10, "are not supported"),
+    ],
+)
+def test_batch_reports_problems_as_text(aapl, indicators, curr_date, look_back_days, message):
+    report = get_stock_stats_indicators_batch("AAPL", indicators, curr_date, look_back_days, False)
+    assert message in report
+
+
+def test_batch_reports_missing_price_data(aapl):
+    report = get_stock_stats_indicators_batch("MSFT", ["rsi"], "2024-01-10", 10, False)
+    assert report.startswith("## rsi values from 2023-12-31 to 2024-01-10: N/A: Error getting the price data for MSFT")
+
+
+@pytest.mark.parametrize("indicator", ["close_50_sma", "macdh", "rsi"])
+def test_default_engine_reports_stockstats_values(offline_data, configure, price_frame, indicator):
+    configure(indicator_engine=DEFAULT_CONFIG["indicator_engine"])
+    path = offline_data("AAPL", price_frame(300, start="2023-01-02"))
+    frame = StockstatsUtils.load_stock_frame("AAPL", offline_data.data_dir)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = wrap(pd.read_csv(path))[indicator].values
+    # the reports print these values, so they must match exactly, not approximately
+    assert [str(v) for v in StockstatsUtils.compute_indicator(frame, indicator)] == [str(v) for v in expected]
+
+
+@pytest.fixture
+def universe(aapl, offline_data, price_frame):
+    offline_data("MSFT", price_frame(400, seed=1, start="2023-01-02"))
+    # listed later, so it has fewer rows of history on the same dates
+    offline_data("NVDA", price_frame(200, seed=2, start="2023-08-07"))
+
+
+def test_cross_section_matches_single_symbol_reports(universe):
+    report = toolkit.get_stockstats_cross_section_report(["AAPL", "MSFT", "NVDA"], ["rsi", "close_50_sma"], "2024-01-10")
+
+    assert report.startswith("## rsi, close_50_sma values on 2024-01-10 for 3 symbols:")
+    rows = {line.split()[0]: line.split()[1:] for line in report.splitlines() if line[:4] in ("AAPL", "MSFT", "NVDA")}
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        for indicator, value in zip(["rsi", "close_50_sma"], rows[symbol]):
+            single = get_stock_stats_indicators_batch(symbol, [indicator], "2024-01-10", 0, False)
+            expected = float(single.splitlines()[-3].split()[1])
+            assert float(value) == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.parametrize(
+    "symbols, indicators, curr_date, message",
+    [
+        (["AAPL", "MSFT"], ["rsi"], "2024-01-13", "## rsi values on 2024-01-13: N/A: Not a trading day"),
+        (["AAPL", "MSFT"], ["rsi", "not_an_indicator"], "2024-01-10", "Indicators ['not_an_indicator'] are not supported"),
+        (["AAPL", "MSFT"], [], "2024-01-10", "are not supported"),
+        ([], ["rsi"], "2024-01-10", "N/A: No symbols to compare"),
+        (["AAPL", "TSLA"], ["rsi"], "2024-01-10", "## rsi values on 2024-01-10: N/A: Error getting the price data"),
+    ],
+)
+def test_cross_section_reports_problems_as_text(universe, symbols, indicators, curr_date, message):
+    report = get_stock_stats_cross_section(symbols, indicators, curr_date)
+    assert message in report
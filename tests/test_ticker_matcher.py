@@ -0,0 +1,82 @@
+import json
+import random
+
+import pytest
+
+from dataflows.reddit_utils import ticker_to_company
+from dataflows.ticker_matcher import TickerMatcher, build_ticker_index
+
+# Terms overlapping one another in every way: prefixes, suffix/prefix overlaps,
+# containment, shared tickers, regex syntax and single letters
+OVERLAPPING = {
+    "AB": "abc OR bcd",
+    "CD": "cde",
+    "BC": "b",
+    "DE": "abcdef OR de.f",
+    "EF": "ef OR fab",
+    "FG": "(fa|ga)b",
+    "AA": "aa",
+}
+
+
+def _expected(matcher, texts):
+    return [
+        ticker
+        for ticker in matcher.companies
+        if any(matcher.pattern(ticker).search(text) for text in texts)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_synthetic_terms_match_per_ticker_search(seed):
+    rng = random.Random(seed)
+    matcher = TickerMatcher(OVERLAPPING)
+    alphabet = "abcdefgABCDEFG .x"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(12)))
+        assert matcher.tickers_in(text) == _expected(matcher, [text]), text
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_company_terms_match_per_ticker_search(seed):
+    rng = random.Random(seed)
+    matcher = TickerMatcher(ticker_to_company)
+    fragments = [
+        term
+        for names in ticker_to_company.values()
+        for term in names.split(" OR ")
+    ] + list(ticker_to_company) + [
+        "snap inc", "SnapXInc.", "Direxion Daily Semiconductor Bear 3X Shares SOXS",
+        " ", " ", "the ", "stock ", "’", "\U0001f680", "İ", "K", "ſ", "café",
+    ]
+    for _ in range(1000):
+        title = "".join(rng.choice(fragments)[: rng.randrange(1, 12)] for _ in range(rng.randrange(6)))
+        content = "".join(rng.choice(fragments) for _ in range(rng.randrange(4)))
+        texts = [title, content]
+        assert matcher.tickers_in(*texts) == _expected(matcher, texts), texts
+
+
+def test_case_fold_hazards_fall_back_to_regex():
+    matcher = TickerMatcher({"KO": "Coca-Cola", "SQ": "Square"})
+    # the Kelvin sign and the long s match k and s under re.IGNORECASE
+    assert matcher.tickers_in("Ko news") == ["KO"]
+    assert matcher.tickers_in("ſquare deal") == ["SQ"]
+
+
+def test_index_lists_posts_per_ticker(tmp_path):
+    posts = [
+        {"created_utc": 1709251200, "title": "Apple and Nvidia", "selftext": "", "url": "a", "ups": 1},
+        {"created_utc": 1709337600, "title": "quiet day", "selftext": "Meta dips", "url": "b", "ups": 2},
+    ]
+    lines = [json.dumps(post) + "\n" for post in posts]
+    path = tmp_path / "sub.jsonl"
+    path.write_text(lines[0] + "\n" + lines[1])
+
+    index = build_ticker_index([str(path)], TickerMatcher({"AAPL": "Apple", "NVDA": "Nvidia", "META": "Meta"}))
+
+    offset = len(lines[0]) + 1
+    assert index == {
+        "AAPL": [(str(path), 0, "2024-03-01")],
+        "NVDA": [(str(path), 0, "2024-03-01")],
+        "META": [(str(path), offset, "2024-03-02")],
+    }
@@ -0,0 +1,241 @@
+import asyncio
+import importlib
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from default_config import DEFAULT_CONFIG
+
+
+class FakeAgent:
+    """An agent whose call blocks for ``delay`` seconds, like a Strands tool running in a thread."""
+
+    def __init__(self, name, delay=0.0, reply=None):
+        self.name = name
+        self.delay = delay
+        self.reply = reply
+        self.calls = []
+        self.finished = threading.Event()
+
+    def __call__(self, prompt):
+        self.calls.append(prompt)
+        time.sleep(self.delay)
+        self.finished.set()
+        return self.reply or f"{self.name}: {prompt}"
+
+    async def invoke_async(self, prompt):
+        return await asyncio.to_thread(self, prompt)
+
+
+class FailingAgent(FakeAgent):
+    def __call__(self, prompt):
+        self.calls.append(prompt)
+        raise ConnectionError("model unavailable")
+
+
+class FakeSwarm:
+    """ConversationSwarm stand-in: the summarizer's verdict, plus one line per researcher."""
+
+    def __init__(self, agents, summarizer_agent, coordination="hybrid"):
+        self.agents = agents
+        self.summarizer_agent = summarizer_agent
+
+    def run(self, task):
+        bull, bear = (agent(task) for agent in self.agents)
+        return self.summarizer_agent(task), bull, bear
+
+    async def arun(self, task):
+        return await asyncio.to_thread(self.run, task)
+
+
+@pytest.fixture
+def trading_graph(monkeypatch):
+    """graph.trading_graph imported with fake agent factories (the real agents need an LLM and a vector store)."""
+    agents = types.ModuleType("agents")
+    agents.create_market_analyst = lambda llm, online: FakeAgent("market")
+    agents.create_news_analyst = lambda llm, online: FakeAgent("news")
+    agents.create_research_manager = lambda llm, name, config: FakeAgent("manager", reply="BUY plan")
+    agents.create_bear_researcher = lambda llm, name, config: FakeAgent("bear")
+    agents.create_bull_researcher = lambda llm, name, config: FakeAgent("bull")
+    agents.create_trader = lambda llm, name, config: FakeAgent("trader", reply="FINAL: BUY")
+    agents.ConversationSwarm = FakeSwarm
+    memory = types.ModuleType("tools.memory")
+    memory.FinancialSituationMemory = object
+    monkeypatch.setitem(sys.modules, "agents", agents)
+    monkeypatch.setitem(sys.modules, "tools.memory", memory)
+    monkeypatch.delitem(sys.modules, "graph.trading_graph", raising=False)
+    yield importlib.import_module("graph.trading_graph")
+    sys.modules.pop("graph.trading_graph", None)
+
+
+@pytest.fixture
+def make_graph(trading_graph, tmp_path):
+    def make(**config):
+        return trading_graph.TradingAgentsGraph(
+            llm=None, config=dict(DEFAULT_CONFIG, results_dir=str(tmp_path / "results"), **config)
+        )
+
+    return make
+
+
+def test_analysts_run_concurrently(make_graph):
+    graph = make_graph()
+    graph.market_analyst.delay = graph.news_analyst.delay = 0.3
+
+    started = time.monotonic()
+    results = graph.gather_information_step("AAPL", "2024-01-02")
+
+    assert time.monotonic() - started < 0.55
+    assert results["market_report.txt"] == "market: Analyze the market for AAPL for the trade date 2024-01-02"
+    assert results["news_report.txt"] == "news: Analyze the news for AAPL for the trade date 2024-01-02"
+    assert graph.read_file("AAPL_2024-01-02", "news_report.txt") == results["news_report.txt"]
+
+
+def test_timeout_bounds_the_step(make_graph):
+    graph = make_graph(analyst_timeout=0.3)
+    graph.news_analyst.delay = 3
+
+    started = time.monotonic()
+    results = graph.gather_information_step("AAPL", "2024-01-02")
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1
+    assert results["news_report.txt"] == "Error: timed out after 0.3s"
+    assert results["market_report.txt"].startswith("market: ")
+
+
+def test_timeout_bounds_the_async_step(make_graph):
+    graph = make_graph(analyst_timeout=0.3)
+    graph.market_analyst.delay = 3
+
+    async def gather():
+        started = time.monotonic()
+        results = await graph.agather_information_step("AAPL", "2024-01-02")
+        return results, time.monotonic() - started
+
+    results, elapsed = asyncio.run(gather())
+
+    assert elapsed < 1
+    assert results["market_report.txt"] == "Error: timed out after 0.3s"
+
+
+def test_timed_out_analyst_is_not_reused_until_it_finishes(make_graph):
+    graph = make_graph(analyst_timeout=0.2)
+    graph.news_analyst.delay = 1
+
+    graph.gather_information_step("AAPL", "2024-01-02")
+    graph.news_analyst.delay = 0
+    results = graph.gather_information_step("AAPL", "2024-01-03")
+
+    assert results["news_report.txt"] == "Error: news is still running a previous analysis"
+    assert len(graph.news_analyst.calls) == 1
+    # the late result of the abandoned call is never written
+    assert graph.news_analyst.finished.wait(2)
+    time.sleep(0.05)
+    with pytest.raises(ValueError):
+        graph.read_file("AAPL_2024-01-02", "news_report.txt")
+
+    results = graph.gather_information_step("AAPL", "2024-01-04")
+    assert results["news_report.txt"].startswith("news: ")
+
+
+def test_analyst_errors_are_recorded(make_graph):
+    graph = make_graph()
+    graph.market_analyst = FailingAgent("market")
+
+    results = graph.gather_information_step("AAPL", "2024-01-02")
+
+    assert results["market_report.txt"] == "Error: model unavailable"
+    assert results["news_report.txt"].startswith("news: ")
+    # a failed call releases the analyst
+    assert graph.gather_information_step("AAPL", "2024-01-03")["market_report.txt"] == "Error: model unavailable"
+
+
+def _report_files(results_dir):
+    return {
+        path.relative_to(results_dir).as_posix(): path.read_text(encoding="utf-8")
+        for path in sorted(results_dir.rglob("*.txt"))
+    }
+
+
+def test_apropagate_matches_propagate(make_graph, tmp_path):
+    final_state, decision = make_graph().propagate("AAPL", "2024-01-02")
+    expected_files = _report_files(tmp_path / "results")
+    for path in (tmp_path / "results").rglob("*.txt"):
+        path.unlink()
+
+    async_state, async_decision = asyncio.run(make_graph().apropagate("AAPL", "2024-01-02"))
+
+    assert async_decision == decision == "FINAL: BUY"
+    for state in (final_state, async_state):
+        state["analysis_results"].pop("timings")
+    assert async_state == final_state
+    assert _report_files(tmp_path / "results") == expected_files
+    assert async_state["debate_messages"]["bull"][0].startswith("bull: Debate and decide on an investment plan for AAPL")
+
+
+def test_concurrent_apropagate_runs(make_graph):
+    graphs = [make_graph() for _ in range(4)]
+    for graph in graphs:
+        graph.market_analyst.delay = graph.news_analyst.delay = graph.trader.delay = 0.25
+
+    async def run_all():
+        return await asyncio.gather(
+            *(graph.apropagate(ticker, "2024-01-02") for graph, ticker in zip(graphs, ["AAPL", "MSFT", "NVDA", "TSLA"]))
+        )
+
+    started = time.monotonic()
+    runs = asyncio.run(run_all())
+
+    # one run takes about 0.5s, four in sequence 2s
+    assert time.monotonic() - started < 1.4
+    assert [state["company"] for state, _ in runs] == ["AAPL", "MSFT", "NVDA", "TSLA"]
+    assert graphs[3].trader.calls[0].startswith("Based on the following investment plan for TSLA")
+
+
+def test_async_steps_leave_the_event_loop_free(make_graph):
+    graph = make_graph()
+    graph.trader.delay = 0.3
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        decision = await graph.atrading_decision_step("AAPL", "2024-01-02")
+        ticker.cancel()
+        return decision, ticks
+
+    decision, ticks = asyncio.run(run())
+
+    assert decision == "FINAL: BUY"
+    assert ticks >= 10
+    # no research step ran, so the trader was told there is no plan
+    assert graph.trader.calls == [
+        "Based on the following investment plan for AAPL for the trade date 2024-01-02, "
+        "what is your final trade decision?\n\nNo investment plan available from research team"
+    ]
+    assert graph.read_file("AAPL_2024-01-02", "trader_decision.txt") == "FINAL: BUY"
+
+
+def test_async_debate_feeds_the_trader(make_graph):
+    graph = make_graph()
+
+    async def run():
+        plan, messages = await graph.aresearch_debate_step("AAPL", "2024-01-02", {"market_report.txt": "Uptrend"})
+        return plan, messages, await graph.atrading_decision_step("AAPL", "2024-01-02")
+
+    plan, messages, decision = asyncio.run(run())
+
+    assert plan == "BUY plan"
+    assert "Market Report:\nUptrend\n\nNews Report:\nNo news analysis available" in messages["bull"][0]
+    assert graph.read_file("AAPL_2024-01-02", "investment_plan.txt") == "BUY plan"
+    assert graph.trader.calls[0].endswith("\n\nBUY plan")
@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+
+from dataflows import yfin_utils
+from dataflows.yfin_utils import YFinanceUtils, clear_ticker_cache, fetch_fundamentals_bulk, get_ticker
+
+
+class FakeYFTicker:
+    """yf.Ticker stand-in counting the requests each property makes."""
+
+    requests = []
+    delay = 0.0
+    failing = set()
+
+    def __init__(self, symbol):
+        self.ticker = symbol
+
+    def _request(self, name):
+        FakeYFTicker.requests.append((self.ticker, name))
+        time.sleep(FakeYFTicker.delay)
+        if (self.ticker, name) in FakeYFTicker.failing:
+            raise ConnectionError("429 Too Many Requests")
+        return {"symbol": self.ticker, "payload": name, "request": len(FakeYFTicker.requests)}
+
+    @property
+    def info(self):
+        return self._request("info")
+
+    @property
+    def financials(self):
+        return self._request("financials")
+
+    @property
+    def dividends(self):
+        return self._request("dividends")
+
+    @property
+    def recommendations(self):
+        return self._request("recommendations")
+
+    def history(self, start=None, end=None):
+        return self._request("history")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def yf_requests(monkeypatch, configure):
+    configure(yfinance_cache_ttl=60)
+    FakeYFTicker.requests = []
+    FakeYFTicker.delay = 0.0
+    FakeYFTicker.failing = set()
+    monkeypatch.setattr(yfin_utils.yf, "Ticker", FakeYFTicker)
+    clear_ticker_cache()
+    yield FakeYFTicker.requests
+    clear_ticker_cache()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(yfin_utils.time, "monotonic", clock)
+    return clock
+
+
+def test_payloads_are_fetched_once_per_ttl(yf_requests, clock):
+    first = get_ticker("aapl").info
+    clock.now += 59
+    assert get_ticker("AAPL").info is first
+    assert yf_requests == [("AAPL", "info")]
+
+    clock.now += 2
+    assert get_ticker("AAPL").info["request"] == 2
+    assert yf_requests == [("AAPL", "info"), ("AAPL", "info")]
+
+
+def test_uncached_calls_pass_through(yf_requests):
+    ticker = get_ticker("AAPL")
+    ticker.history(start="2024-01-02")
+    ticker.history(start="2024-01-02")
+
+    assert yf_requests == [("AAPL", "history"), ("AAPL", "history")]
+    assert ticker.ticker == "AAPL"
+
+
+def test_concurrent_callers_share_one_request(yf_requests):
+    FakeYFTicker.delay = 0.1
+    barrier = threading.Barrier(8)
+    results = []
+
+    def fetch():
+        barrier.wait()
+        results.append(get_ticker("AAPL").financials)
+
+    threads = [threading.Thread(target=fetch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert yf_requests == [("AAPL", "financials")]
+    assert all(result is results[0] for result in results)
+
+
+def test_failed_requests_are_not_cached(yf_requests):
+    FakeYFTicker.failing = {("AAPL", "info")}
+    with pytest.raises(ConnectionError):
+        get_ticker("AAPL").info
+
+    FakeYFTicker.failing = set()
+    assert get_ticker("AAPL").info["payload"] == "info"
+    assert len(yf_requests) == 2
+
+
+def test_utils_methods_share_the_cache(yf_requests):
+    YFinanceUtils.get_stock_info("AAPL")
+    YFinanceUtils.get_company_info("aapl")
+    YFinanceUtils.get_income_stmt("AAPL")
+
+    assert yf_requests == [("AAPL", "info"), ("AAPL", "financials")]
+
+
+def test_bulk_fetch(yf_requests, capsys):
+    FakeYFTicker.failing = {("MSFT", "dividends")}
+
+    results = fetch_fundamentals_bulk(["AAPL", "MSFT"], ["info", "dividends"], max_workers=4)
+
+    assert results["AAPL"]["dividends"]["payload"] == "dividends"
+    assert results["MSFT"]["info"]["symbol"] == "MSFT"
+    assert results["MSFT"]["dividends"] is None
+    assert "Failed to fetch dividends for MSFT: 429 Too Many Requests" in capsys.readouterr().out
+    assert sorted(yf_requests) == [("AAPL", "dividends"), ("AAPL", "info"), ("MSFT", "dividends"), ("MSFT", "info")]
+
+    # the bulk fetch fills the cache the single-symbol calls read
+    assert get_ticker("AAPL").info is results["AAPL"]["info"]
+    assert len(yf_requests) == 4
+
+
+def test_bulk_fetch_rejects_unknown_payloads(yf_requests):
+    with pytest.raises(ValueError):
+        fetch_fundamentals_bulk(["AAPL"], ["info", "history"])
+    assert yf_requests == []
@@ -16,6 +16,11 @@ from .toolkit import (
     get_yfin_data_online,
     get_stockstats_indicators_report,
     get_stockstats_indicators_report_online,
+    get_stockstats_indicators_batch_report,
+    get_stockstats_indicators_batch_report_online,
+    get_stockstats_cross_section_report,
+    get_fundamentals_snapshot,
+    get_fundamentals_snapshot_online,
     get_google_news,
 )
 
@@ -25,7 +30,14 @@ __all__ = [
     "get_yfin_data_online",
     "get_stockstats_indicators_report",
     "get_stockstats_indicators_report_online",
+    "get_stockstats_indicators_batch_report",
+    "get_stockstats_indicators_batch_report_online",
+    "get_stockstats_cross_section_report",
     
+    # Financial data tools
+    "get_fundamentals_snapshot",
+    "get_fundamentals_snapshot_online",
+
     # News and sentiment tools
     "get_google_news",
 ]
\ No newline at end of file
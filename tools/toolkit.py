@@ -1,12 +1,15 @@
 
 from strands import tool
-from typing import Annotated
+from typing import Annotated, List
 
 from dataflows.interface import (
     get_google_news as get_google_news_orig,
     get_stock_stats_indicators_window as get_stock_stats_indicators_window_orig,
+    get_stock_stats_indicators_batch as get_stock_stats_indicators_batch_orig,
+    get_stock_stats_cross_section as get_stock_stats_cross_section_orig,
     get_YFin_data as get_YFin_data_orig,
     get_YFin_data_online as get_YFin_data_online_orig,
+    get_fundamentals_snapshot as get_fundamentals_snapshot_orig,
 )
 from default_config import DEFAULT_CONFIG
 
@@ -101,6 +104,119 @@ def get_stockstats_indicators_report_online(
     )
 
 
+@tool
+def get_stockstats_indicators_batch_report(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"] = 30,
+) -> str:
+    """
+    Retrieve several stock stats indicators for a given ticker symbol in one call.
+    Args:
+        symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+        indicators (list[str]): Technical indicators to get the analysis and report of, e.g. ["close_50_sma", "rsi", "macd"]
+        curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+        look_back_days (int): How many days to look back, default is 30
+    Returns:
+        str: A single table with one row per trading day and one column per indicator, followed by a description of each indicator.
+    """
+
+    return get_stock_stats_indicators_batch_orig(
+        symbol, indicators, curr_date, look_back_days, False
+    )
+
+@tool
+def get_stockstats_indicators_batch_report_online(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"] = 30,
+) -> str:
+    """
+    Retrieve several stock stats indicators for a given ticker symbol in one call.
+    Args:
+        symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+        indicators (list[str]): Technical indicators to get the analysis and report of, e.g. ["close_50_sma", "rsi", "macd"]
+        curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+        look_back_days (int): How many days to look back, default is 30
+    Returns:
+        str: A single table with one row per trading day and one column per indicator, followed by a description of each indicator.
+    """
+
+    return get_stock_stats_indicators_batch_orig(
+        symbol, indicators, curr_date, look_back_days, True
+    )
+
+
+@tool
+def get_stockstats_cross_section_report(
+    symbols: Annotated[List[str], "ticker symbols of the companies to compare"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+) -> str:
+    """
+    Retrieve several stock stats indicators for a group of ticker symbols on one trading day.
+    Args:
+        symbols (list[str]): Ticker symbols of the companies to compare, e.g. ["AAPL", "MSFT", "NVDA"]
+        indicators (list[str]): Technical indicators to get the analysis and report of, e.g. ["close_50_sma", "rsi", "macd"]
+        curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+    Returns:
+        str: A single table with one row per symbol and one column per indicator, followed by a description of each indicator.
+    """
+
+    return get_stock_stats_cross_section_orig(symbols, indicators, curr_date)
+
+
+@tool
+def get_fundamentals_snapshot(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"] = "quarterly",
+) -> str:
+    """
+    Retrieve the latest income statement, balance sheet and cash flow statement of a company in one call.
+    Args:
+        symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+        curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+        freq (str): Reporting frequency, annual or quarterly, default is quarterly
+    Returns:
+        str: A combined report with the non-empty line items of each statement published on or before curr_date.
+    """
+
+    return get_fundamentals_snapshot_orig(symbol, curr_date, freq, False)
+
+@tool
+def get_fundamentals_snapshot_online(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"] = "quarterly",
+) -> str:
+    """
+    Retrieve the latest income statement, balance sheet and cash flow statement of a company from Yahoo Finance in one call.
+    Args:
+        symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+        curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+        freq (str): Reporting frequency, annual or quarterly, default is quarterly
+    Returns:
+        str: A combined report with the non-empty line items of each statement for the latest period ended on or before curr_date.
+    """
+
+    return get_fundamentals_snapshot_orig(symbol, curr_date, freq, True)
+
+
 @tool
 def get_google_news(
     query: Annotated[str, "Query to search with"],